@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Type
+
+from business.screens.login_screen import LoginScreen
+from business.screens.menu_screen import MenuScreen
+from business.screens.products_screen import ProductsScreen
+from config.drivers.mobile_driver import MobileDriver
+from config.utils.logger import Logger
+
+__all__ = [
+    "ABC",
+    "abstractmethod",
+    "Dict",
+    "Iterable",
+    "Type",
+    "LoginScreen",
+    "MenuScreen",
+    "ProductsScreen",
+    "MobileDriver",
+    "Logger",
+]
@@ -0,0 +1,169 @@
+from business.reset import (
+    ABC,
+    Dict,
+    Iterable,
+    Logger,
+    LoginScreen,
+    MenuScreen,
+    MobileDriver,
+    ProductsScreen,
+    Type,
+    abstractmethod,
+)
+
+logger = Logger.get_logger(__name__)
+
+
+class ResetStrategy(ABC):
+    """Brings the app to the state a scenario starts from."""
+
+    name: str = ""
+    # Strategies that keep the current state cannot know the starting screen
+    verifies_login_screen: bool = True
+
+    @abstractmethod
+    def reset(self, driver: MobileDriver) -> None:
+        pass
+
+    def apply(self, driver: MobileDriver):
+        try:
+            self.reset(driver)
+        except Exception as e:
+            if not self.verifies_login_screen:
+                raise
+            # e.g. a popup covering the menu: the restart below recovers
+            logger.warning("Reset '%s' failed, restarting: %s", self.name, e)
+        else:
+            if not self.verifies_login_screen or _is_on_login_screen(driver):
+                return
+            logger.info(
+                "Reset '%s' did not reach the login screen, restarting", self.name
+            )
+        RestartResetStrategy().reset(driver)
+        if not _is_on_login_screen(driver):
+            raise RuntimeError(f"Login screen not reached after '{self.name}' reset")
+
+
+def _is_on_login_screen(driver: MobileDriver) -> bool:
+    return driver.are_elements_visible([LoginScreen.USERNAME_INPUT])
+
+
+class NoResetStrategy(ResetStrategy):
+    name = "none"
+    verifies_login_screen = False
+
+    def reset(self, driver: MobileDriver):
+        pass
+
+
+class ActivateResetStrategy(ResetStrategy):
+    name = "activate"
+    verifies_login_screen = False
+
+    def reset(self, driver: MobileDriver):
+        driver.activate_app()
+
+
+class LogoutResetStrategy(ResetStrategy):
+    name = "logout"
+
+    def reset(self, driver: MobileDriver):
+        # One page-source probe; already on the login screen costs nothing more
+        snapshot = driver.snapshot()
+        if snapshot.is_visible(LoginScreen.USERNAME_INPUT):
+            return
+        MenuScreen(driver).logout(
+            reset_app_state=snapshot.is_visible(ProductsScreen.CART_BADGE_COUNT)
+        )
+
+
+class RestartResetStrategy(ResetStrategy):
+    name = "restart"
+
+    def reset(self, driver: MobileDriver):
+        driver.reset()
+
+
+class ClearDataResetStrategy(ResetStrategy):
+    name = "clear"
+
+    def reset(self, driver: MobileDriver):
+        driver.clear_app_data()
+
+
+class ReinstallResetStrategy(ResetStrategy):
+    name = "reinstall"
+
+    def reset(self, driver: MobileDriver):
+        driver.reinstall_app()
+
+
+class SessionRestoreStrategy(ResetStrategy):
+    """Keep the logged-in session and only drop what scenarios accumulate.
+
+    Returns to the products catalog and empties the cart through the side
+    menu, then verifies that state instead of replaying the login steps.
+    """
+
+    name = "session"
+    verifies_login_screen = False
+
+    @staticmethod
+    def is_logged_in(driver: MobileDriver) -> bool:
+        return driver.snapshot().is_visible(MenuScreen.MENU_BUTTON)
+
+    def reset(self, driver: MobileDriver):
+        menu_screen = MenuScreen(driver)
+        products_screen = ProductsScreen(driver)
+        menu_screen.go_to_all_items()
+        if not products_screen.is_cart_badge_empty():
+            menu_screen.reset_app_state()
+
+    def apply(self, driver: MobileDriver):
+        self.reset(driver)
+        products_screen = ProductsScreen(driver)
+        if not (
+            driver.are_elements_visible([ProductsScreen.SCREEN_TITLE])
+            and products_screen.is_cart_badge_empty()
+        ):
+            raise RuntimeError("Logged-in session could not be restored")
+
+
+class ResetStrategyFactory:
+    TAG_PREFIX = "reset:"
+    DEFAULT = LogoutResetStrategy
+
+    _strategies: Dict[str, Type[ResetStrategy]] = {
+        strategy.name: strategy
+        for strategy in (
+            NoResetStrategy,
+            ActivateResetStrategy,
+            LogoutResetStrategy,
+            RestartResetStrategy,
+            ClearDataResetStrategy,
+            ReinstallResetStrategy,
+        )
+    }
+
+    @staticmethod
+    def has_reset_tag(*tag_groups: Iterable[str]) -> bool:
+        return any(
+            tag.startswith(ResetStrategyFactory.TAG_PREFIX)
+            for tags in tag_groups
+            for tag in tags
+        )
+
+    @staticmethod
+    def from_tags(*tag_groups: Iterable[str]) -> ResetStrategy:
+        """Pick the strategy from the first group with a `@reset:<name>` tag.
+
+        Pass scenario tags before feature tags so scenarios override features.
+        """
+        for tags in tag_groups:
+            for tag in tags:
+                if tag.startswith(ResetStrategyFactory.TAG_PREFIX):
+                    name = tag[len(ResetStrategyFactory.TAG_PREFIX) :]
+                    if name not in ResetStrategyFactory._strategies:
+                        raise ValueError(f"Unsupported reset strategy tag: @{tag}")
+                    return ResetStrategyFactory._strategies[name]()
+        return ResetStrategyFactory.DEFAULT()
@@ -1,9 +1,39 @@
-from typing import List
+import time
+from collections import deque
+from typing import Dict, List, Optional
 
 from appium.webdriver.common.appiumby import AppiumBy
 from appium.webdriver.webelement import WebElement
 
+from config.drivers.adaptive_wait import AdaptiveWait
 from config.drivers.mobile_driver import MobileDriver
-from config.dto import Direction
+from config.drivers.page_snapshot import PageSnapshot
+from config.dto import (
+    BatchAction,
+    BatchActionDto,
+    Direction,
+    ProductCardDto,
+    Screen,
+    ScreenTransitionDto,
+)
+from config.utils.logger import Logger
 
-__all__ = ["AppiumBy", "MobileDriver", "Direction", "List", "WebElement"]
+__all__ = [
+    "AppiumBy",
+    "AdaptiveWait",
+    "MobileDriver",
+    "PageSnapshot",
+    "BatchAction",
+    "BatchActionDto",
+    "Direction",
+    "ProductCardDto",
+    "Screen",
+    "ScreenTransitionDto",
+    "Logger",
+    "deque",
+    "time",
+    "Dict",
+    "List",
+    "Optional",
+    "WebElement",
+]
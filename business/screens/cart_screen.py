@@ -8,6 +8,10 @@ class CartScreen:
         AppiumBy.ANDROID_UIAUTOMATOR,
         'new UiScrollable(new UiSelector().scrollable(true)).scrollIntoView(new UiSelector().text("CHECKOUT"))',
     )
+    CONTINUE_SHOPPING_BUTTON = (
+        AppiumBy.ANDROID_UIAUTOMATOR,
+        'new UiScrollable(new UiSelector().scrollable(true)).scrollIntoView(new UiSelector().description("test-CONTINUE SHOPPING"))',
+    )
     CART_ITEMS = (AppiumBy.ACCESSIBILITY_ID, "test-Cart Content")
 
     def __init__(self, driver: MobileDriver):
@@ -1,4 +1,10 @@
-from business.screens import AppiumBy, Direction, List, MobileDriver, WebElement
+from business.screens import (
+    AppiumBy,
+    BatchAction,
+    BatchActionDto,
+    Direction,
+    MobileDriver,
+)
 
 
 class CheckoutOverviewScreen:
@@ -11,6 +17,10 @@ class CheckoutOverviewScreen:
         AppiumBy.ANDROID_UIAUTOMATOR,
         'new UiScrollable(new UiSelector().scrollable(true)).scrollIntoView(new UiSelector().description("test-FINISH"))',
     )
+    CANCEL_BUTTON = (
+        AppiumBy.ANDROID_UIAUTOMATOR,
+        'new UiScrollable(new UiSelector().scrollable(true)).scrollIntoView(new UiSelector().description("test-CANCEL"))',
+    )
     ITEM_TOTAL = (
         AppiumBy.ANDROID_UIAUTOMATOR,
         'new UiScrollable(new UiSelector().scrollable(true)).scrollIntoView(new UiSelector().textContains("Item total:"))',
@@ -52,11 +62,7 @@ class CheckoutOverviewScreen:
         return self.driver.is_element_visible(self.ORDER_LIST)
 
     def is_order_summary_visible(self) -> bool:
-        return (
-            self.driver.is_element_visible(self.ITEM_TOTAL)
-            and self.driver.is_element_visible(self.TAX)
-            and self.driver.is_element_visible(self.TOTAL)
-        )
+        return self.driver.are_elements_visible([self.ITEM_TOTAL, self.TAX, self.TOTAL])
 
     def tap_finish(self):
         self.driver.click(self.FINISH_BUTTON)
@@ -71,9 +77,21 @@ class CheckoutOverviewScreen:
         return self.driver.get_text(self.CONFIRMATION_POPUP)
 
     def remove_all_products(self):
-        while True:
-            elements: List[WebElement] = self.driver.find_elements(self.ORDER_LIST)
-            if not elements:
-                break
-            self.driver.swipe(self.PRODUCT, Direction.LEFT)
-            self.driver.click(self.DELETE_BUTTON)
+        """Swipe and delete every item, one batch per page source of items."""
+        # Scrolls the list back into view only when it is not already on screen
+        if not self.driver.find_elements(self.ORDER_LIST):
+            return
+        remaining = len(self.driver.snapshot().find_all(self.PRODUCT))
+        while remaining:
+            # Deleting the first item moves the next one into its place
+            self.driver.run_batch(
+                [
+                    BatchActionDto(
+                        BatchAction.SWIPE, self.PRODUCT, direction=Direction.LEFT
+                    ),
+                    BatchActionDto(BatchAction.TAP, self.DELETE_BUTTON),
+                ]
+                * remaining
+            )
+            # Items below the fold scroll up into view as the list shrinks
+            remaining = len(self.driver.snapshot().find_all(self.PRODUCT))
@@ -1,4 +1,4 @@
-from business.screens import AppiumBy, MobileDriver
+from business.screens import AppiumBy, BatchAction, BatchActionDto, MobileDriver
 
 
 class CheckoutScreen:
@@ -7,6 +7,7 @@ class CheckoutScreen:
     LAST_NAME_INPUT = (AppiumBy.ACCESSIBILITY_ID, "test-Last Name")
     ZIP_CODE_INPUT = (AppiumBy.ACCESSIBILITY_ID, "test-Zip/Postal Code")
     CONTINUE_BUTTON = (AppiumBy.ACCESSIBILITY_ID, "test-CONTINUE")
+    CANCEL_BUTTON = (AppiumBy.ACCESSIBILITY_ID, "test-CANCEL")
     SCREEN_TITLE = (
         AppiumBy.XPATH,
         '//android.widget.TextView[@text="CHECKOUT: INFORMATION"]',
@@ -16,7 +17,11 @@ class CheckoutScreen:
         self.driver = driver
 
     def fill_checkout_information(self, first_name: str, last_name: str, zip_code: str):
-        self.driver.type_text(self.FIRST_NAME_INPUT, first_name)
-        self.driver.type_text(self.LAST_NAME_INPUT, last_name)
-        self.driver.type_text(self.ZIP_CODE_INPUT, zip_code)
-        self.driver.click(self.CONTINUE_BUTTON)
+        self.driver.run_batch(
+            [
+                BatchActionDto(BatchAction.TYPE, self.FIRST_NAME_INPUT, first_name),
+                BatchActionDto(BatchAction.TYPE, self.LAST_NAME_INPUT, last_name),
+                BatchActionDto(BatchAction.TYPE, self.ZIP_CODE_INPUT, zip_code),
+                BatchActionDto(BatchAction.TAP, self.CONTINUE_BUTTON),
+            ]
+        )
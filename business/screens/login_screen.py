@@ -1,4 +1,4 @@
-from business.screens import AppiumBy, MobileDriver
+from business.screens import AppiumBy, BatchAction, BatchActionDto, MobileDriver
 
 
 class LoginScreen:
@@ -17,9 +17,13 @@ class LoginScreen:
         self.driver = driver
 
     def login(self, username: str, password: str):
-        self.driver.type_text(self.USERNAME_INPUT, username)
-        self.driver.type_text(self.PASSWORD_INPUT, password)
-        self.driver.click(self.LOGIN_BUTTON)
+        self.driver.run_batch(
+            [
+                BatchActionDto(BatchAction.TYPE, self.USERNAME_INPUT, username),
+                BatchActionDto(BatchAction.TYPE, self.PASSWORD_INPUT, password),
+                BatchActionDto(BatchAction.TAP, self.LOGIN_BUTTON),
+            ]
+        )
 
     def is_login_screen_visible(self) -> bool:
         return self.driver.is_element_visible(self.USERNAME_INPUT)
@@ -0,0 +1,38 @@
+from business.screens import AppiumBy, MobileDriver
+
+
+class MenuScreen:
+
+    MENU_BUTTON = (AppiumBy.ACCESSIBILITY_ID, "test-Menu")
+    ALL_ITEMS_BUTTON = (AppiumBy.ACCESSIBILITY_ID, "test-ALL ITEMS")
+    RESET_APP_STATE_BUTTON = (AppiumBy.ACCESSIBILITY_ID, "test-RESET APP STATE")
+    LOGOUT_BUTTON = (AppiumBy.ACCESSIBILITY_ID, "test-LOGOUT")
+    CLOSE_BUTTON = (AppiumBy.ACCESSIBILITY_ID, "test-Close")
+
+    def __init__(self, driver: MobileDriver):
+        self.driver = driver
+
+    def open_menu(self):
+        self.driver.click(self.MENU_BUTTON)
+
+    def close_menu(self):
+        self.driver.click(self.CLOSE_BUTTON)
+
+    def logout(self, reset_app_state: bool = False):
+        self.open_menu()
+        if reset_app_state:
+            # Logging out keeps the cart; resetting first empties it
+            self.driver.click(self.RESET_APP_STATE_BUTTON)
+            if not self.driver.snapshot().is_visible(self.LOGOUT_BUTTON):
+                self.open_menu()
+        self.driver.click(self.LOGOUT_BUTTON)
+
+    def go_to_all_items(self):
+        self.open_menu()
+        self.driver.click(self.ALL_ITEMS_BUTTON)
+
+    def reset_app_state(self):
+        self.open_menu()
+        self.driver.click(self.RESET_APP_STATE_BUTTON)
+        if self.driver.snapshot().is_visible(self.CLOSE_BUTTON):
+            self.close_menu()
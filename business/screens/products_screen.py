@@ -1,4 +1,15 @@
-from business.screens import AppiumBy, MobileDriver
+from business.screens import (
+    AppiumBy,
+    Dict,
+    Direction,
+    Logger,
+    MobileDriver,
+    Optional,
+    PageSnapshot,
+    ProductCardDto,
+)
+
+logger = Logger.get_logger(__name__)
 
 
 class ProductsScreen:
@@ -10,9 +21,17 @@ class ProductsScreen:
         AppiumBy.XPATH,
         '//android.view.ViewGroup[@content-desc="test-Cart"]//android.widget.TextView',
     )
+    PRODUCT_CARD = (AppiumBy.ACCESSIBILITY_ID, "test-Item")
+    PRODUCT_TITLE = (AppiumBy.ACCESSIBILITY_ID, "test-Item title")
+    ADD_TO_CART_BUTTON = (AppiumBy.ACCESSIBILITY_ID, "test-ADD TO CART")
+    REMOVE_BUTTON = (AppiumBy.ACCESSIBILITY_ID, "test-REMOVE")
+
+    # Swipes through the catalog before giving up on a product name
+    MAX_CATALOG_SCROLLS = 5
 
     def __init__(self, driver: MobileDriver):
         self.driver = driver
+        self._catalog: Optional[Dict[str, ProductCardDto]] = None
 
     def get_screen_title(self) -> str:
         return self.driver.get_text(self.SCREEN_TITLE)
@@ -30,6 +49,9 @@ class ProductsScreen:
         return self.driver.get_text(self.CART_BADGE_COUNT)
 
     def is_cart_badge_empty(self) -> bool:
+        # The badge has no count at all when the cart is empty
+        if self.driver.is_element_invisible(self.CART_BADGE_COUNT):
+            return True
         try:
             count = int(self.get_cart_badge_count())
             return count == 0
@@ -38,10 +60,64 @@ class ProductsScreen:
 
     def go_to_cart(self):
         self.driver.click(self.CART_BADGE)
+        self.invalidate_catalog()
 
     def add_product_to_cart(self, product_name: str):
-        add_to_cart_button = (
-            AppiumBy.XPATH,
-            f'//android.widget.TextView[@text="{product_name}"]/../..//android.widget.TextView[@text="ADD TO CART"]',
-        )
-        self.driver.click(add_to_cart_button)
+        card = self.product_card(product_name)
+        if card.in_cart:
+            # The index may predate a reset or removal elsewhere: check once more
+            self.invalidate_catalog()
+            card = self.product_card(product_name)
+        if card.in_cart:
+            logger.error("'%s' is already in the cart", product_name)
+            raise RuntimeError(f"'{product_name}' is already in the cart")
+        self.driver.tap(*card.button)
+        card.in_cart = True
+
+    def product_card(self, product_name: str) -> ProductCardDto:
+        """Card of `product_name` from the catalog index, scrolling to it if needed."""
+        if self._catalog is None:
+            self._catalog = self._index_catalog()
+        for _ in range(self.MAX_CATALOG_SCROLLS):
+            if product_name in self._catalog:
+                break
+            seen = set(self._catalog)
+            self.driver.swipe(self.PRODUCTS_CONTAINER, Direction.UP)
+            self._catalog = self._index_catalog()
+            if set(self._catalog) <= seen:
+                break
+        if product_name not in self._catalog:
+            logger.error("Product '%s' not found in the catalog", product_name)
+            raise RuntimeError(f"Product '{product_name}' not found in the catalog")
+        return self._catalog[product_name]
+
+    def invalidate_catalog(self):
+        """Forget indexed cards, e.g. after the list scrolled, re-sorted or left."""
+        self._catalog = None
+
+    def _index_catalog(self) -> Dict[str, ProductCardDto]:
+        """Every fully laid out card on screen, from one page source."""
+        catalog: Dict[str, ProductCardDto] = {}
+        for card in self.driver.snapshot().find_all(self.PRODUCT_CARD):
+            card_snapshot = PageSnapshot.from_element(card)
+            title = card_snapshot.find(self.PRODUCT_TITLE)
+            add_button = card_snapshot.find(self.ADD_TO_CART_BUTTON)
+            button = (
+                add_button
+                if add_button is not None
+                else card_snapshot.find(self.REMOVE_BUTTON)
+            )
+            name = title.get("text") if title is not None else None
+            if not name or button is None:
+                continue
+            if button.get("displayed", "true") != "true":
+                continue
+            left, top, right, bottom = PageSnapshot.bounds(button)
+            catalog[name] = ProductCardDto(
+                name=name,
+                bounds=PageSnapshot.bounds(card),
+                button=((left + right) // 2, (top + bottom) // 2),
+                in_cart=add_button is None,
+            )
+        logger.info("Indexed %s product cards", len(catalog))
+        return catalog
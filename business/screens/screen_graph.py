@@ -0,0 +1,56 @@
+from business.screens import (
+    Dict,
+    List,
+    Optional,
+    PageSnapshot,
+    Screen,
+    ScreenTransitionDto,
+    deque,
+)
+
+
+class ScreenGraph:
+    """Screens as nodes identified by fingerprints, taps as edges between them.
+
+    A fingerprint is a list of locators that are all visible on its screen and
+    can be evaluated on a page source, so one snapshot identifies the current
+    screen. Fingerprints are checked in insertion order: overlays (such as
+    the menu) before the screens they can cover.
+    """
+
+    def __init__(
+        self,
+        fingerprints: Dict[Screen, List[tuple]],
+        transitions: List[ScreenTransitionDto],
+    ):
+        self.fingerprints = fingerprints
+        self.transitions: Dict[Screen, List[ScreenTransitionDto]] = {}
+        for transition in transitions:
+            self.transitions.setdefault(transition.source, []).append(transition)
+
+    def identify(self, snapshot: PageSnapshot) -> Optional[Screen]:
+        for screen, fingerprint in self.fingerprints.items():
+            if all(snapshot.is_visible(locator) for locator in fingerprint):
+                return screen
+        return None
+
+    def path(
+        self, source: Screen, target: Screen
+    ) -> Optional[List[ScreenTransitionDto]]:
+        """Shortest list of transitions from `source` to `target` (breadth-first)."""
+        # Transition that first reached each screen; the source has none
+        previous: Dict[Screen, ScreenTransitionDto] = {}
+        queue = deque([source])
+        while queue:
+            screen = queue.popleft()
+            if screen == target:
+                path: List[ScreenTransitionDto] = []
+                while screen in previous:
+                    path.append(previous[screen])
+                    screen = previous[screen].source
+                return path[::-1]
+            for transition in self.transitions.get(screen, []):
+                if transition.target != source and transition.target not in previous:
+                    previous[transition.target] = transition
+                    queue.append(transition.target)
+        return None
@@ -1,13 +1,85 @@
-from business.screens import MobileDriver
+from business.screens import AdaptiveWait, Logger, MobileDriver, Optional, Screen
+from business.screens import ScreenTransitionDto as Transition
+from business.screens import time
 from business.screens.cart_screen import CartScreen
 from business.screens.checkout_overview_screen import CheckoutOverviewScreen
 from business.screens.checkout_screen import CheckoutScreen
 from business.screens.login_screen import LoginScreen
+from business.screens.menu_screen import MenuScreen
 from business.screens.products_screen import ProductsScreen
+from business.screens.screen_graph import ScreenGraph
+
+logger = Logger.get_logger(__name__)
+
+# Every screen class of the app, in the order `SwapLabs` exposes them
+SCREEN_TYPES = (
+    LoginScreen,
+    ProductsScreen,
+    CartScreen,
+    CheckoutScreen,
+    CheckoutOverviewScreen,
+    MenuScreen,
+)
+# Screens with the cart and menu buttons in their header
+_HEADER_SCREENS = [
+    Screen.PRODUCTS,
+    Screen.CART,
+    Screen.CHECKOUT_INFORMATION,
+    Screen.CHECKOUT_OVERVIEW,
+    Screen.CHECKOUT_COMPLETE,
+]
+# Only taps without input or lasting effects: logging in, submitting the
+# checkout form and finishing an order stay with the screens' own methods
+SCREEN_GRAPH = ScreenGraph(
+    fingerprints={
+        Screen.MENU: [MenuScreen.CLOSE_BUTTON],
+        Screen.LOGIN: [LoginScreen.USERNAME_INPUT],
+        Screen.PRODUCTS: [ProductsScreen.PRODUCTS_CONTAINER],
+        Screen.CART: [CartScreen.CART_ITEMS],
+        Screen.CHECKOUT_INFORMATION: [CheckoutScreen.FIRST_NAME_INPUT],
+        Screen.CHECKOUT_OVERVIEW: [CheckoutOverviewScreen.SCREEN_TITLE],
+        Screen.CHECKOUT_COMPLETE: [CheckoutOverviewScreen.BACKHOME_BUTTON],
+    },
+    transitions=[
+        *(
+            Transition(screen, Screen.CART, ProductsScreen.CART_BADGE)
+            for screen in _HEADER_SCREENS
+        ),
+        *(
+            Transition(screen, Screen.MENU, MenuScreen.MENU_BUTTON)
+            for screen in _HEADER_SCREENS
+        ),
+        Transition(Screen.CART, Screen.PRODUCTS, CartScreen.CONTINUE_SHOPPING_BUTTON),
+        Transition(
+            Screen.CART, Screen.CHECKOUT_INFORMATION, CartScreen.CHECKOUT_BUTTON
+        ),
+        Transition(
+            Screen.CHECKOUT_INFORMATION, Screen.CART, CheckoutScreen.CANCEL_BUTTON
+        ),
+        Transition(
+            Screen.CHECKOUT_OVERVIEW,
+            Screen.PRODUCTS,
+            CheckoutOverviewScreen.CANCEL_BUTTON,
+        ),
+        Transition(
+            Screen.CHECKOUT_COMPLETE,
+            Screen.PRODUCTS,
+            CheckoutOverviewScreen.BACKHOME_BUTTON,
+        ),
+        Transition(Screen.MENU, Screen.PRODUCTS, MenuScreen.ALL_ITEMS_BUTTON),
+        Transition(Screen.MENU, Screen.LOGIN, MenuScreen.LOGOUT_BUTTON),
+    ],
+)
 
 
 class SwapLabs:
 
+    # Re-identify and re-plan this often when a tap lands somewhere unexpected
+    MAX_REPLANS = 2
+    # Seconds a tap gets to leave its screen for an identifiable one
+    LANDING_TIMEOUT = 10
+    LANDING_MAX_POLL = 0.5
+
     def __init__(self, mobile_driver: MobileDriver):
         self.mobile_driver = mobile_driver
         self.login_screen = LoginScreen(mobile_driver)
@@ -15,3 +87,58 @@ class SwapLabs:
         self.cart_screen = CartScreen(mobile_driver)
         self.checkout_screen = CheckoutScreen(mobile_driver)
         self.checkout_overview_screen = CheckoutOverviewScreen(mobile_driver)
+        self.menu_screen = MenuScreen(mobile_driver)
+
+    def current_screen(self) -> Optional[Screen]:
+        """Identify the screen from a single page source, without waiting."""
+        return SCREEN_GRAPH.identify(self.mobile_driver.snapshot())
+
+    def is_on_screen(self, screen: Screen) -> bool:
+        """Wait for `screen`'s fingerprint, polling one page source at a time."""
+        return self.mobile_driver.are_elements_visible(
+            SCREEN_GRAPH.fingerprints[screen]
+        )
+
+    def _landed_screen(self, source: Screen) -> Optional[Screen]:
+        """Poll page sources until one shows a screen other than `source`.
+
+        A tap that lands somewhere unexpected is noticed as soon as that
+        screen is identified, not after waiting out the expected one.
+        """
+        deadline = time.monotonic() + self.LANDING_TIMEOUT
+        for delay in AdaptiveWait.intervals(self.LANDING_MAX_POLL):
+            screen = self.current_screen()
+            if (screen is not None and screen != source) or (
+                time.monotonic() >= deadline
+            ):
+                return screen
+            time.sleep(delay)
+        return None
+
+    def navigate_to(self, target: Screen):
+        """Reach `target` from wherever the app is by the shortest known path."""
+        current = self.current_screen()
+        for _ in range(self.MAX_REPLANS + 1):
+            if current == target:
+                return
+            path = SCREEN_GRAPH.path(current, target) if current else None
+            if path is None:
+                logger.error("No known path from %s to %s", current, target)
+                raise RuntimeError(f"Cannot navigate from {current} to {target}")
+            logger.info(
+                "Navigating %s",
+                " -> ".join(t.source.value for t in path) + f" -> {target.value}",
+            )
+            # The catalog may come back scrolled differently
+            self.products_screen.invalidate_catalog()
+            for transition in path:
+                self.mobile_driver.click(transition.locator)
+                current = self._landed_screen(transition.source)
+                if current != transition.target:
+                    break
+            else:
+                return
+            logger.warning("Expected %s, landed on %s", transition.target, current)
+        if current == target:
+            return
+        raise RuntimeError(f"Could not reach {target} in {self.MAX_REPLANS} re-plans")
@@ -1,7 +1,37 @@
+import json
+import math
+import os
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from xml.etree import ElementTree
 
+import jsonschema
+from appium.webdriver.common.appiumby import AppiumBy
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.webelement import WebElement
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
-__all__ = ["ABC", "abstractmethod", "List", "WebDriver", "WebElement"]
+__all__ = [
+    "json",
+    "math",
+    "os",
+    "re",
+    "time",
+    "ABC",
+    "abstractmethod",
+    "Path",
+    "Dict",
+    "List",
+    "Optional",
+    "Tuple",
+    "ElementTree",
+    "jsonschema",
+    "AppiumBy",
+    "WebDriver",
+    "WebElement",
+    "NoSuchElementException",
+    "TimeoutException",
+]
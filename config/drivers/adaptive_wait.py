@@ -0,0 +1,63 @@
+from config.drivers import (
+    NoSuchElementException,
+    Optional,
+    TimeoutException,
+    WebDriver,
+    time,
+)
+from config.drivers.locator_timeouts import LocatorTimeouts
+
+
+class AdaptiveWait:
+    """Explicit wait that polls fast first and backs off exponentially.
+
+    Polls are spaced `FIRST_POLL`, then doubling up to `max_poll`, so an
+    element that appears within a few hundred milliseconds is seen almost
+    immediately. Waits for a locator use its learned timeout from
+    `LocatorTimeouts` and feed their latency back into it; an explicit
+    `timeout` bypasses both.
+    """
+
+    FIRST_POLL = 0.05
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        timeouts: LocatorTimeouts,
+        default_timeout: float = 10,
+        max_poll: float = 0.5,
+    ):
+        self._driver = driver
+        self.timeouts = timeouts
+        self.default_timeout = default_timeout
+        self.max_poll = max_poll
+
+    @classmethod
+    def intervals(cls, max_poll: float):
+        pause = cls.FIRST_POLL
+        while True:
+            yield pause
+            pause = min(pause * 2, max_poll)
+
+    def until(self, condition, locator=None, timeout: Optional[float] = None):
+        learn = timeout is None and locator is not None
+        if timeout is None:
+            timeout = self.timeouts.timeout(locator, self.default_timeout)
+        started = time.monotonic()
+        deadline = started + timeout
+        intervals = self.intervals(self.max_poll)
+        while True:
+            try:
+                value = condition(self._driver)
+                if value:
+                    if learn:
+                        self.timeouts.record(locator, time.monotonic() - started)
+                    return value
+            except NoSuchElementException:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(
+                    f"Timed out after {timeout:.1f}s waiting for {locator or condition}"
+                )
+            time.sleep(min(next(intervals), remaining))
@@ -1,24 +1,60 @@
 from appium import webdriver
 from appium.options.android import UiAutomator2Options
 from appium.webdriver.webdriver import WebDriver
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    UnknownMethodException,
+)
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
-from config.drivers.mobile_driver import MobileDriver
-from config.dto import Direction
+from config.drivers import Optional, json, time
+from config.drivers.adaptive_wait import AdaptiveWait
+from config.drivers.element_cache import ElementCache
+from config.drivers.locator_rewriter import LocatorRewriter
+from config.drivers.locator_timeouts import LocatorTimeouts
+from config.drivers.mobile_driver import ELEMENT_KEY, MobileDriver
+from config.drivers.page_snapshot import PageSnapshot, UnsupportedLocatorError
+from config.drivers.performance_profiles import PerformanceProfiles
+from config.dto import (
+    BatchAction,
+    BatchActionDto,
+    BatchResultDto,
+    Direction,
+    PerformanceProfileDto,
+)
 from config.dto.desired_capabilities_dto import DesiredCapabilitiesDto
+from config.utils.command_metrics import CommandTimer
 from config.utils.logger import Logger
 
 __all__ = [
     "webdriver",
     "UiAutomator2Options",
     "WebDriver",
+    "NoSuchElementException",
+    "StaleElementReferenceException",
     "TimeoutException",
+    "UnknownMethodException",
     "EC",
-    "WebDriverWait",
+    "Optional",
+    "json",
+    "time",
+    "AdaptiveWait",
+    "ElementCache",
+    "LocatorRewriter",
+    "LocatorTimeouts",
+    "ELEMENT_KEY",
     "MobileDriver",
+    "PageSnapshot",
+    "UnsupportedLocatorError",
+    "PerformanceProfiles",
     "DesiredCapabilitiesDto",
     "Logger",
+    "CommandTimer",
+    "BatchAction",
+    "BatchActionDto",
+    "BatchResultDto",
     "Direction",
+    "PerformanceProfileDto",
 ]
@@ -1,16 +1,97 @@
 from config.drivers.android_driver import (
     EC,
+    ELEMENT_KEY,
+    AdaptiveWait,
+    BatchAction,
+    BatchResultDto,
+    CommandTimer,
     DesiredCapabilitiesDto,
     Direction,
+    ElementCache,
+    LocatorRewriter,
+    LocatorTimeouts,
     Logger,
     MobileDriver,
+    NoSuchElementException,
+    Optional,
+    PageSnapshot,
+    PerformanceProfileDto,
+    PerformanceProfiles,
+    StaleElementReferenceException,
     TimeoutException,
     UiAutomator2Options,
+    UnknownMethodException,
+    UnsupportedLocatorError,
     WebDriver,
-    WebDriverWait,
+    json,
+    time,
     webdriver,
 )
 
+# Unknown element ids (e.g. after an emulator snapshot load) count as stale
+STALE_ELEMENT_ERRORS = (StaleElementReferenceException, NoSuchElementException)
+
+# WebdriverIO driver script: every action waits for its element, then acts.
+# Runs inside Appium, so a whole form costs one HTTP round-trip.
+BATCH_SCRIPT = """
+const actions = %(actions)s;
+const firstPoll = %(first_poll)d;
+const maxPoll = %(max_poll)d;
+const results = [];
+let failed = false;
+for (const action of actions) {
+  if (failed) {
+    results.push({success: false, error: "skipped after earlier failure"});
+    continue;
+  }
+  try {
+    const deadline = Date.now() + action.timeout;
+    let pause = firstPoll;
+    let elementId = null;
+    let lastError = null;
+    while (elementId === null) {
+      try {
+        const ref = await driver.findElement(action.using, action.value);
+        const candidate = ref[%(element_key)s] || ref.ELEMENT;
+        if (await driver.isElementDisplayed(candidate)) {
+          elementId = candidate;
+          break;
+        }
+      } catch (e) {
+        lastError = e;
+      }
+      if (Date.now() >= deadline) {
+        throw lastError || new Error("element not displayed");
+      }
+      await driver.pause(pause);
+      pause = Math.min(pause * 2, maxPoll);
+    }
+    let value = null;
+    if (action.action === "clear" || action.action === "type") {
+      await driver.elementClear(elementId);
+    }
+    if (action.action === "type") {
+      await driver.elementSendKeys(elementId, action.text);
+    } else if (action.action === "tap") {
+      await driver.elementClick(elementId);
+    } else if (action.action === "swipe") {
+      await driver.execute("mobile: swipeGesture", {
+        elementId: elementId,
+        direction: action.direction,
+        percent: 0.75,
+      });
+    } else if (action.action === "text") {
+      value = await driver.getElementText(elementId);
+    }
+    results.push({success: true, value: value});
+  } catch (e) {
+    failed = true;
+    results.push({success: false, error: String((e && e.message) || e)});
+  }
+}
+return results;
+"""
+
 
 class AndroidMobileDriver(MobileDriver):
 
@@ -19,42 +100,81 @@ class AndroidMobileDriver(MobileDriver):
         appium_server_url: str = "http://127.0.0.1:4723",
         timeout: int = 10,
         poll_frequency: float = 0.5,
+        timeouts: Optional[LocatorTimeouts] = None,
     ):
         self._mobile_driver: WebDriver = None
         self._appium_server_url = appium_server_url
         self._timeout = timeout
         self._poll_frequency = poll_frequency
-        self._wait: WebDriverWait = None
+        self._wait: AdaptiveWait = None
+        self._timeouts = timeouts or LocatorTimeouts()
+        self._app_package: Optional[str] = None
+        self._app_path: Optional[str] = None
+        # Cleared when the server rejects driver scripts (execute-driver plugin)
+        self._driver_scripts = True
+        self._element_cache = ElementCache()
         self.logger = Logger.get_logger(__name__)
 
     def create_mobile_driver(self, desired_capabilities: DesiredCapabilitiesDto):
         try:
-            options = UiAutomator2Options().load_capabilities(
-                {
-                    "platformName": desired_capabilities.platformName,
-                    "appium:automationName": desired_capabilities.automationName,
-                    "appium:deviceName": desired_capabilities.deviceName,
-                    "appium:app": desired_capabilities.app,
-                    "appium:appPackage": desired_capabilities.appPackage,
-                    "appium:appActivity": desired_capabilities.appActivity,
-                    "appium:noReset": desired_capabilities.noReset,
-                    "appium:fullReset": desired_capabilities.fullReset,
-                    "appium:newCommandTimeout": desired_capabilities.newCommandTimeout,
-                    "appium:autoGrantPermissions": desired_capabilities.autoGrantPermissions,
-                }
-            )
+            capabilities = {
+                "platformName": desired_capabilities.platformName,
+                "appium:automationName": desired_capabilities.automationName,
+                "appium:deviceName": desired_capabilities.deviceName,
+                "appium:appPackage": desired_capabilities.appPackage,
+                "appium:appActivity": desired_capabilities.appActivity,
+                "appium:noReset": desired_capabilities.noReset,
+                "appium:fullReset": desired_capabilities.fullReset,
+                "appium:newCommandTimeout": desired_capabilities.newCommandTimeout,
+                "appium:autoGrantPermissions": desired_capabilities.autoGrantPermissions,
+            }
+            if not desired_capabilities.appInstalled:
+                capabilities["appium:app"] = desired_capabilities.app
+            if desired_capabilities.skipServerInstallation:
+                capabilities["appium:skipServerInstallation"] = True
+            if desired_capabilities.skipDeviceInitialization:
+                capabilities["appium:skipDeviceInitialization"] = True
+            if desired_capabilities.udid:
+                capabilities["appium:udid"] = desired_capabilities.udid
+            if desired_capabilities.systemPort:
+                capabilities["appium:systemPort"] = desired_capabilities.systemPort
+            profile = PerformanceProfiles().get(desired_capabilities.performanceProfile)
+            # Capabilities set above (including runtime ones) take precedence
+            for name, value in profile.capabilities.items():
+                capabilities.setdefault(f"appium:{name}", value)
+
+            self._element_cache.clear()
+            self._app_package = desired_capabilities.appPackage
+            self._app_path = desired_capabilities.app
+            options = UiAutomator2Options().load_capabilities(capabilities)
             self._mobile_driver = webdriver.Remote(
                 command_executor=self._appium_server_url, options=options
             )
-            self._wait = WebDriverWait(
-                self._mobile_driver, self._timeout, poll_frequency=self._poll_frequency
+            self._wait = AdaptiveWait(
+                self._mobile_driver,
+                self._timeouts,
+                default_timeout=self._timeout,
+                max_poll=self._poll_frequency,
             )
-            self.logger.info("Android mobile driver created")
+            self._apply_settings(profile)
+            self.logger.info("Android mobile driver created (%s profile)", profile.name)
 
         except Exception as e:
-            self.logger.error(f"Failed to create Android driver: {e}", exc_info=True)
+            self.logger.error("Failed to create Android driver: %s", e, exc_info=True)
             raise RuntimeError(f"Failed to create Android driver: {str(e)}")
 
+    def _apply_settings(self, profile: PerformanceProfileDto):
+        if not profile.settings:
+            return
+        try:
+            with CommandTimer("update_settings") as timer:
+                timer.call(self._mobile_driver.update_settings, profile.settings)
+        except Exception as e:
+            # Older servers and replayed cassettes may not know every setting
+            self.logger.warning(
+                "Settings of the %s profile not applied: %s", profile.name, e
+            )
+
     @property
     def driver(self) -> WebDriver:
         return self._mobile_driver
@@ -64,104 +184,454 @@ class AndroidMobileDriver(MobileDriver):
             if self._mobile_driver:
                 self._mobile_driver.quit()
                 self._mobile_driver = None
-                self.logger.info("Driver quit")
+                self._element_cache.clear()
+                self._timeouts.save()
+                self.logger.info(
+                    "Driver quit (element cache: %s hits, %s misses)",
+                    self._element_cache.hits,
+                    self._element_cache.misses,
+                )
         except Exception as e:
-            self.logger.error(f"Failed to quit driver: {e}", exc_info=True)
+            self.logger.error("Failed to quit driver: %s", e, exc_info=True)
             raise
 
     def reset(self):
         try:
             if self._mobile_driver:
+                self._element_cache.clear()
                 app_id = self._mobile_driver.capabilities.get("appPackage")
-                self._mobile_driver.terminate_app(app_id)
-                self._mobile_driver.activate_app(app_id)
+                with CommandTimer("reset") as timer:
+                    timer.call(self._mobile_driver.terminate_app, app_id)
+                    timer.call(self._mobile_driver.activate_app, app_id)
+        except Exception as e:
+            self.logger.error("Failed to reset app: %s", e, exc_info=True)
+            raise
+
+    def activate_app(self):
+        self._element_cache.clear()
+        try:
+            with CommandTimer("activate_app") as timer:
+                timer.call(self._mobile_driver.activate_app, self._app_package)
+            self.logger.info("App activated: %s", self._app_package)
+        except Exception as e:
+            self.logger.error("Failed to activate app: %s", e, exc_info=True)
+            raise
+
+    def clear_app_data(self):
+        self._element_cache.clear()
+        try:
+            with CommandTimer("clear_app_data") as timer:
+                # Equivalent of `adb shell pm clear`; also stops the app
+                timer.call(
+                    self._mobile_driver.execute_script,
+                    "mobile: clearApp",
+                    {"appId": self._app_package},
+                )
+                timer.call(self._mobile_driver.activate_app, self._app_package)
+            self.logger.info("App data cleared: %s", self._app_package)
+        except Exception as e:
+            self.logger.error("Failed to clear app data: %s", e, exc_info=True)
+            raise
+
+    def reinstall_app(self):
+        self._element_cache.clear()
+        try:
+            with CommandTimer("reinstall_app") as timer:
+                timer.call(self._mobile_driver.remove_app, self._app_package)
+                timer.call(self._mobile_driver.install_app, self._app_path)
+                timer.call(self._mobile_driver.activate_app, self._app_package)
+            self.logger.info("App reinstalled: %s", self._app_path)
         except Exception as e:
-            self.logger.error(f"Failed to reset app: {e}", exc_info=True)
+            self.logger.error("Failed to reinstall app: %s", e, exc_info=True)
             raise
 
     def find_element(self, locator):
         try:
-            self.element = self._wait.until(EC.visibility_of_element_located(locator))
-            self.logger.info(f"Element found and visible: {locator}")
-            return self.element
+            with CommandTimer("find_element", locator) as timer:
+                element = self._locate(
+                    locator, EC.visibility_of_element_located, timer, verify=True
+                )
+            self.logger.info("Element found and visible: %s", locator)
+            return element
         except TimeoutException:
             self.logger.error(
-                f"Timeout waiting for element {locator} to be visible", exc_info=True
+                "Timeout waiting for element %s to be visible", locator, exc_info=True
             )
             raise
         except Exception as e:
-            self.logger.error(f"Failed to find element {locator}: {e}", exc_info=True)
+            self.logger.error(
+                "Failed to find element %s: %s", locator, e, exc_info=True
+            )
             raise
 
     def find_elements(self, locator):
         try:
-            elements = self._mobile_driver.find_elements(*locator)
-            self.logger.info(f"Found {len(elements)} elements with locator: {locator}")
+            with CommandTimer("find_elements", locator) as timer:
+                lookup = LocatorRewriter.rewrite(locator)
+                direct = LocatorRewriter.without_scroll(lookup)
+                elements = (
+                    timer.call(self._mobile_driver.find_elements, *direct)
+                    if direct
+                    else []
+                )
+                if not elements:
+                    elements = timer.call(self._mobile_driver.find_elements, *lookup)
+            self.logger.info(
+                "Found %s elements with locator: %s", len(elements), locator
+            )
             return elements
         except Exception as e:
-            self.logger.error(f"Failed to find elements {locator}: {e}", exc_info=True)
+            self.logger.error(
+                "Failed to find elements %s: %s", locator, e, exc_info=True
+            )
             raise
 
     def is_element_visible(self, locator):
         try:
-            self._wait.until(EC.visibility_of_element_located(locator))
-            self.logger.info(f"Element {locator} is visible")
+            with CommandTimer("is_element_visible", locator) as timer:
+                self._locate(
+                    locator, EC.visibility_of_element_located, timer, verify=True
+                )
+            self.logger.info("Element %s is visible", locator)
             return True
         except TimeoutException:
-            self.logger.info(f"Element {locator} is not visible (timeout)")
+            self.logger.info("Element %s is not visible (timeout)", locator)
             return False
         except Exception as e:
-            self.logger.info(f"Error checking visibility of element {locator}: {e}")
+            self.logger.info("Error checking visibility of element %s: %s", locator, e)
             return False
 
+    def is_element_invisible(self, locator, grace_period: float = 0):
+        """Probe once, then optionally wait `grace_period` seconds for it to go.
+
+        Negative checks never pay the full explicit-wait timeout.
+        """
+        try:
+            with CommandTimer("is_element_invisible", locator) as timer:
+                lookup = LocatorRewriter.rewrite(locator)
+                elements = timer.call(self._mobile_driver.find_elements, *lookup)
+                if not any(timer.call(element.is_displayed) for element in elements):
+                    self.logger.info("Element %s is not visible", locator)
+                    return True
+                if grace_period <= 0:
+                    self.logger.info("Element %s is visible", locator)
+                    return False
+                self._wait.until(
+                    timer.wrap(EC.invisibility_of_element_located(lookup)),
+                    locator,
+                    timeout=grace_period,
+                )
+            self.logger.info("Element %s disappeared within %ss", locator, grace_period)
+            return True
+        except TimeoutException:
+            self.logger.info(
+                "Element %s still visible after %ss", locator, grace_period
+            )
+            return False
+        except StaleElementReferenceException:
+            # The element went away between lookup and the displayed check
+            return True
+
+    def snapshot(self):
+        try:
+            with CommandTimer("snapshot") as timer:
+                page_source = timer.call(lambda: self._mobile_driver.page_source)
+                return PageSnapshot(page_source)
+        except Exception as e:
+            self.logger.error("Failed to take page snapshot: %s", e, exc_info=True)
+            raise
+
+    def are_elements_visible(self, locators):
+        """Check many locators against one page source per poll.
+
+        Locators that need scrolling or use a strategy the snapshot cannot
+        evaluate fall back to the regular explicit wait. Any other locator
+        still not visible at the deadline fails the check at once.
+        """
+        pending, live = list(locators), []
+        deadline = time.monotonic() + self._timeout
+        intervals = AdaptiveWait.intervals(self._poll_frequency)
+        while pending:
+            snapshot = self.snapshot()
+            not_visible = []
+            for locator in pending:
+                try:
+                    if not snapshot.is_visible(locator):
+                        not_visible.append(locator)
+                except UnsupportedLocatorError:
+                    live.append(locator)
+            pending = not_visible
+            # Scrolling locators may simply be off-screen: stop polling for them
+            settled = all(PageSnapshot.requires_scroll(locator) for locator in pending)
+            if settled or time.monotonic() >= deadline:
+                break
+            time.sleep(next(intervals))
+
+        # Already waited the full timeout for these: no second explicit wait
+        missing = [loc for loc in pending if not PageSnapshot.requires_scroll(loc)]
+        if missing:
+            self.logger.info("Not visible after %ss: %s", self._timeout, missing)
+            return False
+        live.extend(pending)
+        self.logger.info(
+            "Snapshot resolved %s/%s locators", len(locators) - len(live), len(locators)
+        )
+        return all(self.is_element_visible(locator) for locator in live)
+
     def click(self, locator):
         try:
-            element = self._wait.until(EC.element_to_be_clickable(locator))
-            element.click()
-            self.logger.info(f"Clicked on: {locator}")
+            with CommandTimer("click", locator) as timer:
+                self._with_element(
+                    locator, EC.element_to_be_clickable, timer, lambda e: e.click()
+                )
+            # A tap is how this app navigates: nothing cached survives it
+            self._element_cache.clear()
+            self.logger.info("Clicked on: %s", locator)
         except Exception as e:
-            self.logger.error(f"Failed to click element {locator}: {e}", exc_info=True)
+            self.logger.error(
+                "Failed to click element %s: %s", locator, e, exc_info=True
+            )
+            raise
+
+    def tap(self, x, y):
+        try:
+            with CommandTimer("tap") as timer:
+                timer.call(
+                    self._mobile_driver.execute_script,
+                    "mobile: clickGesture",
+                    {"x": x, "y": y},
+                )
+            self._element_cache.clear()
+            self.logger.info("Tapped at (%s, %s)", x, y)
+        except Exception as e:
+            self.logger.error("Failed to tap at (%s, %s): %s", x, y, e, exc_info=True)
             raise
 
     def type_text(self, locator, text):
         try:
-            element = self._wait.until(EC.element_to_be_clickable(locator))
-            element.clear()
-            element.send_keys(text)
-            self.logger.info(f"Typed '{text}' into: {locator}")
+            with CommandTimer("type_text", locator) as timer:
+
+                def clear_and_type(element):
+                    element.clear()
+                    element.send_keys(text)
+
+                self._with_element(
+                    locator, EC.element_to_be_clickable, timer, clear_and_type
+                )
+            self.logger.info("Typed '%s' into: %s", text, locator)
         except Exception as e:
             self.logger.error(
-                f"Failed to type '{text}' into element {locator}: {e}", exc_info=True
+                "Failed to type '%s' into element %s: %s",
+                text,
+                locator,
+                e,
+                exc_info=True,
             )
             raise
 
     def get_text(self, locator):
         try:
-            element = self._wait.until(EC.visibility_of_element_located(locator))
-            text = element.text
-            self.logger.info(f"Text from element {locator}: {text}")
+            with CommandTimer("get_text", locator) as timer:
+                text = self._with_element(
+                    locator, EC.visibility_of_element_located, timer, lambda e: e.text
+                )
+            self.logger.info("Text from element %s: %s", locator, text)
             return text
         except Exception as e:
             self.logger.error(
-                f"Failed to get text from element {locator}: {e}", exc_info=True
+                "Failed to get text from element %s: %s", locator, e, exc_info=True
             )
             raise
 
     def swipe(self, locator, direction: Direction):
         try:
-            element = self._wait.until(EC.visibility_of_element_located(locator))
-            self._mobile_driver.execute_script(
-                "mobile: swipeGesture",
-                {
-                    "elementId": element.id,
-                    "direction": direction.value,
-                    "percent": 0.75,
-                },
-            )
-            self.logger.info(f"Swiped {direction.value} on element: {locator}")
+            with CommandTimer("swipe", locator) as timer:
+                self._with_element(
+                    locator,
+                    EC.visibility_of_element_located,
+                    timer,
+                    lambda element: self._mobile_driver.execute_script(
+                        "mobile: swipeGesture",
+                        {
+                            "elementId": element.id,
+                            "direction": direction.value,
+                            "percent": 0.75,
+                        },
+                    ),
+                )
+            self._element_cache.clear()
+            self.logger.info("Swiped %s on element: %s", direction.value, locator)
         except Exception as e:
             self.logger.error(
-                f"Failed to swipe {direction.value} on element {locator}: {e}",
+                "Failed to swipe %s on element %s: %s",
+                direction.value,
+                locator,
+                e,
                 exc_info=True,
             )
             raise
+
+    def run_batch(self, actions, raise_on_error=True):
+        """Run locate/clear/type/tap/swipe/text actions in one server call.
+
+        Uses Appium's driver-script execution; servers without it get the
+        same actions one command at a time. Any other script error is raised,
+        since the script may already have acted. Actions after a failure are
+        skipped. Results line up with `actions`.
+        """
+        with CommandTimer("run_batch") as timer:
+            results = None
+            if self._driver_scripts:
+                results = timer.call(self._run_driver_script, actions)
+                self._element_cache.clear()
+            if results is None:
+                results = self._run_sequentially(actions)
+        failed = next((result for result in results if not result.success), None)
+        if failed is None:
+            self.logger.info("Batch of %s actions completed", len(actions))
+            return results
+        self.logger.error(
+            "Batch action %s on %s failed: %s",
+            failed.action.value,
+            failed.locator,
+            failed.error,
+        )
+        if raise_on_error:
+            raise RuntimeError(
+                f"Batch action {failed.action.value} on {failed.locator} failed: "
+                f"{failed.error}"
+            )
+        return results
+
+    def _run_driver_script(self, actions):
+        payload = []
+        for action in actions:
+            using, value = LocatorRewriter.rewrite(action.locator)
+            timeout = self._timeouts.timeout(action.locator, self._timeout)
+            payload.append(
+                {
+                    "action": action.action.value,
+                    "using": using,
+                    "value": value,
+                    "text": action.text,
+                    "direction": action.direction and action.direction.value,
+                    "timeout": timeout * 1000,
+                }
+            )
+        script = BATCH_SCRIPT % {
+            "actions": json.dumps(payload),
+            "element_key": json.dumps(ELEMENT_KEY),
+            "first_poll": AdaptiveWait.FIRST_POLL * 1000,
+            "max_poll": self._poll_frequency * 1000,
+        }
+        try:
+            response = self._mobile_driver.execute_driver(
+                script=script,
+                script_type="webdriverio",
+                timeout_ms=(LocatorTimeouts.MAX_TIMEOUT * len(actions) + 30) * 1000,
+            )
+        except UnknownMethodException as e:
+            # No execute-driver plugin: nothing ran, so the commands are safe
+            self._driver_scripts = False
+            self.logger.info(
+                "Driver scripts unavailable, batching falls back to commands: %s", e
+            )
+            return None
+        except Exception as e:
+            # The script may have acted already; replaying it could act twice
+            self.logger.error("Driver script failed: %s", e)
+            raise
+        outcomes = response.result
+        if not isinstance(outcomes, list) or len(outcomes) != len(actions):
+            raise RuntimeError(f"Unexpected driver script result: {outcomes!r}")
+        return [
+            BatchResultDto(
+                action=action.action,
+                locator=action.locator,
+                success=outcome.get("success", False),
+                value=outcome.get("value"),
+                error=outcome.get("error"),
+            )
+            for action, outcome in zip(actions, outcomes)
+        ]
+
+    def _run_sequentially(self, actions):
+        results, failed = [], False
+        for action in actions:
+            if failed:
+                results.append(
+                    BatchResultDto(
+                        action.action,
+                        action.locator,
+                        False,
+                        error="skipped after earlier failure",
+                    )
+                )
+                continue
+            try:
+                value = None
+                if action.action == BatchAction.LOCATE:
+                    self.find_element(action.locator)
+                elif action.action == BatchAction.CLEAR:
+                    self.find_element(action.locator).clear()
+                elif action.action == BatchAction.TYPE:
+                    self.type_text(action.locator, action.text)
+                elif action.action == BatchAction.TAP:
+                    self.click(action.locator)
+                elif action.action == BatchAction.SWIPE:
+                    self.swipe(action.locator, action.direction)
+                elif action.action == BatchAction.TEXT:
+                    value = self.get_text(action.locator)
+                results.append(
+                    BatchResultDto(action.action, action.locator, True, value=value)
+                )
+            except Exception as e:
+                failed = True
+                results.append(
+                    BatchResultDto(action.action, action.locator, False, error=str(e))
+                )
+        return results
+
+    def _locate(self, locator, condition, timer, verify=False):
+        """Return the cached element for `locator`, or wait for `condition`.
+
+        `verify` spends one round-trip checking the cached element is still
+        displayed; otherwise staleness surfaces when the element is used.
+        """
+        element = self._element_cache.get(locator)
+        if element is not None:
+            try:
+                if not verify or timer.call(element.is_displayed):
+                    return element
+            except STALE_ELEMENT_ERRORS:
+                pass
+            self._element_cache.discard(locator)
+        lookup = LocatorRewriter.rewrite(locator)
+        element = self._find_without_scroll(lookup, condition, timer)
+        if element is None:
+            element = self._wait.until(timer.wrap(condition(lookup)), locator)
+        self._element_cache.put(locator, element)
+        return element
+
+    def _find_without_scroll(self, locator, condition, timer):
+        """Try a scrolling locator's target as-is first: most are on screen.
+
+        `condition` is checked once on the target, so e.g. `click` still only
+        gets a clickable element.
+        """
+        direct = LocatorRewriter.without_scroll(locator)
+        if direct is None:
+            return None
+        try:
+            return timer.wrap(condition(direct))(self._mobile_driver) or None
+        except STALE_ELEMENT_ERRORS:
+            return None
+
+    def _with_element(self, locator, condition, timer, action):
+        element = self._locate(locator, condition, timer)
+        try:
+            return timer.call(action, element)
+        except STALE_ELEMENT_ERRORS:
+            self._element_cache.discard(locator)
+            self.logger.info("Element %s went stale, locating it again", locator)
+            return timer.call(action, self._locate(locator, condition, timer))
@@ -0,0 +1,31 @@
+from config.drivers import Dict, Optional, WebElement
+
+
+class ElementCache:
+    """Elements located on the current screen, keyed by locator.
+
+    Cleared by the driver whenever the screen can change (taps, swipes, app
+    lifecycle). Entries that still go stale are dropped by the caller.
+    """
+
+    def __init__(self):
+        self._elements: Dict[tuple, WebElement] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, locator) -> Optional[WebElement]:
+        element = self._elements.get(tuple(locator))
+        if element is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return element
+
+    def put(self, locator, element: WebElement):
+        self._elements[tuple(locator)] = element
+
+    def discard(self, locator):
+        self._elements.pop(tuple(locator), None)
+
+    def clear(self):
+        self._elements.clear()
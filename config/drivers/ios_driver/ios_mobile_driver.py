@@ -16,6 +16,15 @@ class IosMobileDriver(MobileDriver):
     def reset(self):
         raise NotImplementedError
 
+    def activate_app(self):
+        raise NotImplementedError
+
+    def clear_app_data(self):
+        raise NotImplementedError
+
+    def reinstall_app(self):
+        raise NotImplementedError
+
     def find_element(self, locator):
         raise NotImplementedError
 
@@ -25,9 +34,21 @@ class IosMobileDriver(MobileDriver):
     def is_element_visible(self, locator):
         raise NotImplementedError
 
+    def is_element_invisible(self, locator, grace_period=0):
+        raise NotImplementedError
+
+    def snapshot(self):
+        raise NotImplementedError
+
+    def are_elements_visible(self, locators):
+        raise NotImplementedError
+
     def click(self, locator):
         raise NotImplementedError
 
+    def tap(self, x, y):
+        raise NotImplementedError
+
     def type_text(self, locator, text):
         raise NotImplementedError
 
@@ -37,3 +58,5 @@ class IosMobileDriver(MobileDriver):
     def swipe(self, locator, direction):
         raise NotImplementedError
 
+    def run_batch(self, actions, raise_on_error=True):
+        raise NotImplementedError
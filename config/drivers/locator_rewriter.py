@@ -0,0 +1,119 @@
+from config.drivers import AppiumBy, Dict, List, Optional, re
+from config.drivers.page_snapshot import PageSnapshot, UiSelector
+
+# One XPath step: a class (or *) with at most one exact attribute predicate
+_XPATH_STEP = (
+    r"(?P<{0}class>\*|[\w.]+)"
+    r'(?:\[@(?P<{0}attribute>text|content-desc|resource-id)="(?P<{0}value>[^"]*)"\])?'
+)
+_SIMPLE_XPATH = re.compile(
+    "^//" + _XPATH_STEP.format("") + "(?://" + _XPATH_STEP.format("child_") + ")?$"
+)
+_UI_SELECTOR_METHODS = {
+    "text": "text",
+    "content-desc": "description",
+    "resource-id": "resourceId",
+}
+
+
+class LocatorRewriter:
+    """Static cost model and exact-equivalent rewrites for screen locators.
+
+    XPath forces UiAutomator2 to serialize the whole hierarchy on every poll,
+    so plain attribute XPaths (one step, or a parent step with a descendant
+    step) are rewritten to accessibility id, id, class name or a UiSelector
+    (with `childSelector`) that selects the same elements. Everything else is
+    only reported through `issues`.
+    """
+
+    COSTS = {
+        AppiumBy.ACCESSIBILITY_ID: 1,
+        AppiumBy.ID: 1,
+        AppiumBy.CLASS_NAME: 2,
+        AppiumBy.ANDROID_UIAUTOMATOR: 2,
+        AppiumBy.XPATH: 10,
+    }
+    SCROLL_COST = 6
+    PARENT_TRAVERSAL_COST = 5
+
+    _rewrites: Dict[tuple, tuple] = {}
+
+    @classmethod
+    def cost(cls, locator) -> int:
+        by, value = locator
+        cost = cls.COSTS.get(by, 10)
+        if PageSnapshot.requires_scroll(locator):
+            cost += cls.SCROLL_COST
+        if by == AppiumBy.XPATH and "/.." in value:
+            cost += cls.PARENT_TRAVERSAL_COST
+        return cost
+
+    @classmethod
+    def issues(cls, locator) -> List[str]:
+        by, value = locator
+        issues = []
+        if by == AppiumBy.XPATH:
+            issues.append("XPath serializes the full hierarchy on every lookup")
+            if "/.." in value:
+                issues.append("parent traversal (/..): anchor on a container instead")
+            if "//*" in value:
+                issues.append("wildcard step (//*) scans every node")
+        if PageSnapshot.requires_scroll(locator):
+            issues.append("scrollIntoView on every lookup, even when on screen")
+        return issues
+
+    @classmethod
+    def rewrite(cls, locator) -> tuple:
+        """Cheapest exact equivalent of `locator`, or `locator` itself."""
+        locator = tuple(locator)
+        if locator not in cls._rewrites:
+            by, value = locator
+            rewritten = cls._rewrite_xpath(value) if by == AppiumBy.XPATH else None
+            cls._rewrites[locator] = rewritten or locator
+        return cls._rewrites[locator]
+
+    @staticmethod
+    def without_scroll(locator) -> Optional[tuple]:
+        """Return the `scrollIntoView` target as a plain UiSelector lookup."""
+        if not PageSnapshot.requires_scroll(locator):
+            return None
+        return (AppiumBy.ANDROID_UIAUTOMATOR, UiSelector(locator[1]).target)
+
+    @staticmethod
+    def _rewrite_xpath(xpath: str) -> Optional[tuple]:
+        match = _SIMPLE_XPATH.match(xpath)
+        if not match:
+            return None
+        step = match.group("class", "attribute", "value")
+        child = match.group("child_class", "child_attribute", "child_value")
+        if child[0] is None:
+            class_name, attribute, value = step
+            if class_name == "*" and attribute == "content-desc":
+                return (AppiumBy.ACCESSIBILITY_ID, value)
+            if class_name == "*" and attribute == "resource-id":
+                return (AppiumBy.ID, value)
+            if class_name != "*" and attribute is None:
+                return (AppiumBy.CLASS_NAME, class_name)
+        parent = _ui_selector(*step)
+        if parent is None:
+            return None
+        if child[0] is None:
+            return (AppiumBy.ANDROID_UIAUTOMATOR, parent)
+        child_selector = _ui_selector(*child)
+        if child_selector is None:
+            return None
+        return (
+            AppiumBy.ANDROID_UIAUTOMATOR,
+            f"{parent}.childSelector({child_selector})",
+        )
+
+
+def _ui_selector(class_name: str, attribute: str, value: str) -> Optional[str]:
+    calls = []
+    if class_name != "*":
+        calls.append(f'.className("{class_name}")')
+    if attribute:
+        calls.append(f'.{_UI_SELECTOR_METHODS[attribute]}("{value}")')
+    if not calls:
+        return None
+    return "new UiSelector()" + "".join(calls)
@@ -0,0 +1,84 @@
+from config.drivers import Dict, List, Optional, Path, json, math, re
+
+TIMEOUTS_FOLDER = Path(__file__).parent.parent.parent / "reports" / "locator_timeouts"
+
+
+class LocatorTimeouts:
+    """Per-locator wait latencies from previous runs on one device, as JSON.
+
+    Once a locator has `MIN_SAMPLES` successful waits, its timeout becomes the
+    p99 of the latest `MAX_SAMPLES` times `MARGIN` plus `PADDING` seconds,
+    clamped to [`MIN_TIMEOUT`, `MAX_TIMEOUT`]. Fast elements then fail fast
+    and slow ones get headroom beyond the default.
+
+    Without a `path` nothing is loaded, learned or saved and every wait gets
+    its default timeout, which is what fake and replayed servers need: their
+    latencies say nothing about a device.
+    """
+
+    MIN_SAMPLES = 5
+    MAX_SAMPLES = 100
+    MARGIN = 1.5
+    PADDING = 1.0
+    MIN_TIMEOUT = 3.0
+    MAX_TIMEOUT = 30.0
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._samples: Dict[str, List[float]] = {}
+        self._updated: set = set()
+
+    @classmethod
+    def for_device(cls, device_name: str) -> "LocatorTimeouts":
+        """Load the timeouts learned on `device_name` (an AVD or a device)."""
+        file_name = re.sub(r"[^\w.-]", "_", device_name) or "default"
+        return cls(TIMEOUTS_FOLDER / f"{file_name}.json").load()
+
+    @staticmethod
+    def key(locator) -> str:
+        strategy, value = locator
+        return f"{strategy}={value}"
+
+    def load(self) -> "LocatorTimeouts":
+        self._samples = self._read()
+        return self
+
+    def save(self):
+        if self.path is None or not self._updated:
+            return
+        # Merge so parallel workers only overwrite the locators they waited on
+        records = self._read()
+        for key in self._updated:
+            records[key] = self._samples[key]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump({"locators": records}, file, indent=2, sort_keys=True)
+        self._updated = set()
+
+    def record(self, locator, seconds: float):
+        if self.path is None:
+            return
+        key = self.key(locator)
+        samples = self._samples.setdefault(key, [])
+        samples.append(round(seconds, 3))
+        del samples[: -self.MAX_SAMPLES]
+        self._updated.add(key)
+
+    def timeout(self, locator, default: float) -> float:
+        samples = self._samples.get(self.key(locator)) if locator else None
+        if not samples or len(samples) < self.MIN_SAMPLES:
+            return default
+        ordered = sorted(samples)
+        p99 = ordered[max(1, math.ceil(0.99 * len(ordered))) - 1]
+        return min(
+            self.MAX_TIMEOUT, max(self.MIN_TIMEOUT, p99 * self.MARGIN + self.PADDING)
+        )
+
+    def _read(self) -> Dict[str, List[float]]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return json.load(file).get("locators", {})
+        except (json.JSONDecodeError, AttributeError):
+            return {}
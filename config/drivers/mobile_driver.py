@@ -1,5 +1,9 @@
 from config.drivers import ABC, List, WebDriver, WebElement, abstractmethod
-from config.dto import Direction
+from config.drivers.page_snapshot import PageSnapshot
+from config.dto import BatchActionDto, BatchResultDto, Direction
+
+# W3C WebDriver key of an element reference in command responses
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
 
 
 class MobileDriver(ABC):
@@ -21,6 +25,18 @@ class MobileDriver(ABC):
     def reset(self) -> None:
         pass
 
+    @abstractmethod
+    def activate_app(self) -> None:
+        pass
+
+    @abstractmethod
+    def clear_app_data(self) -> None:
+        pass
+
+    @abstractmethod
+    def reinstall_app(self) -> None:
+        pass
+
     @abstractmethod
     def find_element(self, locator) -> WebElement:
         pass
@@ -33,10 +49,26 @@ class MobileDriver(ABC):
     def is_element_visible(self, locator) -> bool:
         pass
 
+    @abstractmethod
+    def is_element_invisible(self, locator, grace_period: float = 0) -> bool:
+        pass
+
+    @abstractmethod
+    def snapshot(self) -> PageSnapshot:
+        pass
+
+    @abstractmethod
+    def are_elements_visible(self, locators: List[tuple]) -> bool:
+        pass
+
     @abstractmethod
     def click(self, locator) -> None:
         pass
 
+    @abstractmethod
+    def tap(self, x: int, y: int) -> None:
+        pass
+
     @abstractmethod
     def type_text(self, locator, text: str) -> None:
         pass
@@ -48,3 +80,9 @@ class MobileDriver(ABC):
     @abstractmethod
     def swipe(self, locator, direction: Direction) -> None:
         pass
+
+    @abstractmethod
+    def run_batch(
+        self, actions: List[BatchActionDto], raise_on_error: bool = True
+    ) -> List[BatchResultDto]:
+        pass
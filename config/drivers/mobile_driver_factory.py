@@ -1,15 +1,25 @@
+from config.drivers import Optional
 from config.drivers.android_driver.android_mobile_driver import AndroidMobileDriver
+from config.drivers.locator_timeouts import LocatorTimeouts
 from config.drivers.mobile_driver import MobileDriver
 from config.dto.desired_capabilities_dto import DesiredCapabilitiesDto
 
 
 class MobileDriverFactory:
     @staticmethod
-    def create_driver(capabilities: DesiredCapabilitiesDto) -> MobileDriver:
+    def create_driver(
+        capabilities: DesiredCapabilitiesDto,
+        appium_server_url: str = "http://127.0.0.1:4723",
+        timeouts: Optional[LocatorTimeouts] = None,
+    ) -> MobileDriver:
+        """Create a session; wait timeouts are learned per device unless given."""
         platform = capabilities.platformName.lower()
 
         if platform == "android":
-            driver = AndroidMobileDriver()
+            timeouts = timeouts or LocatorTimeouts.for_device(capabilities.deviceName)
+            driver = AndroidMobileDriver(
+                appium_server_url=appium_server_url, timeouts=timeouts
+            )
             driver.create_mobile_driver(capabilities)
             return driver
         elif platform == "ios":
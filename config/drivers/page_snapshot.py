@@ -0,0 +1,231 @@
+from config.drivers import AppiumBy, Dict, ElementTree, List, Optional, Tuple, re
+
+
+class UnsupportedLocatorError(ValueError):
+    pass
+
+
+class UiSelector:
+    """Local evaluation of the UiSelector subset used by the screen classes.
+
+    Supports attribute matchers (text, description, resourceId, className and
+    their Contains/StartsWith/Matches variants), boolean state matchers,
+    `index`, `instance` and a trailing `childSelector(<selector>)`.
+    `UiScrollable(...).scrollIntoView(<selector>)` is resolved against its
+    target selector, kept in `target`.
+    """
+
+    _CALL = re.compile(r'\.(\w+)\(\s*("(?:[^"\\]|\\.)*"|[^()"]*?)\s*\)')
+    _SCROLL_INTO_VIEW = re.compile(r"\.scrollIntoView\((new UiSelector\(\).*)\)\s*;?$")
+    _CHILD_SELECTOR = ".childSelector("
+
+    _ATTRIBUTE_MATCHERS = {
+        "text": ("text", "equals"),
+        "textContains": ("text", "contains"),
+        "textStartsWith": ("text", "startswith"),
+        "textMatches": ("text", "matches"),
+        "description": ("content-desc", "equals"),
+        "descriptionContains": ("content-desc", "contains"),
+        "descriptionStartsWith": ("content-desc", "startswith"),
+        "descriptionMatches": ("content-desc", "matches"),
+        "resourceId": ("resource-id", "equals"),
+        "resourceIdMatches": ("resource-id", "matches"),
+        "className": ("class", "equals"),
+        "index": ("index", "equals"),
+    }
+    _STATE_MATCHERS = {
+        "scrollable",
+        "clickable",
+        "enabled",
+        "checked",
+        "selected",
+        "focusable",
+        "focused",
+        "longClickable",
+    }
+
+    def __init__(self, expression: str):
+        self.expression = expression.strip()
+        self.scrolls = False
+        self.instance: Optional[int] = None
+        self.child: Optional["UiSelector"] = None
+        self._conditions: List[tuple] = []
+
+        selector = self.expression
+        scroll_target = self._SCROLL_INTO_VIEW.search(selector)
+        if selector.startswith("new UiScrollable("):
+            if not scroll_target:
+                raise UnsupportedLocatorError(f"Unsupported UiScrollable: {expression}")
+            self.scrolls = True
+            selector = scroll_target.group(1)
+        self.target = selector
+        self._parse(selector)
+
+    def _parse(self, selector: str):
+        prefix = "new UiSelector()"
+        if not selector.startswith(prefix):
+            raise UnsupportedLocatorError(f"Unsupported UiSelector: {selector}")
+        chain = selector[len(prefix) :].rstrip(";").strip()
+        child_start = chain.find(self._CHILD_SELECTOR)
+        if child_start != -1:
+            argument_start = child_start + len(self._CHILD_SELECTOR)
+            argument_end = _closing_parenthesis(chain, argument_start)
+            if chain[argument_end + 1 :].strip():
+                raise UnsupportedLocatorError(
+                    f"Calls after childSelector are not supported: {selector}"
+                )
+            self.child = UiSelector(chain[argument_start:argument_end])
+            chain = chain[:child_start]
+
+        position = 0
+        for call in self._CALL.finditer(chain):
+            if call.start() != position:
+                break
+            position = call.end()
+            method, raw_argument = call.group(1), call.group(2)
+            argument = self._parse_argument(raw_argument)
+            if method in self._ATTRIBUTE_MATCHERS:
+                attribute, operator = self._ATTRIBUTE_MATCHERS[method]
+                self._conditions.append((attribute, operator, str(argument)))
+            elif method in self._STATE_MATCHERS:
+                expected = "true" if argument in (True, "true") else "false"
+                self._conditions.append((method, "equals", expected))
+            elif method == "instance":
+                self.instance = int(argument)
+            else:
+                raise UnsupportedLocatorError(
+                    f"Unsupported UiSelector method: {method}"
+                )
+        if position != len(chain):
+            raise UnsupportedLocatorError(f"Unsupported UiSelector: {selector}")
+
+    @staticmethod
+    def _parse_argument(raw_argument: str):
+        if raw_argument.startswith('"'):
+            return bytes(raw_argument[1:-1], "utf-8").decode("unicode_escape")
+        if raw_argument in ("true", "false"):
+            return raw_argument == "true"
+        return raw_argument
+
+    def matches(self, element: ElementTree.Element) -> bool:
+        for attribute, operator, expected in self._conditions:
+            if attribute == "class":
+                actual = element.get("class", element.tag)
+            elif attribute in self._STATE_MATCHERS:
+                actual = element.get(_state_attribute(attribute), "false")
+            else:
+                actual = element.get(attribute, "")
+            if operator == "equals" and actual != expected:
+                return False
+            if operator == "contains" and expected not in actual:
+                return False
+            if operator == "startswith" and not actual.startswith(expected):
+                return False
+            if operator == "matches" and not re.fullmatch(expected, actual):
+                return False
+        return True
+
+    def find_all(self, root: ElementTree.Element) -> List[ElementTree.Element]:
+        elements = [element for element in root.iter() if self.matches(element)]
+        if self.instance is not None:
+            elements = elements[self.instance : self.instance + 1]
+        if self.child is None:
+            return elements
+        found: List[ElementTree.Element] = []
+        for parent in elements:
+            for element in self.child.find_all(parent):
+                if element is not parent and element not in found:
+                    found.append(element)
+        return found
+
+
+def _closing_parenthesis(text: str, start: int) -> int:
+    depth, quoted = 1, False
+    for position in range(start, len(text)):
+        character = text[position]
+        if character == '"' and text[position - 1] != "\\":
+            quoted = not quoted
+        elif not quoted and character == "(":
+            depth += 1
+        elif not quoted and character == ")":
+            depth -= 1
+            if depth == 0:
+                return position
+    raise UnsupportedLocatorError(f"Unbalanced parentheses: {text}")
+
+
+def _state_attribute(matcher: str) -> str:
+    # UiSelector uses camelCase, the UiAutomator2 page source uses kebab-case
+    return re.sub(r"([A-Z])", lambda match: f"-{match.group(1).lower()}", matcher)
+
+
+class PageSnapshot:
+    """Parsed page source used to resolve many locators with one round-trip."""
+
+    def __init__(self, page_source: str):
+        self.root = ElementTree.fromstring(page_source.encode("utf-8"))
+
+    @classmethod
+    def from_element(cls, root: ElementTree.Element) -> "PageSnapshot":
+        """Snapshot over an already parsed tree (or subtree), without copying it."""
+        snapshot = cls.__new__(cls)
+        snapshot.root = root
+        return snapshot
+
+    @staticmethod
+    def bounds(element: ElementTree.Element) -> Tuple[int, int, int, int]:
+        """`(left, top, right, bottom)` from an element's `bounds` attribute."""
+        left, top, right, bottom = (
+            int(n) for n in re.findall(r"-?\d+", element.get("bounds", "[0,0][0,0]"))
+        )
+        return left, top, right, bottom
+
+    @staticmethod
+    def requires_scroll(locator) -> bool:
+        by, value = locator
+        return by == AppiumBy.ANDROID_UIAUTOMATOR and "scrollIntoView" in value
+
+    def find_all(self, locator) -> List[ElementTree.Element]:
+        by, value = locator
+        if by == AppiumBy.ACCESSIBILITY_ID:
+            return [
+                element
+                for element in self.root.iter()
+                if element.get("content-desc") == value
+            ]
+        if by == AppiumBy.ID:
+            return [
+                element
+                for element in self.root.iter()
+                if element.get("resource-id") == value
+            ]
+        if by == AppiumBy.CLASS_NAME:
+            return [element for element in self.root.iter() if element.tag == value]
+        if by == AppiumBy.XPATH:
+            return self._find_by_xpath(value)
+        if by == AppiumBy.ANDROID_UIAUTOMATOR:
+            return UiSelector(value).find_all(self.root)
+        raise UnsupportedLocatorError(f"Unsupported locator strategy: {by}")
+
+    def _find_by_xpath(self, xpath: str) -> List[ElementTree.Element]:
+        if not xpath.startswith("//"):
+            raise UnsupportedLocatorError(
+                f"Only descendant XPath is supported: {xpath}"
+            )
+        try:
+            return self.root.findall(f".{xpath}")
+        except SyntaxError as e:
+            raise UnsupportedLocatorError(f"Unsupported XPath {xpath}: {e}")
+
+    def find(self, locator) -> Optional[ElementTree.Element]:
+        elements = self.find_all(locator)
+        return elements[0] if elements else None
+
+    def is_visible(self, locator) -> bool:
+        element = self.find(locator)
+        return element is not None and element.get("displayed", "true") == "true"
+
+    def resolve(
+        self, locators: List[tuple]
+    ) -> Dict[tuple, Optional[ElementTree.Element]]:
+        return {locator: self.find(locator) for locator in locators}
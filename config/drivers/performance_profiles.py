@@ -0,0 +1,49 @@
+from config.drivers import Dict, Path, json, jsonschema, os
+from config.dto import PerformanceProfileDto
+
+CONFIG_FILES = Path(__file__).parent.parent / "config_files"
+PROFILES_PATH = CONFIG_FILES / "performance_profiles.json"
+SCHEMA_PATH = CONFIG_FILES / "performance_profiles.schema.json"
+PROFILE_ENV = "SWAG_LABS_PROFILE"
+
+
+class PerformanceProfiles:
+    """Named sets of speed-related Appium capabilities and settings.
+
+    Profiles live in `performance_profiles.json` and are validated against
+    `performance_profiles.schema.json` on load, so a misspelled capability
+    or setting fails before a session is requested.
+    """
+
+    def __init__(self, path: Path = PROFILES_PATH, schema_path: Path = SCHEMA_PATH):
+        self.path = Path(path)
+        self.schema_path = Path(schema_path)
+
+    def load(self) -> Dict[str, PerformanceProfileDto]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            with open(self.schema_path, "r", encoding="utf-8") as file:
+                schema = json.load(file)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in performance profiles: {str(e)}")
+        try:
+            jsonschema.validate(data, schema)
+        except jsonschema.ValidationError as e:
+            location = "/".join(str(part) for part in e.absolute_path)
+            raise ValueError(f"Invalid performance profile at {location}: {e.message}")
+        return {
+            name: PerformanceProfileDto(name=name, **profile)
+            for name, profile in data.items()
+        }
+
+    def get(self, name: str) -> PerformanceProfileDto:
+        """Profile `name`, unless the `SWAG_LABS_PROFILE` variable names another."""
+        name = os.environ.get(PROFILE_ENV) or name
+        profiles = self.load()
+        if name not in profiles:
+            raise ValueError(
+                f"Unknown performance profile '{name}', expected one of: "
+                f"{', '.join(profiles)}"
+            )
+        return profiles[name]
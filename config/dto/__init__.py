@@ -1,4 +1,39 @@
+from config.dto.batch_action import BatchAction
+from config.dto.batch_action_dto import BatchActionDto
+from config.dto.batch_result_dto import BatchResultDto
+from config.dto.benchmark_result_dto import BenchmarkResultDto
+from config.dto.cassette_interaction_dto import CassetteInteractionDto
+from config.dto.checkpoint_dto import CheckpointDto
+from config.dto.command_record_dto import CommandRecordDto
 from config.dto.desired_capabilities_dto import DesiredCapabilitiesDto
 from config.dto.direction import Direction
+from config.dto.fake_app_script_dto import FakeAppScriptDto
+from config.dto.locator_validation_dto import LocatorValidationDto
+from config.dto.logging_config_dto import LoggingConfigDto
+from config.dto.performance_profile_dto import PerformanceProfileDto
+from config.dto.product_card_dto import ProductCardDto
+from config.dto.scenario_dto import ScenarioDto
+from config.dto.screen import Screen
+from config.dto.screen_transition_dto import ScreenTransitionDto
+from config.dto.worker_dto import WorkerDto
 
-__all__ = ["DesiredCapabilitiesDto", "Direction"]
+__all__ = [
+    "BatchAction",
+    "BatchActionDto",
+    "BatchResultDto",
+    "BenchmarkResultDto",
+    "CassetteInteractionDto",
+    "CheckpointDto",
+    "CommandRecordDto",
+    "DesiredCapabilitiesDto",
+    "Direction",
+    "FakeAppScriptDto",
+    "LocatorValidationDto",
+    "LoggingConfigDto",
+    "PerformanceProfileDto",
+    "ProductCardDto",
+    "ScenarioDto",
+    "Screen",
+    "ScreenTransitionDto",
+    "WorkerDto",
+]
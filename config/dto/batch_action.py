@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class BatchAction(Enum):
+    LOCATE = "locate"
+    CLEAR = "clear"
+    TYPE = "type"
+    TAP = "tap"
+    SWIPE = "swipe"
+    TEXT = "text"
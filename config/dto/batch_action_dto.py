@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from config.dto.batch_action import BatchAction
+from config.dto.direction import Direction
+
+
+@dataclass
+class BatchActionDto:
+    action: BatchAction
+    locator: Tuple[str, str]
+    text: Optional[str] = None
+    direction: Optional[Direction] = None
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from config.dto.batch_action import BatchAction
+
+
+@dataclass
+class BatchResultDto:
+    action: BatchAction
+    locator: Tuple[str, str]
+    success: bool
+    value: Optional[str] = None
+    error: Optional[str] = None
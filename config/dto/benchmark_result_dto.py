@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class BenchmarkResultDto:
+    name: str
+    rounds: int
+    median: float
+    p95: float
+    minimum: float
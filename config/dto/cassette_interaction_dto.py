@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CassetteInteractionDto:
+    method: str
+    path: str
+    digest: str
+    status: int
+    response: Any
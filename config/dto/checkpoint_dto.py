@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class CheckpointDto:
+    checkpoint_id: str
+    depth: int
+    scenarios: int
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class CommandRecordDto:
+    operation: str
+    strategy: Optional[str]
+    locator: Optional[str]
+    duration: float
+    wait_time: float
+    server_time: float
+    polls: int
+    success: bool
+    timestamp: float
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -14,3 +15,11 @@ class DesiredCapabilitiesDto:
     newCommandTimeout: int
     autoGrantPermissions: bool
     headless: bool = True
+    # Name in performance_profiles.json
+    performanceProfile: str = "balanced"
+    udid: Optional[str] = None
+    systemPort: Optional[int] = None
+    # The device already has `app`: start it by package and activity instead
+    appInstalled: bool = False
+    skipServerInstallation: bool = False
+    skipDeviceInitialization: bool = False
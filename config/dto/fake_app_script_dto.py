@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass
+class FakeAppScriptDto:
+    start: str
+    screens: Dict[str, str]
+    transitions: List[Dict[str, Any]] = field(default_factory=list)
+    variables: Dict[str, int] = field(default_factory=dict)
+    activity: str = ""
+    latency: float = 0.0
+    jitter: float = 0.0
+    seed: int = 0
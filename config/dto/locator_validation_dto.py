@@ -0,0 +1,9 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+
+@dataclass
+class LocatorValidationDto:
+    library: List[str]
+    screens: Dict[str, List[str]]
+    unrecorded: List[str] = field(default_factory=list)
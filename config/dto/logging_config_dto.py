@@ -0,0 +1,8 @@
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass
+class LoggingConfigDto:
+    level: str = "INFO"
+    subsystems: Dict[str, str] = field(default_factory=dict)
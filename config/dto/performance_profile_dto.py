@@ -0,0 +1,10 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+
+@dataclass
+class PerformanceProfileDto:
+    name: str
+    capabilities: Dict[str, Any] = field(default_factory=dict)
+    settings: Dict[str, Any] = field(default_factory=dict)
+    description: str = ""
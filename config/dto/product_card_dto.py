@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass
+class ProductCardDto:
+    name: str
+    bounds: Tuple[int, int, int, int]
+    # Center of the ADD TO CART / REMOVE button, which keeps its place when toggled
+    button: Tuple[int, int]
+    in_cart: bool
@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+
+@dataclass
+class ScenarioDto:
+    location: str
+    name: str
+    tags: List[str] = field(default_factory=list)
+    steps: List[str] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        """Stable identifier that survives line shifts inside the feature file."""
+        feature_file = Path(self.location.rsplit(":", 1)[0]).name
+        return f"{feature_file}::{self.name}"
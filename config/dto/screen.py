@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class Screen(Enum):
+    LOGIN = "Login"
+    PRODUCTS = "Products"
+    CART = "Cart"
+    CHECKOUT_INFORMATION = "Checkout"
+    CHECKOUT_OVERVIEW = "Checkout: Overview"
+    CHECKOUT_COMPLETE = "Checkout: Complete"
+    MENU = "Menu"
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from config.dto.screen import Screen
+
+
+@dataclass
+class ScreenTransitionDto:
+    source: Screen
+    target: Screen
+    locator: Tuple[str, str]
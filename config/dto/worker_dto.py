@@ -0,0 +1,43 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+APPIUM_PORT_ENV = "SWAG_LABS_APPIUM_PORT"
+SYSTEM_PORT_ENV = "SWAG_LABS_SYSTEM_PORT"
+EMULATOR_PORT_ENV = "SWAG_LABS_EMULATOR_PORT"
+WORKER_ID_ENV = "SWAG_LABS_WORKER_ID"
+
+
+@dataclass
+class WorkerDto:
+    worker_id: int
+    appium_port: int
+    system_port: int
+    emulator_port: int
+
+    @property
+    def appium_server_url(self) -> str:
+        return f"http://127.0.0.1:{self.appium_port}"
+
+    @property
+    def udid(self) -> str:
+        return f"emulator-{self.emulator_port}"
+
+    def to_env(self) -> Dict[str, str]:
+        return {
+            WORKER_ID_ENV: str(self.worker_id),
+            APPIUM_PORT_ENV: str(self.appium_port),
+            SYSTEM_PORT_ENV: str(self.system_port),
+            EMULATOR_PORT_ENV: str(self.emulator_port),
+        }
+
+    @classmethod
+    def from_env(cls) -> Optional["WorkerDto"]:
+        if WORKER_ID_ENV not in os.environ:
+            return None
+        return cls(
+            worker_id=int(os.environ[WORKER_ID_ENV]),
+            appium_port=int(os.environ[APPIUM_PORT_ENV]),
+            system_port=int(os.environ[SYSTEM_PORT_ENV]),
+            emulator_port=int(os.environ[EMULATOR_PORT_ENV]),
+        )
@@ -0,0 +1,61 @@
+import argparse
+import base64
+import fnmatch
+import gzip
+import hashlib
+import json
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+from xml.etree import ElementTree
+
+from config.utils.logger import Logger
+
+__all__ = [
+    "argparse",
+    "base64",
+    "fnmatch",
+    "gzip",
+    "hashlib",
+    "json",
+    "os",
+    "platform",
+    "random",
+    "re",
+    "subprocess",
+    "sys",
+    "threading",
+    "time",
+    "uuid",
+    "ABC",
+    "abstractmethod",
+    "replace",
+    "BaseHTTPRequestHandler",
+    "ThreadingHTTPServer",
+    "Path",
+    "Any",
+    "Callable",
+    "Dict",
+    "List",
+    "Optional",
+    "Tuple",
+    "Union",
+    "HTTPError",
+    "Request",
+    "urlopen",
+    "ElementTree",
+    "Logger",
+]
@@ -0,0 +1,160 @@
+from config.drivers.mobile_driver import MobileDriver
+from config.drivers.mobile_driver_factory import MobileDriverFactory
+from config.dto import DesiredCapabilitiesDto
+from config.infrastructure import (
+    List,
+    Logger,
+    Optional,
+    Path,
+    Union,
+    json,
+    os,
+    re,
+    replace,
+    subprocess,
+)
+from config.utils.file_hash import sha256_file
+
+SERVER_PACKAGE = "io.appium.uiautomator2.server"
+SETTINGS_PACKAGE = "io.appium.settings"
+
+
+class AppInstallCache:
+    """Skips the install steps of a session that the device does not need.
+
+    The app counts as installed when the device's base APK for `appPackage`
+    has the same SHA-256 as the local APK, which pins its version and
+    signature too. The session then starts it by package and activity
+    instead of installing `app`. The UiAutomator2 server install is skipped
+    when the device has the server version bundled with the Appium driver,
+    and device initialization when the Appium Settings app is installed.
+    Anything that cannot be checked (no adb, several devices and no serial,
+    no `sha256sum` on old images) keeps the full install.
+    """
+
+    def __init__(
+        self, serial: Optional[str] = None, appium_home: Optional[Path] = None
+    ):
+        self.serial = serial
+        self.appium_home = Path(
+            appium_home or os.environ.get("APPIUM_HOME") or Path.home() / ".appium"
+        )
+        self.logger = Logger.get_logger(__name__)
+
+    def _adb(self, *args: str, timeout: float = 30) -> str:
+        serial = ["-s", self.serial] if self.serial else []
+        try:
+            result = subprocess.run(
+                ["adb", *serial, *args],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            self.logger.warning("adb %s failed: %s", " ".join(args), e)
+            return ""
+        return result.stdout.strip() if result.returncode == 0 else ""
+
+    def installed_apk_sha256(self, package: str) -> Optional[str]:
+        paths = [
+            line.split(":", 1)[1]
+            for line in self._adb("shell", "pm", "path", package).splitlines()
+            if line.startswith("package:")
+        ]
+        # Split APKs are never byte-identical to a single local APK
+        if len(paths) != 1:
+            return None
+        output = self._adb("shell", "sha256sum", paths[0])
+        return output.split()[0] if output else None
+
+    def installed_version(self, package: str) -> Optional[str]:
+        output = self._adb("shell", "dumpsys", "package", package)
+        match = re.search(r"versionName=(\S+)", output)
+        return match.group(1) if match else None
+
+    def installed_packages(self, prefix: str) -> List[str]:
+        output = self._adb("shell", "pm", "list", "packages", prefix)
+        return [
+            line.split(":", 1)[1].strip()
+            for line in output.splitlines()
+            if line.startswith("package:")
+        ]
+
+    def bundled_server_version(self) -> Optional[str]:
+        """Version of the UiAutomator2 server shipped with the installed driver."""
+        modules = self.appium_home / "node_modules"
+        for package_json in (
+            modules
+            / "appium-uiautomator2-driver"
+            / "node_modules"
+            / "appium-uiautomator2-server"
+            / "package.json",
+            modules / "appium-uiautomator2-server" / "package.json",
+        ):
+            try:
+                return json.loads(package_json.read_text(encoding="utf-8"))["version"]
+            except (OSError, ValueError, KeyError):
+                continue
+        return None
+
+    def is_app_installed(self, apk_path: Union[str, Path], package: str) -> bool:
+        apk_path = Path(apk_path)
+        if not apk_path.exists():
+            return False
+        installed = self.installed_apk_sha256(package)
+        return installed is not None and installed == sha256_file(apk_path)
+
+    def is_server_installed(self) -> bool:
+        packages = self.installed_packages(SERVER_PACKAGE)
+        if f"{SERVER_PACKAGE}.test" not in packages or SERVER_PACKAGE not in packages:
+            return False
+        bundled = self.bundled_server_version()
+        return bundled is not None and self.installed_version(SERVER_PACKAGE) == bundled
+
+    def is_device_initialized(self) -> bool:
+        return SETTINGS_PACKAGE in self.installed_packages(SETTINGS_PACKAGE)
+
+    def apply(self, capabilities: DesiredCapabilitiesDto) -> DesiredCapabilitiesDto:
+        """Return a copy of `capabilities` that skips every safe install step."""
+        if capabilities.platformName.lower() != "android" or capabilities.fullReset:
+            return capabilities
+        app_installed = self.is_app_installed(capabilities.app, capabilities.appPackage)
+        server_installed = self.is_server_installed()
+        device_initialized = self.is_device_initialized()
+        self.logger.info(
+            "Install cache for %s: app %s, server %s, device %s",
+            self.serial or "default device",
+            (
+                f"installed ({self.installed_version(capabilities.appPackage)})"
+                if app_installed
+                else "needs install"
+            ),
+            "installed" if server_installed else "needs install",
+            "initialized" if device_initialized else "needs initialization",
+        )
+        return replace(
+            capabilities,
+            appInstalled=app_installed or capabilities.appInstalled,
+            skipServerInstallation=(
+                server_installed or capabilities.skipServerInstallation
+            ),
+            skipDeviceInitialization=(
+                device_initialized or capabilities.skipDeviceInitialization
+            ),
+        )
+
+    def create_driver(
+        self, capabilities: DesiredCapabilitiesDto, appium_server_url: str
+    ) -> MobileDriver:
+        """Create a session that skips the install steps `apply` allows.
+
+        Falls back to the full install when the device rejects that session.
+        """
+        cached = self.apply(capabilities)
+        if cached == capabilities:
+            return MobileDriverFactory.create_driver(capabilities, appium_server_url)
+        try:
+            return MobileDriverFactory.create_driver(cached, appium_server_url)
+        except RuntimeError as e:
+            self.logger.warning("Session without installs failed, retrying: %s", e)
+            return MobileDriverFactory.create_driver(capabilities, appium_server_url)
@@ -0,0 +1,188 @@
+from config.infrastructure import (
+    Any,
+    Dict,
+    HTTPError,
+    List,
+    Optional,
+    Path,
+    Request,
+    Tuple,
+    argparse,
+    json,
+    os,
+    sys,
+    threading,
+    urlopen,
+)
+from config.infrastructure.cassette import Cassette
+from config.infrastructure.local_webdriver_server import (
+    LocalWebDriverServer,
+    WebDriverError,
+)
+
+# Cassette paths for behave runs (see environment.before_all)
+RECORD_ENV = "SWAG_LABS_RECORD"
+REPLAY_ENV = "SWAG_LABS_REPLAY"
+STATUS_PAYLOAD = json.dumps(
+    {"value": {"ready": True, "message": "Cassette server is ready"}}
+).encode("utf-8")
+
+
+class CassetteServer(LocalWebDriverServer):
+    """Local WebDriver endpoint backed by a `Cassette`.
+
+    Subclasses decide how a command is answered.
+    """
+
+    THREAD_NAME = "cassette-server"
+
+    def __init__(self, cassette_path: Path, port: int = 0):
+        super().__init__(port)
+        self.cassette_path = Path(cassette_path)
+
+
+class RecordingProxy(CassetteServer):
+    """Forwards every command to Appium and records it into a cassette.
+
+    The cassette is written on `stop()`.
+    """
+
+    def __init__(
+        self,
+        cassette_path: Path,
+        upstream_url: str = "http://127.0.0.1:4723",
+        port: int = 0,
+    ):
+        super().__init__(cassette_path, port)
+        self.upstream_url = upstream_url.rstrip("/")
+        self.cassette = Cassette()
+
+    def start(self):
+        super().start()
+        self.logger.info(
+            "Recording %s -> %s into %s",
+            self.url,
+            self.upstream_url,
+            self.cassette_path,
+        )
+
+    def stop(self):
+        super().stop()
+        self.cassette.save(self.cassette_path)
+        self.logger.info(
+            "Cassette saved: %s (%s commands)",
+            self.cassette_path,
+            len(self.cassette.interactions),
+        )
+
+    def handle(self, method: str, path: str, raw_body: bytes) -> Tuple[int, bytes]:
+        request = Request(
+            self.upstream_url + path,
+            data=raw_body if method != "GET" else None,
+            method=method,
+            headers={"Content-Type": "application/json; charset=utf-8"},
+        )
+        try:
+            with urlopen(request) as response:
+                status, payload = response.status, response.read()
+        except HTTPError as e:
+            status, payload = e.code, e.read()
+        if path != "/status":
+            self.cassette.record(
+                method,
+                path,
+                _json_or_none(raw_body),
+                status,
+                _json_or_none(payload),
+            )
+        return status, payload
+
+
+class ReplayServer(CassetteServer):
+    """Serves a recorded cassette back without Appium or a device.
+
+    A command missing from the cassette fails with an `unknown error`
+    response naming it, which points at the step or locator that changed.
+    """
+
+    def __init__(self, cassette_path: Path, port: int = 0, strict: bool = False):
+        super().__init__(cassette_path, port)
+        self.strict = strict
+        self.cassette = Cassette.load(self.cassette_path)
+        self.misses: List[str] = []
+
+    def start(self):
+        super().start()
+        self.logger.info(
+            "Replaying %s (%s commands) on %s",
+            self.cassette_path,
+            len(self.cassette.interactions),
+            self.url,
+        )
+
+    def stop(self):
+        super().stop()
+        if self.misses:
+            self.logger.warning(
+                "%s commands were not in the cassette, first: %s",
+                len(self.misses),
+                self.misses[0],
+            )
+
+    def handle(self, method: str, path: str, raw_body: bytes) -> Tuple[int, bytes]:
+        if path == "/status":
+            return 200, STATUS_PAYLOAD
+        recorded = self.cassette.play(
+            method, path, _json_or_none(raw_body), self.strict
+        )
+        if recorded:
+            return recorded
+        command = f"{method} {path} {raw_body.decode('utf-8', 'replace')}".strip()
+        self.misses.append(command)
+        self.logger.error("No recorded response for %s", command)
+        raise WebDriverError("unknown error", f"No recorded response for {command}")
+
+
+def _json_or_none(raw: bytes) -> Any:
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw.decode("utf-8", "replace")
+
+
+def cassette_from_env() -> Dict[str, Path]:
+    """`{"record": path}` or `{"replay": path}` from the environment, or `{}`."""
+    modes = {"record": os.environ.get(RECORD_ENV), "replay": os.environ.get(REPLAY_ENV)}
+    return {mode: Path(path) for mode, path in modes.items() if path}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Record Appium traffic into a cassette or serve one from the command line."""
+    parser = argparse.ArgumentParser(description="Record or replay Appium traffic")
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+    record = subparsers.add_parser("record", help="Proxy Appium into a cassette")
+    record.add_argument("cassette", type=Path)
+    record.add_argument("--upstream", default="http://127.0.0.1:4723")
+    record.add_argument("--port", type=int, default=4724)
+    replay = subparsers.add_parser("replay", help="Serve a cassette")
+    replay.add_argument("cassette", type=Path)
+    replay.add_argument("--port", type=int, default=4723)
+    replay.add_argument("--strict", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.mode == "record":
+        server: CassetteServer = RecordingProxy(args.cassette, args.upstream, args.port)
+    else:
+        server = ReplayServer(args.cassette, args.port, args.strict)
+    server.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+from config.drivers.adaptive_wait import AdaptiveWait
+from config.infrastructure import (
+    List,
+    Logger,
+    Optional,
+    Path,
+    json,
+    platform,
+    subprocess,
+    time,
+    urlopen,
+)
+
+
+class AppiumServer:
+
+    def __init__(
+        self,
+        port: int = 4723,
+        log_file: Optional[Path] = None,
+        plugins: Optional[List[str]] = None,
+    ):
+        self.port = port
+        self.log_file = log_file or Path(f"reports/logs/appium_{port}.log")
+        # Enabled when installed, e.g. execute-driver for MobileDriver.run_batch
+        self.plugins = plugins or []
+        self._process: Optional[subprocess.Popen] = None
+        self.logger = Logger.get_logger(__name__)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def is_ready(self) -> bool:
+        try:
+            response = urlopen(f"{self.url}/status", timeout=2)
+            return response.status == 200
+        except Exception:
+            return False
+
+    def start(self):
+        if self.is_ready():
+            self.logger.info("Appium server already running on %s", self.url)
+            return
+
+        cmd = ["appium", "--port", str(self.port)]
+        plugins = [p for p in self.plugins if p in self.installed_plugins()]
+        if plugins:
+            cmd.append(f"--use-plugins={','.join(plugins)}")
+
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_file, "w", encoding="utf-8") as log:
+            self._process = subprocess.Popen(
+                cmd,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                shell=platform.system() == "Windows",
+            )
+        self.logger.info("Appium server starting on %s", self.url)
+
+    @staticmethod
+    def installed_plugins() -> List[str]:
+        try:
+            result = subprocess.run(
+                ["appium", "plugin", "list", "--installed", "--json"],
+                capture_output=True,
+                text=True,
+                timeout=30,
+                shell=platform.system() == "Windows",
+            )
+            return list(json.loads(result.stdout or "{}"))
+        except (subprocess.SubprocessError, OSError, ValueError):
+            return []
+
+    def wait_until_ready(self, timeout: float = 60, max_delay: float = 1) -> bool:
+        """Poll `/status` with exponential backoff up to `max_delay`."""
+        deadline = time.monotonic() + timeout
+        for delay in AdaptiveWait.intervals(max_delay):
+            if self.is_ready():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+        # Unreachable: the intervals never run out
+        return False
+
+    def stop(self):
+        if self._process is None:
+            return
+        try:
+            self._process.terminate()
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+        finally:
+            self._process = None
+            self.logger.info("Appium server on %s stopped", self.url)
@@ -0,0 +1,103 @@
+from config.dto import CassetteInteractionDto
+from config.infrastructure import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Path,
+    Tuple,
+    gzip,
+    hashlib,
+    json,
+    threading,
+)
+
+CASSETTE_VERSION = 1
+# Capabilities carry machine-specific paths (app, udid), so any session matches
+UNKEYED_BODY = {("POST", "/session")}
+
+
+class Cassette:
+    """Ordered WebDriver command/response pairs of one run, stored as gzip JSON.
+
+    Commands are keyed by method, path and a digest of the canonical JSON body.
+    On load every key is indexed to its responses in recorded order, so replay
+    is a dictionary lookup plus a cursor: the n-th occurrence of a command gets
+    the n-th recorded response. Once a key runs out, its last response repeats
+    (extra polls of a wait loop), unless the cassette is strict.
+    """
+
+    def __init__(self, interactions: Optional[List[CassetteInteractionDto]] = None):
+        self.interactions = interactions or []
+        self._lock = threading.Lock()
+        self._index: Dict[Tuple[str, str, str], List[Tuple[int, bytes]]] = {}
+        self._cursors: Dict[Tuple[str, str, str], int] = {}
+        for interaction in self.interactions:
+            self._add_to_index(interaction)
+
+    @staticmethod
+    def digest(method: str, path: str, body: Any) -> str:
+        if (method, path) in UNKEYED_BODY or not body:
+            return ""
+        canonical = json.dumps(body, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def load(cls, path: Path) -> "Cassette":
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(
+                f"Unsupported cassette version {data.get('version')} in {path}"
+            )
+        return cls([CassetteInteractionDto(**entry) for entry in data["interactions"]])
+
+    def save(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            interactions = [vars(interaction) for interaction in self.interactions]
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            json.dump(
+                {"version": CASSETTE_VERSION, "interactions": interactions},
+                file,
+                separators=(",", ":"),
+            )
+
+    def record(self, method: str, path: str, body: Any, status: int, response: Any):
+        interaction = CassetteInteractionDto(
+            method=method,
+            path=path,
+            digest=self.digest(method, path, body),
+            status=status,
+            response=response,
+        )
+        with self._lock:
+            self.interactions.append(interaction)
+            self._add_to_index(interaction)
+
+    def play(
+        self, method: str, path: str, body: Any, strict: bool = False
+    ) -> Optional[Tuple[int, bytes]]:
+        key = (method, path, self.digest(method, path, body))
+        with self._lock:
+            responses = self._index.get(key)
+            if not responses:
+                return None
+            position = self._cursors.get(key, 0)
+            if position >= len(responses):
+                if strict:
+                    return None
+                position = len(responses) - 1
+            self._cursors[key] = position + 1
+            return responses[position]
+
+    def rewind(self):
+        with self._lock:
+            self._cursors = {}
+
+    def _add_to_index(self, interaction: CassetteInteractionDto):
+        key = (interaction.method, interaction.path, interaction.digest)
+        # Encoded once here so replay never serializes
+        payload = json.dumps(interaction.response).encode("utf-8")
+        self._index.setdefault(key, []).append((interaction.status, payload))
@@ -0,0 +1,141 @@
+from config.drivers.adaptive_wait import AdaptiveWait
+from config.infrastructure import Logger, Optional, Path, subprocess, time
+
+
+class Emulator:
+
+    def __init__(
+        self,
+        avd_name: str = "test_pixel_35",
+        port: int = 5554,
+        headless: bool = True,
+        read_only: bool = False,
+        snapshot: Optional[str] = None,
+        cold_boot: bool = False,
+    ):
+        self.avd_name = avd_name
+        self.port = port
+        self.headless = headless
+        self.read_only = read_only
+        # Quick-boot from this snapshot, left untouched on exit
+        self.snapshot = snapshot
+        self.cold_boot = cold_boot
+        self._process: Optional[subprocess.Popen] = None
+        self.logger = Logger.get_logger(__name__)
+
+    @property
+    def serial(self) -> str:
+        return f"emulator-{self.port}"
+
+    def _adb(self, *args: str, timeout: float = 10) -> str:
+        result = subprocess.run(
+            ["adb", "-s", self.serial, *args],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+        return result.stdout.strip()
+
+    @property
+    def launched(self) -> bool:
+        """True when this instance started the emulator process."""
+        return self._process is not None
+
+    def is_booted(self) -> bool:
+        try:
+            return self._adb("shell", "getprop", "sys.boot_completed") == "1"
+        except (subprocess.SubprocessError, OSError):
+            return False
+
+    def start(self):
+        if self.is_booted():
+            self.logger.info("Emulator %s already running", self.serial)
+            return
+
+        cmd = ["emulator", "-avd", self.avd_name, "-port", str(self.port)]
+        if self.headless:
+            cmd.extend(["-no-window", "-no-audio", "-no-boot-anim"])
+        if self.read_only:
+            # Required to run several instances of the same AVD side by side
+            cmd.append("-read-only")
+        if self.snapshot:
+            cmd.extend(["-snapshot", self.snapshot, "-no-snapshot-save"])
+        elif self.cold_boot:
+            cmd.append("-no-snapshot-load")
+
+        self._process = subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        self.logger.info(
+            "Emulator %s starting as %s (%s)",
+            self.avd_name,
+            self.serial,
+            f"snapshot '{self.snapshot}'" if self.snapshot else "default boot",
+        )
+
+    def wait_until_booted(self, timeout: float = 180, max_delay: float = 2) -> bool:
+        """Poll `sys.boot_completed` with exponential backoff up to `max_delay`."""
+        deadline = time.monotonic() + timeout
+        for delay in AdaptiveWait.intervals(max_delay):
+            if self.is_booted():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+        # Unreachable: the intervals never run out
+        return False
+
+    def install(self, apk_path: Path) -> bool:
+        """Install or update the APK with all runtime permissions granted."""
+        try:
+            output = self._adb("install", "-r", "-g", str(apk_path), timeout=300)
+        except (subprocess.SubprocessError, OSError) as e:
+            self.logger.error("Failed to install %s: %s", apk_path, e)
+            return False
+        if "Success" not in output:
+            self.logger.error("Failed to install %s: %s", apk_path, output)
+            return False
+        return True
+
+    def disable_animations(self):
+        for setting in (
+            "window_animation_scale",
+            "transition_animation_scale",
+            "animator_duration_scale",
+        ):
+            self._adb("shell", "settings", "put", "global", setting, "0")
+
+    def _console(self, *args: str, timeout: float = 120) -> bool:
+        """Run an emulator console command, True when the console answers OK."""
+        try:
+            output = self._adb("emu", *args, timeout=timeout)
+        except (subprocess.SubprocessError, OSError) as e:
+            self.logger.error("Emulator console command %s failed: %s", args, e)
+            return False
+        if "OK" not in output.splitlines():
+            self.logger.warning("Emulator console command %s: %s", args, output)
+            return False
+        return True
+
+    def save_snapshot(self, name: str) -> bool:
+        # Read-only instances reject this: snapshots are shared by the AVD
+        return self._console("avd", "snapshot", "save", name)
+
+    def load_snapshot(self, name: str) -> bool:
+        return self._console("avd", "snapshot", "load", name)
+
+    def delete_snapshot(self, name: str) -> bool:
+        return self._console("avd", "snapshot", "delete", name)
+
+    def stop(self):
+        try:
+            self._adb("emu", "kill")
+        except (subprocess.SubprocessError, OSError) as e:
+            self.logger.error("Failed to stop emulator %s: %s", self.serial, e)
+        if self._process is not None:
+            try:
+                self._process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+            self._process = None
+        self.logger.info("Emulator %s stopped", self.serial)
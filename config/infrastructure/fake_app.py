@@ -0,0 +1,233 @@
+from config.drivers.page_snapshot import PageSnapshot
+from config.dto import FakeAppScriptDto
+from config.infrastructure import (
+    Any,
+    Dict,
+    ElementTree,
+    List,
+    Optional,
+    Path,
+    fnmatch,
+    threading,
+)
+
+LAUNCHER_PACKAGE = "com.google.android.apps.nexuslauncher"
+LAUNCHER_ACTIVITY = ".NexusLauncherActivity"
+LAUNCHER_SOURCE = (
+    '<hierarchy index="0" class="hierarchy" rotation="0" width="1080" height="2400">'
+    f'<android.widget.FrameLayout index="0" package="{LAUNCHER_PACKAGE}" '
+    'class="android.widget.FrameLayout" text="" content-desc="Home" '
+    'bounds="[0,0][1080,2400]" displayed="true" />'
+    "</hierarchy>"
+)
+
+
+class NoSuchElementError(LookupError):
+    pass
+
+
+class StaleElementError(LookupError):
+    pass
+
+
+class FakeApp:
+    """Scripted stand-in for the app under test, driven by `FakeAppScriptDto`.
+
+    Each screen is a recorded-style UiAutomator2 page source. Clicks (and
+    swipes) on an element, or on anything inside it, fire the first matching
+    transition of the script, which may update integer variables (`set`,
+    `add`) and then show a screen (`to`, `push`, `stack` or `"@back"`). Screen
+    names are formatted with the variables, so `products_{cart}` follows the
+    cart size. Typed text is rendered into the page source and can gate a
+    transition through `when`.
+
+    Element ids encode the screen generation: any transition makes previously
+    returned elements stale, as on a real device.
+    """
+
+    def __init__(self, script: FakeAppScriptDto, script_dir: Path):
+        self.script = script
+        self._sources = {
+            name: (script_dir / file_name).read_text(encoding="utf-8")
+            for name, file_name in script.screens.items()
+        }
+        self._lock = threading.RLock()
+        self.installed = True
+        self.running = False
+        self.variables: Dict[str, int] = {}
+        self.stack: List[str] = []
+        self._typed: Dict[str, str] = {}
+        self._generation = 0
+        self._show([])
+
+    @property
+    def screen(self) -> Optional[str]:
+        return self.stack[-1] if self.stack else None
+
+    @property
+    def lock(self) -> threading.RLock:
+        return self._lock
+
+    def launch(self):
+        if not self.installed:
+            raise RuntimeError("App is not installed")
+        self.running = True
+        self.variables = dict(self.script.variables)
+        self._show([self.script.start])
+
+    def terminate(self) -> bool:
+        was_running = self.running
+        self.running = False
+        self._show([])
+        return was_running
+
+    def remove(self) -> bool:
+        self.terminate()
+        was_installed, self.installed = self.installed, False
+        return was_installed
+
+    def install(self):
+        self.installed = True
+
+    def state(self) -> int:
+        # ApplicationState: 0 not installed, 1 not running, 4 in foreground
+        if not self.installed:
+            return 0
+        return 4 if self.running else 1
+
+    def current_activity(self) -> str:
+        return self.script.activity if self.running else LAUNCHER_ACTIVITY
+
+    def show(self, screen: str):
+        """Jump straight to `screen`, skipping the scripted path to it."""
+        self.running = True
+        self._show([screen])
+
+    def page_source(self) -> str:
+        return ElementTree.tostring(
+            self._root, encoding="unicode", xml_declaration=True
+        )
+
+    def find(self, locator, parent_id: Optional[str] = None) -> List[str]:
+        root = self.element(parent_id) if parent_id else self._root
+        elements = PageSnapshot.from_element(root).find_all(locator)
+        return [self._element_id(element) for element in elements]
+
+    def element(self, element_id: str) -> ElementTree.Element:
+        generation, _, index = element_id.partition(".")
+        if not generation.isdigit() or not index.isdigit():
+            raise NoSuchElementError(f"Unknown element {element_id}")
+        if int(generation) != self._generation:
+            raise StaleElementError(f"Element {element_id} is no longer attached")
+        if int(index) >= len(self._elements):
+            raise NoSuchElementError(f"Unknown element {element_id}")
+        return self._elements[int(index)]
+
+    def click(self, element_id: str):
+        self._fire("click", self.element(element_id))
+
+    def tap(self, x: int, y: int):
+        """Click the topmost (last drawn) element whose bounds contain the point."""
+        hits = [
+            element
+            for element in self._elements
+            if _contains(PageSnapshot.bounds(element), x, y)
+        ]
+        if hits:
+            self._fire("click", hits[-1])
+
+    def swipe(self, element_id: str):
+        self._fire("swipe", self.element(element_id))
+
+    def clear(self, element_id: str):
+        element = self.element(element_id)
+        self._typed[self._input_key(element)] = ""
+        element.set("text", self._hints.get(element, ""))
+
+    def type_text(self, element_id: str, text: str):
+        element = self.element(element_id)
+        key = self._input_key(element)
+        self._typed[key] = self._typed.get(key, "") + text
+        element.set("text", self._typed[key])
+
+    def _show(self, stack: List[str], keep_input: bool = False):
+        for name in stack:
+            if name not in self._sources:
+                raise ValueError(f"Script has no screen named '{name}'")
+        self.stack = stack
+        if not keep_input:
+            self._typed = {}
+        source = self._sources[stack[-1]] if stack else LAUNCHER_SOURCE
+        self._generation += 1
+        self._root = ElementTree.fromstring(source.encode("utf-8"))
+        self._elements = list(self._root.iter())
+        self._index = {element: index for index, element in enumerate(self._elements)}
+        self._parents = {child: parent for parent in self._elements for child in parent}
+        self._hints = {element: element.get("text", "") for element in self._elements}
+        for element in self._elements:
+            typed = self._typed.get(self._input_key(element))
+            if typed:
+                element.set("text", typed)
+
+    def _element_id(self, element: ElementTree.Element) -> str:
+        return f"{self._generation}.{self._index[element]}"
+
+    def _input_key(self, element: ElementTree.Element) -> str:
+        return (
+            element.get("content-desc")
+            or element.get("resource-id")
+            or f"#{self._index[element]}"
+        )
+
+    def _fire(self, action: str, element: ElementTree.Element):
+        targets = [element]
+        while targets[-1] in self._parents:
+            targets.append(self._parents[targets[-1]])
+        for transition in self.script.transitions:
+            if action not in transition or not self._from_matches(transition):
+                continue
+            if not any(self._attributes_match(transition[action], t) for t in targets):
+                continue
+            expected = transition.get("when", {})
+            if any(
+                self._typed.get(key, "") != value for key, value in expected.items()
+            ):
+                continue
+            self._apply(transition)
+            return
+
+    def _from_matches(self, transition: Dict[str, Any]) -> bool:
+        patterns = transition.get("from", "*")
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        return self.screen is not None and any(
+            fnmatch.fnmatchcase(self.screen, pattern) for pattern in patterns
+        )
+
+    @staticmethod
+    def _attributes_match(expected: Dict[str, str], element) -> bool:
+        return all(element.get(key) == value for key, value in expected.items())
+
+    def _apply(self, transition: Dict[str, Any]):
+        for name, value in transition.get("set", {}).items():
+            self.variables[name] = value
+        for name, delta in transition.get("add", {}).items():
+            self.variables[name] = self.variables.get(name, 0) + delta
+
+        if "push" in transition:
+            stack = self.stack + [self._format(transition["push"])]
+        elif "stack" in transition:
+            stack = [self._format(name) for name in transition["stack"]]
+        elif transition.get("to") == "@back":
+            stack = self.stack[:-1] or self.stack
+        else:
+            stack = [self._format(transition["to"])]
+        self._show(stack, keep_input=transition.get("keep_input", False))
+
+    def _format(self, screen_name: str) -> str:
+        return screen_name.format(**self.variables)
+
+
+def _contains(bounds, x: int, y: int) -> bool:
+    left, top, right, bottom = bounds
+    return left <= x < right and top <= y < bottom
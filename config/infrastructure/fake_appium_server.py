@@ -0,0 +1,356 @@
+from config.drivers.mobile_driver import ELEMENT_KEY
+from config.drivers.page_snapshot import PageSnapshot
+from config.dto import FakeAppScriptDto
+from config.infrastructure import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Path,
+    Tuple,
+    argparse,
+    base64,
+    json,
+    os,
+    random,
+    re,
+    sys,
+    threading,
+    time,
+    uuid,
+)
+from config.infrastructure.fake_app import (
+    LAUNCHER_PACKAGE,
+    FakeApp,
+    NoSuchElementError,
+    StaleElementError,
+)
+from config.infrastructure.local_webdriver_server import (
+    LocalWebDriverServer,
+    WebDriverError,
+)
+from config.utils.data_provider import DataProvider
+
+DEFAULT_SCRIPT_PATH = (
+    Path(__file__).parent.parent / "config_files" / "fake_app" / "script.json"
+)
+# Set to a script path (or "1" for the default script) to run behave offline
+FAKE_APPIUM_ENV = "SWAG_LABS_FAKE_APPIUM"
+# 1x1 transparent PNG, enough for failure screenshots and Allure attachments
+SCREENSHOT_PNG = base64.b64encode(
+    bytes.fromhex(
+        "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+        "1f15c4890000000d49444154789c6360000002000005000157e32a9a00"
+        "00000049454e44ae426082"
+    )
+).decode("ascii")
+
+
+class FakeAppiumServer(LocalWebDriverServer):
+    """Local W3C WebDriver endpoint serving a scripted `FakeApp`.
+
+    Implements the commands `AndroidMobileDriver` sends (sessions, element
+    lookup and interaction, page source, screenshots, app lifecycle and the
+    `mobile:` extensions it uses), so drivers, screens and steps run end to
+    end without Appium or a device. Every command sleeps `latency` seconds
+    plus Gaussian `jitter` from a seeded generator, which keeps runs
+    reproducible.
+    """
+
+    THREAD_NAME = "fake-appium"
+
+    def __init__(
+        self,
+        script_path: Path = DEFAULT_SCRIPT_PATH,
+        port: int = 4723,
+        latency: Optional[float] = None,
+        jitter: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        self.script: FakeAppScriptDto = DataProvider.get_data(
+            str(script_path), FakeAppScriptDto
+        )
+        super().__init__(port)
+        self.latency = self.script.latency if latency is None else latency
+        self.jitter = self.script.jitter if jitter is None else jitter
+        self.app = FakeApp(self.script, Path(script_path).parent)
+        self.sessions: Dict[str, Dict[str, Any]] = {}
+        self.settings: Dict[str, Any] = {}
+        self._random = random.Random(self.script.seed if seed is None else seed)
+
+    def start(self):
+        super().start()
+        self.logger.info("Fake Appium server listening on %s", self.url)
+
+    def stop(self):
+        if self._httpd is None:
+            return
+        super().stop()
+        self.logger.info("Fake Appium server on %s stopped", self.url)
+
+    def handle(self, method: str, path: str, raw_body: bytes) -> Tuple[int, bytes]:
+        self.delay()
+        body = json.loads(raw_body) if raw_body else {}
+        value = self.dispatch(method, path, body)
+        return 200, json.dumps({"value": value}).encode("utf-8")
+
+    def delay(self):
+        with self.app.lock:
+            seconds = self.latency + self._random.gauss(0, self.jitter)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def dispatch(self, method: str, path: str, body: Dict[str, Any]) -> Any:
+        if method == "GET" and path == "/status":
+            return {"ready": True, "message": "Fake Appium server is ready"}
+        if method == "POST" and path == "/session":
+            return self._new_session(body)
+
+        match = re.fullmatch(r"/session/([^/]+)(/.*)?", path)
+        if not match:
+            raise WebDriverError("unknown command", f"{method} {path}")
+        session_id, command = match.group(1), match.group(2) or ""
+        if session_id not in self.sessions:
+            raise WebDriverError("invalid session id", session_id)
+        if method == "DELETE" and command == "":
+            del self.sessions[session_id]
+            return None
+        if method == "GET" and command == "":
+            return self.sessions[session_id]
+
+        for route_method, pattern, handler in _ROUTES:
+            route = re.fullmatch(pattern, command)
+            if route_method == method and route:
+                with self.app.lock:
+                    return handler(self, body, *route.groups())
+        raise WebDriverError("unknown command", f"{method} {command}")
+
+    def _new_session(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        requested = body.get("capabilities", {}).get("alwaysMatch", {})
+        capabilities = {
+            key.split(":", 1)[-1]: value for key, value in requested.items()
+        }
+        session_id = uuid.uuid4().hex
+        self.sessions[session_id] = capabilities
+        with self.app.lock:
+            self.app.install()
+            self.app.launch()
+        return {"sessionId": session_id, "capabilities": capabilities}
+
+    def _find(self, body: Dict[str, Any], parent_id: Optional[str] = None, many=False):
+        locator = (body.get("using"), body.get("value"))
+        if parent_id:
+            _element(self, parent_id)
+        try:
+            element_ids = self.app.find(locator, parent_id)
+        except ValueError as e:
+            raise WebDriverError("invalid argument", str(e))
+        if many:
+            return [{ELEMENT_KEY: element_id} for element_id in element_ids]
+        if not element_ids:
+            raise WebDriverError("no such element", f"No element for {locator}")
+        return {ELEMENT_KEY: element_ids[0]}
+
+    def _execute(self, body: Dict[str, Any]) -> Any:
+        script = body.get("script", "")
+        args = (body.get("args") or [{}])[0] or {}
+        if script == "mobile: swipeGesture":
+            self.app.swipe(args["elementId"])
+            return False
+        if script in _APP_EXTENSIONS:
+            return _APP_EXTENSIONS[script](self, args)
+        raise WebDriverError("unknown method", f"Unsupported script: {script}")
+
+
+def _element(server: FakeAppiumServer, element_id: str):
+    try:
+        return server.app.element(element_id)
+    except StaleElementError as e:
+        raise WebDriverError("stale element reference", str(e))
+    except NoSuchElementError as e:
+        raise WebDriverError("no such element", str(e))
+
+
+def _rect(server: FakeAppiumServer, _, element_id: str) -> Dict[str, int]:
+    left, top, right, bottom = PageSnapshot.bounds(_element(server, element_id))
+    return {"x": left, "y": top, "width": right - left, "height": bottom - top}
+
+
+def _interact(action: str):
+    def handler(server: FakeAppiumServer, body: Dict[str, Any], element_id: str):
+        _element(server, element_id)
+        if action == "value":
+            server.app.type_text(element_id, body.get("text", ""))
+        else:
+            getattr(server.app, action)(element_id)
+
+    return handler
+
+
+def _activate(server: FakeAppiumServer, _):
+    if server.app.state() == 0:
+        raise WebDriverError("unknown error", "App is not installed")
+    if not server.app.running:
+        server.app.launch()
+
+
+_APP_EXTENSIONS = {
+    "mobile: activateApp": _activate,
+    "mobile: clickGesture": lambda server, args: server.app.tap(args["x"], args["y"]),
+    "mobile: terminateApp": lambda server, _: server.app.terminate(),
+    "mobile: clearApp": lambda server, _: server.app.terminate(),
+    "mobile: removeApp": lambda server, _: server.app.remove(),
+    "mobile: installApp": lambda server, _: server.app.install(),
+    "mobile: queryAppState": lambda server, _: server.app.state(),
+    "mobile: getCurrentActivity": lambda server, _: server.app.current_activity(),
+    "mobile: getCurrentPackage": lambda server, _: _current_package(server),
+}
+
+
+def _current_package(server: FakeAppiumServer) -> str:
+    if not server.app.running:
+        return LAUNCHER_PACKAGE
+    capabilities = next(iter(server.sessions.values()), {})
+    return capabilities.get("appPackage", "")
+
+
+_ELEMENT = r"/element/([^/]+)"
+_ROUTES = [
+    ("POST", r"/timeouts", lambda server, body: None),
+    ("GET", r"/timeouts", lambda server, body: {"implicit": 0}),
+    ("POST", r"/element", lambda server, body: server._find(body)),
+    ("POST", r"/elements", lambda server, body: server._find(body, many=True)),
+    (
+        "POST",
+        _ELEMENT + r"/element",
+        lambda server, body, element_id: server._find(body, element_id),
+    ),
+    (
+        "POST",
+        _ELEMENT + r"/elements",
+        lambda server, body, element_id: server._find(body, element_id, many=True),
+    ),
+    (
+        "GET",
+        _ELEMENT + r"/displayed",
+        lambda server, body, element_id: _element(server, element_id).get(
+            "displayed", "true"
+        )
+        == "true",
+    ),
+    (
+        "GET",
+        _ELEMENT + r"/enabled",
+        lambda server, body, element_id: _element(server, element_id).get(
+            "enabled", "true"
+        )
+        == "true",
+    ),
+    (
+        "GET",
+        _ELEMENT + r"/selected",
+        lambda server, body, element_id: _element(server, element_id).get(
+            "selected", "false"
+        )
+        == "true",
+    ),
+    (
+        "GET",
+        _ELEMENT + r"/text",
+        lambda server, body, element_id: _element(server, element_id).get("text", ""),
+    ),
+    (
+        "GET",
+        _ELEMENT + r"/name",
+        lambda server, body, element_id: _element(server, element_id).get("class"),
+    ),
+    (
+        "GET",
+        _ELEMENT + r"/attribute/([^/]+)",
+        lambda server, body, element_id, name: _element(server, element_id).get(
+            "content-desc" if name == "content-description" else name
+        ),
+    ),
+    ("GET", _ELEMENT + r"/rect", _rect),
+    ("POST", _ELEMENT + r"/click", _interact("click")),
+    ("POST", _ELEMENT + r"/clear", _interact("clear")),
+    ("POST", _ELEMENT + r"/value", _interact("value")),
+    ("GET", r"/source", lambda server, body: server.app.page_source()),
+    ("GET", r"/screenshot", lambda server, body: SCREENSHOT_PNG),
+    ("POST", r"/execute/sync", lambda server, body: server._execute(body)),
+    ("POST", r"/back", lambda server, body: None),
+    (
+        "POST",
+        r"/appium/settings",
+        lambda server, body: server.settings.update(body.get("settings", {})),
+    ),
+    ("GET", r"/appium/settings", lambda server, body: dict(server.settings)),
+    (
+        "POST",
+        r"/appium/device/activate_app",
+        lambda server, body: _activate(server, body),
+    ),
+    (
+        "POST",
+        r"/appium/device/terminate_app",
+        lambda server, body: server.app.terminate(),
+    ),
+    (
+        "POST",
+        r"/appium/device/remove_app",
+        lambda server, body: server.app.remove(),
+    ),
+    (
+        "POST",
+        r"/appium/device/install_app",
+        lambda server, body: server.app.install(),
+    ),
+    (
+        "POST",
+        r"/appium/device/app_state",
+        lambda server, body: server.app.state(),
+    ),
+    (
+        "GET",
+        r"/appium/device/current_activity",
+        lambda server, body: server.app.current_activity(),
+    ),
+    (
+        "GET",
+        r"/appium/device/current_package",
+        lambda server, body: _current_package(server),
+    ),
+]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Serve the scripted app until interrupted."""
+    parser = argparse.ArgumentParser(description="Run the fake Appium server")
+    parser.add_argument("--port", type=int, default=4723)
+    parser.add_argument("--script", type=Path, default=DEFAULT_SCRIPT_PATH)
+    parser.add_argument("--latency", type=float, default=None)
+    parser.add_argument("--jitter", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    server = FakeAppiumServer(
+        args.script, args.port, args.latency, args.jitter, args.seed
+    )
+    server.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+def script_from_env() -> Optional[Path]:
+    """Return the fake app script named by `SWAG_LABS_FAKE_APPIUM`, if any."""
+    value = os.environ.get(FAKE_APPIUM_ENV)
+    if not value:
+        return None
+    return DEFAULT_SCRIPT_PATH if value == "1" else Path(value)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+from config.dto import DesiredCapabilitiesDto
+from config.infrastructure import (
+    Dict,
+    List,
+    Logger,
+    Optional,
+    Path,
+    argparse,
+    json,
+    os,
+    sys,
+    time,
+)
+from config.infrastructure.emulator import Emulator
+from config.utils.data_provider import DataProvider
+from config.utils.file_hash import sha256_file
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DESIRED_CAPABILITIES_PATH = (
+    PROJECT_ROOT / "config" / "config_files" / "desired_capabilities.json"
+)
+APP_FOLDER = PROJECT_ROOT / "business" / "app"
+MANIFEST_NAME = "golden_snapshot.json"
+
+
+class GoldenSnapshot:
+    """Quick-boot snapshot of an AVD with the app ready to run.
+
+    The snapshot has the app installed, runtime permissions granted and
+    animations disabled. It is saved after a cold boot and loaded by later
+    boots (`-snapshot golden -no-snapshot-save`), so it is never overwritten
+    by a run. Read-only instances of the AVD, as used by parallel workers, all
+    boot from the same snapshot. A manifest next to the AVD records the APK hash
+    and the system image it was taken with, and the snapshot counts as
+    stale when either one changes.
+    """
+
+    NAME = "golden"
+
+    def __init__(self, avd_name: str, apk_path: Path):
+        self.avd_name = avd_name
+        self.apk_path = Path(apk_path)
+        self.logger = Logger.get_logger(__name__)
+
+    @property
+    def avd_dir(self) -> Path:
+        avd_home = Path(
+            os.environ.get("ANDROID_AVD_HOME")
+            or Path(os.environ.get("ANDROID_USER_HOME") or Path.home() / ".android")
+            / "avd"
+        )
+        # `<name>.ini` points at the AVD folder when it lives elsewhere
+        ini = avd_home / f"{self.avd_name}.ini"
+        if ini.exists():
+            for line in ini.read_text(encoding="utf-8").splitlines():
+                key, _, value = line.partition("=")
+                if key.strip() == "path" and value.strip():
+                    return Path(value.strip())
+        return avd_home / f"{self.avd_name}.avd"
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.avd_dir / MANIFEST_NAME
+
+    def fingerprint(self) -> Dict[str, Optional[str]]:
+        return {"apk_sha256": self._apk_sha256(), "system_image": self._system_image()}
+
+    def is_valid(self) -> bool:
+        if not (self.avd_dir / "snapshots" / self.NAME).is_dir():
+            return False
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        current = self.fingerprint()
+        stale = [key for key, value in current.items() if manifest.get(key) != value]
+        if stale:
+            self.logger.info(
+                "Golden snapshot of %s is stale: %s changed",
+                self.avd_name,
+                ", ".join(stale),
+            )
+        return not stale
+
+    def emulator(self, rebuild: bool = False, **kwargs) -> Emulator:
+        """Return an `Emulator` for the AVD that boots from the snapshot.
+
+        When the snapshot is not valid, it cold boots so the snapshot can be
+        retaken.
+        """
+        valid = not rebuild and self.is_valid()
+        return Emulator(
+            avd_name=self.avd_name,
+            snapshot=self.NAME if valid else None,
+            cold_boot=not valid,
+            **kwargs,
+        )
+
+    def ensure(self, emulator: Emulator) -> bool:
+        """Take the snapshot on an emulator this run cold-booted for it."""
+        if not emulator.cold_boot or emulator.read_only or not emulator.launched:
+            return False
+        return self.create(emulator)
+
+    def create(self, emulator: Emulator) -> bool:
+        """Prepare a booted emulator and save it as the golden snapshot."""
+        started = time.perf_counter()
+        if not self.apk_path.exists():
+            self.logger.error("APK not found, no golden snapshot: %s", self.apk_path)
+            return False
+        emulator.disable_animations()
+        if not emulator.install(self.apk_path):
+            return False
+        if not emulator.save_snapshot(self.NAME):
+            return False
+        manifest = {"snapshot": self.NAME, **self.fingerprint()}
+        self.manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        self.logger.info(
+            "Golden snapshot of %s saved in %.1fs",
+            self.avd_name,
+            time.perf_counter() - started,
+        )
+        return True
+
+    def _apk_sha256(self) -> Optional[str]:
+        if not self.apk_path.exists():
+            return None
+        return sha256_file(self.apk_path)
+
+    def _system_image(self) -> Optional[str]:
+        try:
+            config = (self.avd_dir / "config.ini").read_text(encoding="utf-8")
+        except OSError:
+            return None
+        for line in config.splitlines():
+            key, _, value = line.partition("=")
+            if key.strip() == "image.sysdir.1":
+                return value.strip()
+        return None
+
+
+def golden_from_capabilities() -> GoldenSnapshot:
+    """Return the golden snapshot for the AVD and APK in desired_capabilities.json."""
+    capabilities = DataProvider.get_data(
+        str(DESIRED_CAPABILITIES_PATH), DesiredCapabilitiesDto
+    )
+    return GoldenSnapshot(capabilities.deviceName, APP_FOLDER / capabilities.app)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Start, create or report on the golden snapshot from the command line."""
+    parser = argparse.ArgumentParser(description="Manage the golden AVD snapshot")
+    parser.add_argument("command", choices=["start", "create", "status"])
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Cold boot and retake the snapshot"
+    )
+    args = parser.parse_args(argv)
+    logger = Logger.get_logger(__name__)
+    golden = golden_from_capabilities()
+
+    if args.command == "status":
+        logger.info(
+            "Golden snapshot of %s: %s",
+            golden.avd_name,
+            "valid" if golden.is_valid() else "missing or stale",
+        )
+        return 0
+
+    emulator = golden.emulator(
+        rebuild=args.rebuild or args.command == "create", headless=args.headless
+    )
+    if emulator.is_booted():
+        logger.info("Emulator %s already running, stop it to boot", emulator.serial)
+        return 0 if args.command == "start" else 1
+
+    started = time.perf_counter()
+    emulator.start()
+    if not emulator.wait_until_booted():
+        logger.error("Emulator %s did not boot", emulator.serial)
+        return 1
+    logger.info(
+        "Emulator booted in %.1fs (%s)",
+        time.perf_counter() - started,
+        "golden snapshot" if emulator.snapshot else "cold boot",
+    )
+    created = golden.ensure(emulator)
+    if args.command == "create":
+        # A prepared image: the snapshot is all that is needed from this boot
+        emulator.stop()
+        return 0 if created else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
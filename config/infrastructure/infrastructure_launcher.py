@@ -0,0 +1,113 @@
+from config.infrastructure import (
+    Any,
+    Callable,
+    Dict,
+    Logger,
+    Optional,
+    threading,
+    time,
+)
+from config.infrastructure.appium_server import AppiumServer
+from config.infrastructure.emulator import Emulator
+from config.infrastructure.golden_snapshot import GoldenSnapshot
+
+
+class InfrastructureLauncher:
+    """Brings Appium and the emulator up concurrently, then creates the session.
+
+    Each service is started and polled for readiness (with backoff) on its own
+    thread, so the session is created as soon as the slower of the two is
+    ready. `timings` holds seconds since `launch()` when each phase finished.
+    With a `golden` snapshot, a cold-booted emulator is snapshotted before
+    the session starts, so later runs quick-boot from it.
+    """
+
+    def __init__(
+        self,
+        appium_server: AppiumServer,
+        emulator: Emulator,
+        appium_timeout: float = 60,
+        boot_timeout: float = 180,
+        golden: Optional[GoldenSnapshot] = None,
+    ):
+        self.appium_server = appium_server
+        self.emulator = emulator
+        self.appium_timeout = appium_timeout
+        self.boot_timeout = boot_timeout
+        self.golden = golden
+        self.timings: Dict[str, float] = {}
+        self.logger = Logger.get_logger(__name__)
+
+    def launch(self, create_driver: Callable[[str], Any]) -> Any:
+        """Start both services and return `create_driver(appium_url)`."""
+        started = time.perf_counter()
+        errors: Dict[str, Exception] = {}
+
+        def bring_up(name: str, start: Callable, wait: Callable[[], bool]):
+            try:
+                start()
+                if not wait():
+                    raise RuntimeError(f"{name} not ready")
+            except Exception as e:
+                errors[name] = e
+            finally:
+                self.timings[name] = time.perf_counter() - started
+
+        threads = [
+            threading.Thread(
+                target=bring_up,
+                args=(
+                    "appium",
+                    self.appium_server.start,
+                    lambda: self.appium_server.wait_until_ready(self.appium_timeout),
+                ),
+                name="appium-bring-up",
+                daemon=True,
+            ),
+            threading.Thread(
+                target=bring_up,
+                args=(
+                    "emulator",
+                    self.emulator.start,
+                    self._wait_until_booted,
+                ),
+                name="emulator-bring-up",
+                daemon=True,
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            for name, error in errors.items():
+                self.logger.error("Failed to bring up %s: %s", name, error)
+            raise RuntimeError(f"Infrastructure not ready: {', '.join(errors)}")
+
+        driver = create_driver(self.appium_server.url)
+        self.timings["session"] = time.perf_counter() - started
+        self.report()
+        return driver
+
+    def _wait_until_booted(self) -> bool:
+        if not self.emulator.wait_until_booted(self.boot_timeout):
+            return False
+        if self.golden:
+            self.golden.ensure(self.emulator)
+        return True
+
+    def report(self):
+        ready = max(self.timings["appium"], self.timings["emulator"])
+        self.logger.info(
+            "Startup: appium ready %.1fs, emulator booted %.1fs, "
+            "session %.1fs, total %.1fs (waited on %s)",
+            self.timings["appium"],
+            self.timings["emulator"],
+            self.timings["session"] - ready,
+            self.timings["session"],
+            max(("appium", "emulator"), key=self.timings.get),
+        )
+
+    def stop(self):
+        self.emulator.stop()
+        self.appium_server.stop()
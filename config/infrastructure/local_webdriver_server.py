@@ -0,0 +1,139 @@
+from config.infrastructure import (
+    ABC,
+    BaseHTTPRequestHandler,
+    Logger,
+    Optional,
+    ThreadingHTTPServer,
+    Tuple,
+    abstractmethod,
+    json,
+    threading,
+    time,
+    urlopen,
+)
+
+
+class WebDriverError(Exception):
+
+    STATUS = {
+        "invalid argument": 400,
+        "invalid session id": 404,
+        "no such element": 404,
+        "stale element reference": 404,
+        "unknown command": 404,
+        "unknown method": 405,
+        "unknown error": 500,
+    }
+
+    def __init__(self, error: str, message: str):
+        super().__init__(error, message)
+        self.error = error
+        self.message = message
+        self.status = self.STATUS[error]
+
+
+def error_payload(error: str, message: str) -> bytes:
+    """Encode a W3C WebDriver error response body."""
+    return json.dumps(
+        {"value": {"error": error, "message": message, "stacktrace": ""}}
+    ).encode("utf-8")
+
+
+class LocalWebDriverServer(ABC):
+    """WebDriver endpoint on 127.0.0.1 served from a background thread.
+
+    Same interface as `AppiumServer`. Subclasses answer each request in
+    `handle`; a `WebDriverError` becomes its W3C error response and any other
+    exception an `unknown error`.
+    """
+
+    THREAD_NAME = "webdriver-server"
+
+    def __init__(self, port: int = 0):
+        self.port = port
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.logger = Logger.get_logger(type(self).__module__)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def is_ready(self) -> bool:
+        try:
+            response = urlopen(f"{self.url}/status", timeout=2)
+            return response.status == 200
+        except Exception:
+            return False
+
+    def start(self):
+        if self._httpd is not None:
+            return
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", self.port), _handler(self))
+        self._httpd.daemon_threads = True
+        # Port 0 picks a free port
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name=self.THREAD_NAME, daemon=True
+        )
+        self._thread.start()
+
+    def wait_until_ready(self, timeout: float = 10, delay: float = 0.1) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.is_ready():
+                return True
+            time.sleep(delay)
+        return False
+
+    def stop(self):
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._httpd = None
+        self._thread = None
+
+    @abstractmethod
+    def handle(self, method: str, path: str, raw_body: bytes) -> Tuple[int, bytes]:
+        """Answer one request with its HTTP status and JSON payload."""
+
+
+def _handler(server: LocalWebDriverServer):
+    class WebDriverRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self._respond("GET")
+
+        def do_POST(self):
+            self._respond("POST")
+
+        def do_DELETE(self):
+            self._respond("DELETE")
+
+        def _respond(self, method: str):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw_body = self.rfile.read(length) if length else b""
+            try:
+                status, payload = server.handle(
+                    method, self.path.rstrip("/") or "/", raw_body
+                )
+            except WebDriverError as e:
+                status, payload = e.status, error_payload(e.error, e.message)
+            except Exception as e:
+                server.logger.error("%s failed on %s: %s", method, self.path, e)
+                status, payload = 500, error_payload("unknown error", str(e))
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            # Per-request access logs would dominate benchmark output
+            pass
+
+    return WebDriverRequestHandler
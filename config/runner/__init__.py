@@ -0,0 +1,65 @@
+import argparse
+import hashlib
+import heapq
+import io
+import json
+import multiprocessing
+import os
+import queue
+import re
+import shutil
+import subprocess
+import sys
+import time
+from contextlib import redirect_stderr, redirect_stdout
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from config.dto import CheckpointDto, DesiredCapabilitiesDto, ScenarioDto, WorkerDto
+from config.infrastructure.app_install_cache import AppInstallCache
+from config.infrastructure.appium_server import AppiumServer
+from config.infrastructure.emulator import Emulator
+from config.infrastructure.golden_snapshot import (
+    GoldenSnapshot,
+    golden_from_capabilities,
+)
+from config.utils.data_provider import DataProvider
+from config.utils.logger import Logger
+
+__all__ = [
+    "argparse",
+    "hashlib",
+    "heapq",
+    "io",
+    "json",
+    "multiprocessing",
+    "os",
+    "queue",
+    "re",
+    "shutil",
+    "subprocess",
+    "sys",
+    "time",
+    "redirect_stderr",
+    "redirect_stdout",
+    "Client",
+    "Listener",
+    "Path",
+    "Dict",
+    "List",
+    "Optional",
+    "Set",
+    "Tuple",
+    "CheckpointDto",
+    "DesiredCapabilitiesDto",
+    "ScenarioDto",
+    "WorkerDto",
+    "AppInstallCache",
+    "AppiumServer",
+    "Emulator",
+    "GoldenSnapshot",
+    "golden_from_capabilities",
+    "DataProvider",
+    "Logger",
+]
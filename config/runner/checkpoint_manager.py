@@ -0,0 +1,80 @@
+from config.drivers.mobile_driver import MobileDriver
+from config.runner import CheckpointDto, Emulator, List, Logger, Optional, Set, os
+from config.runner.execution_plan import ExecutionPlan
+
+# Opt-in for behave runs: snapshots cost emulator disk and save time
+CHECKPOINTS_ENV = "SWAG_LABS_CHECKPOINTS"
+
+
+class CheckpointManager:
+    """Save and restore app state at the branch points of an `ExecutionPlan`.
+
+    Checkpoints are emulator snapshots, so they capture the app, its backstack
+    and the UiAutomator2 server together. The first scenario through a branch
+    point saves it; later ones load the deepest saved checkpoint on their path
+    and skip the steps it covers. Anything that cannot be saved or restored is
+    dropped and the scenario replays its prefix instead.
+    """
+
+    def __init__(self, plan: ExecutionPlan, emulator: Emulator):
+        self.plan = plan
+        self.emulator = emulator
+        self.enabled = True
+        self._saved: Set[str] = set()
+        self.logger = Logger.get_logger(__name__)
+
+    def restore(self, steps: List[str], driver: MobileDriver) -> int:
+        """Load the deepest saved checkpoint for `steps`, returning its depth."""
+        for checkpoint in reversed(self.plan.checkpoints(steps)):
+            if checkpoint.checkpoint_id not in self._saved:
+                continue
+            if not self.emulator.load_snapshot(checkpoint.checkpoint_id):
+                self._saved.discard(checkpoint.checkpoint_id)
+                continue
+            try:
+                # The snapshot must come back with a responsive session
+                driver.snapshot()
+            except Exception as e:
+                self.logger.warning(
+                    "Checkpoint %s restored without a session: %s",
+                    checkpoint.checkpoint_id,
+                    e,
+                )
+                self._saved.discard(checkpoint.checkpoint_id)
+                return 0
+            self.logger.info(
+                "Restored %s (%s steps)", checkpoint.checkpoint_id, checkpoint.depth
+            )
+            return checkpoint.depth
+        return 0
+
+    def save(self, steps: List[str], depth: int):
+        """Save the checkpoint that ends after step `depth`, if the plan has one."""
+        if not self.enabled:
+            return
+        checkpoint = self._checkpoint_at(steps, depth)
+        if checkpoint is None or checkpoint.checkpoint_id in self._saved:
+            return
+        if not self.emulator.save_snapshot(checkpoint.checkpoint_id):
+            self.logger.warning("Snapshots unavailable, replaying prefixes instead")
+            self.enabled = False
+            return
+        self._saved.add(checkpoint.checkpoint_id)
+        self.logger.info(
+            "Saved %s for %s scenarios",
+            checkpoint.checkpoint_id,
+            checkpoint.scenarios,
+        )
+
+    def cleanup(self):
+        for checkpoint_id in self._saved:
+            self.emulator.delete_snapshot(checkpoint_id)
+        self._saved.clear()
+
+    def _checkpoint_at(self, steps: List[str], depth: int) -> Optional[CheckpointDto]:
+        return next((c for c in self.plan.checkpoints(steps) if c.depth == depth), None)
+
+
+def checkpoints_from_env() -> bool:
+    """Return whether `SWAG_LABS_CHECKPOINTS` enables checkpoints for the run."""
+    return os.environ.get(CHECKPOINTS_ENV, "").lower() in ("1", "true", "yes")
@@ -0,0 +1,54 @@
+from config.runner import Dict, Optional, Path, json
+
+DEFAULT_DURATIONS_PATH = Path("reports/scenario_durations.json")
+
+
+class DurationStore:
+    """Per-scenario runtimes from previous runs, persisted as JSON under reports/.
+
+    Durations are smoothed with an exponential moving average so a single slow
+    run (emulator hiccup, cold cache) does not dominate the next schedule.
+    """
+
+    SMOOTHING = 0.5
+
+    def __init__(self, path: Path = DEFAULT_DURATIONS_PATH):
+        self.path = Path(path)
+        self._records: Dict[str, Dict[str, float]] = {}
+
+    def load(self) -> "DurationStore":
+        if self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as file:
+                    self._records = json.load(file).get("scenarios", {})
+            except (json.JSONDecodeError, AttributeError):
+                self._records = {}
+        return self
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump({"scenarios": self._records}, file, indent=2, sort_keys=True)
+
+    def get(self, key: str) -> Optional[float]:
+        record = self._records.get(key)
+        return record["duration"] if record else None
+
+    def record(self, key: str, duration: float, steps: int):
+        previous = self._records.get(key)
+        if previous:
+            duration = (
+                self.SMOOTHING * duration + (1 - self.SMOOTHING) * previous["duration"]
+            )
+        self._records[key] = {
+            "duration": round(duration, 3),
+            "steps": steps,
+            "runs": (previous["runs"] + 1) if previous else 1,
+        }
+
+    def seconds_per_step(self) -> Optional[float]:
+        total_steps = sum(record["steps"] for record in self._records.values())
+        if not total_steps:
+            return None
+        total_duration = sum(record["duration"] for record in self._records.values())
+        return total_duration / total_steps
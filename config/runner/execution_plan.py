@@ -0,0 +1,70 @@
+from config.runner import CheckpointDto, Dict, List, ScenarioDto, Set, hashlib
+
+
+class _PrefixNode:
+
+    def __init__(self):
+        self.children: Dict[str, "_PrefixNode"] = {}
+        self.scenarios = 0
+        self.ends = 0
+
+
+class ExecutionPlan:
+    """Prefix tree of scenario step sequences with checkpoints at branch points.
+
+    Background steps, logins and shared checkout set-up make many scenarios
+    start with the same steps. A branch point is the last step two or more
+    scenarios have in common before they diverge. Running that prefix once and
+    checkpointing the app state there lets every other scenario through the
+    node resume from the checkpoint and only run its own suffix.
+    """
+
+    # Shorter prefixes replay faster than an emulator snapshot loads
+    MIN_CHECKPOINT_DEPTH = 3
+
+    def __init__(self, scenarios: List[ScenarioDto]):
+        self._root = _PrefixNode()
+        for scenario in scenarios:
+            node = self._root
+            for step in scenario.steps:
+                node = node.children.setdefault(step, _PrefixNode())
+                node.scenarios += 1
+            node.ends += 1
+
+    @staticmethod
+    def checkpoint_id(prefix: List[str]) -> str:
+        digest = hashlib.sha1("\n".join(prefix).encode("utf-8")).hexdigest()
+        return f"checkpoint_{digest[:12]}"
+
+    def checkpoints(self, steps: List[str]) -> List[CheckpointDto]:
+        """Branch points along `steps`, shallowest first."""
+        checkpoints: List[CheckpointDto] = []
+        node = self._root
+        for depth, step in enumerate(steps, start=1):
+            child = node.children.get(step)
+            if child is None:
+                break
+            node = child
+            if depth == len(steps) or depth < self.MIN_CHECKPOINT_DEPTH:
+                continue
+            if node.scenarios > 1 and len(node.children) + bool(node.ends) > 1:
+                checkpoints.append(
+                    CheckpointDto(
+                        checkpoint_id=self.checkpoint_id(steps[:depth]),
+                        depth=depth,
+                        scenarios=node.scenarios,
+                    )
+                )
+        return checkpoints
+
+    def steps_saved(self, scenarios: List[ScenarioDto]) -> int:
+        """Count the steps skipped by resuming from the deepest saved checkpoint."""
+        saved = 0
+        seen: Set[str] = set()
+        for scenario in scenarios:
+            checkpoints = self.checkpoints(scenario.steps)
+            saved += max(
+                (c.depth for c in checkpoints if c.checkpoint_id in seen), default=0
+            )
+            seen.update(c.checkpoint_id for c in checkpoints)
+        return saved
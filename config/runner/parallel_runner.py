@@ -0,0 +1,326 @@
+from config.runner import (
+    AppiumServer,
+    DataProvider,
+    DesiredCapabilitiesDto,
+    Dict,
+    Emulator,
+    List,
+    Logger,
+    Optional,
+    Path,
+    ScenarioDto,
+    Tuple,
+    WorkerDto,
+    argparse,
+    golden_from_capabilities,
+    json,
+    multiprocessing,
+    os,
+    queue,
+    shutil,
+    subprocess,
+    sys,
+    time,
+)
+from config.runner.duration_store import DurationStore
+from config.runner.scenario_collector import ScenarioCollector
+from config.runner.session_affinity import SessionAffinity
+from config.runner.shard_scheduler import ShardScheduler
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DESIRED_CAPABILITIES_PATH = (
+    PROJECT_ROOT / "config" / "config_files" / "desired_capabilities.json"
+)
+DURATIONS_PATH = PROJECT_ROOT / "reports" / "scenario_durations.json"
+ALLURE_RESULTS_DIR = PROJECT_ROOT / "reports" / "allure-results"
+LOGS_DIR = PROJECT_ROOT / "reports" / "logs"
+
+
+class ParallelRunner:
+    """Run scenarios across N workers, each owning an emulator and Appium server.
+
+    Workers pull batches of `path:line` scenario locations from a shared queue
+    and run each batch in its own `behave` process against their private
+    infrastructure, so a slow scenario never blocks the rest of the suite. The
+    queue is filled longest-first from the duration store, which makes the
+    first idle worker always take the longest remaining scenario (LPT list
+    scheduling).
+
+    Scenarios sharing a logged-in starting state (see `SessionAffinity`) are
+    queued together as one batch and run in a single `behave` process, so the
+    session is restored between them instead of replayed. Large groups are
+    split into at most one batch per worker to keep the workers balanced.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        avd_name: str,
+        headless: bool = True,
+        base_appium_port: int = 4723,
+        base_system_port: int = 8200,
+        base_emulator_port: int = 5554,
+        duration_store: Optional[DurationStore] = None,
+        snapshot: Optional[str] = None,
+    ):
+        self.workers = [
+            WorkerDto(
+                worker_id=index,
+                appium_port=base_appium_port + index,
+                system_port=base_system_port + index,
+                # Emulator console/adb ports come in pairs
+                emulator_port=base_emulator_port + index * 2,
+            )
+            for index in range(workers)
+        ]
+        self.avd_name = avd_name
+        self.headless = headless
+        # Read-only instances of the AVD all quick-boot from the same snapshot
+        self.snapshot = snapshot
+        self.duration_store = duration_store or DurationStore(DURATIONS_PATH).load()
+        self.scheduler = ShardScheduler(self.duration_store)
+        self.logger = Logger.get_logger(__name__)
+
+    def run(self, scenarios: List[ScenarioDto]) -> int:
+        if not scenarios:
+            self.logger.info("No scenarios to run")
+            return 0
+
+        ordered = self.scheduler.order(scenarios)
+        by_location = {scenario.location: scenario for scenario in ordered}
+        scenario_queue: multiprocessing.Queue = multiprocessing.Queue()
+        results_queue: multiprocessing.Queue = multiprocessing.Queue()
+        for batch in self._batches(ordered):
+            scenario_queue.put([scenario.location for scenario in batch])
+        for _ in self.workers:
+            scenario_queue.put(None)
+
+        estimated_makespan = self.scheduler.makespan(
+            self.scheduler.plan(ordered, len(self.workers))
+        )
+        self.logger.info(
+            "Running %s scenarios on %s workers (estimated makespan %.0fs)",
+            len(ordered),
+            len(self.workers),
+            estimated_makespan,
+        )
+        processes = [
+            multiprocessing.Process(
+                target=_worker_loop,
+                args=(
+                    worker,
+                    self.avd_name,
+                    self.headless,
+                    self.snapshot,
+                    scenario_queue,
+                    results_queue,
+                ),
+                name=f"worker-{worker.worker_id}",
+            )
+            for worker in self.workers
+        ]
+        for process in processes:
+            process.start()
+
+        results: Dict[str, int] = {}
+        while len(results) < len(ordered):
+            try:
+                location, return_code, duration = results_queue.get(timeout=5)
+            except queue.Empty:
+                if any(process.is_alive() for process in processes):
+                    continue
+                self.logger.error("All workers exited before the queue was drained")
+                break
+            if location not in by_location:
+                self.logger.warning("Unexpected result for %s", location)
+                continue
+            results[location] = return_code
+            scenario = by_location[location]
+            self.duration_store.record(scenario.key, duration, len(scenario.steps))
+            status = "✓ PASSED" if return_code == 0 else "✗ FAILED"
+            self.logger.info("%s (%.1fs): %s", status, duration, location)
+
+        for location in by_location:
+            results.setdefault(location, 1)
+
+        for process in processes:
+            process.join()
+
+        self.duration_store.save()
+        self._merge_allure_results()
+        failed = [location for location, code in results.items() if code != 0]
+        for location in failed:
+            self.logger.error("Failed scenario: %s", location)
+        return 1 if failed else 0
+
+    def _batches(self, ordered: List[ScenarioDto]) -> List[List[ScenarioDto]]:
+        """Session-affinity batches, longest estimated batch first."""
+        batches: List[List[ScenarioDto]] = []
+        for group in SessionAffinity.batches(ordered):
+            size = -(-len(group) // len(self.workers))
+            batches.extend(
+                group[start : start + size] for start in range(0, len(group), size)
+            )
+        return sorted(
+            batches,
+            key=lambda batch: sum(self.scheduler.estimate(s) for s in batch),
+            reverse=True,
+        )
+
+    def _merge_allure_results(self):
+        ALLURE_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        for worker in self.workers:
+            worker_dir = _worker_results_dir(worker)
+            if not worker_dir.exists():
+                continue
+            for result_file in worker_dir.iterdir():
+                shutil.move(
+                    str(result_file), str(ALLURE_RESULTS_DIR / result_file.name)
+                )
+            worker_dir.rmdir()
+        self.logger.info("Allure results merged into %s", ALLURE_RESULTS_DIR)
+
+
+def _worker_results_dir(worker: WorkerDto) -> Path:
+    return ALLURE_RESULTS_DIR / f"worker-{worker.worker_id}"
+
+
+def _normalize_location(location: str) -> str:
+    path, _, line = location.rpartition(":")
+    return f"{(PROJECT_ROOT / path).resolve().as_posix()}:{line}"
+
+
+def _batch_results(
+    locations: List[str], report_path: Path, return_code: int, duration: float
+) -> List[Tuple[str, int, float]]:
+    """Per-scenario (location, code, duration) from behave's JSON report.
+
+    Falls back to the batch exit code and an even split of the wall time for
+    scenarios missing from the report (e.g. behave crashed mid-batch).
+    """
+    reported: Dict[str, Tuple[int, float]] = {}
+    try:
+        features = json.loads(report_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        features = []
+    for feature in features:
+        for element in feature.get("elements", []):
+            if element.get("type") != "scenario":
+                continue
+            elapsed = sum(
+                step.get("result", {}).get("duration", 0.0)
+                for step in element.get("steps", [])
+            )
+            code = 0 if element.get("status") == "passed" else 1
+            reported[_normalize_location(element["location"])] = (code, elapsed)
+
+    fallback = (1 if return_code else 0, duration / len(locations))
+    return [
+        (location, *reported.get(_normalize_location(location), fallback))
+        for location in locations
+    ]
+
+
+def _worker_loop(
+    worker: WorkerDto,
+    avd_name: str,
+    headless: bool,
+    snapshot: Optional[str],
+    scenario_queue: multiprocessing.Queue,
+    results_queue: multiprocessing.Queue,
+):
+    logger = Logger.get_logger(f"{__name__}.worker-{worker.worker_id}")
+    appium_server = AppiumServer(port=worker.appium_port)
+    emulator = Emulator(
+        avd_name=avd_name,
+        port=worker.emulator_port,
+        headless=headless,
+        read_only=True,
+        snapshot=snapshot,
+    )
+
+    try:
+        appium_server.start()
+        emulator.start()
+        if not appium_server.wait_until_ready():
+            raise RuntimeError(f"Appium server on {appium_server.url} not ready")
+        if not emulator.wait_until_booted():
+            raise RuntimeError(f"Emulator {emulator.serial} did not boot")
+        logger.info("Worker %s ready on %s", worker.worker_id, emulator.serial)
+
+        env = {**os.environ, **worker.to_env()}
+        results_dir = _worker_results_dir(worker)
+        log_path = LOGS_DIR / f"worker_{worker.worker_id}.log"
+        report_path = LOGS_DIR / f"worker_{worker.worker_id}.json"
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
+
+        with open(log_path, "a", encoding="utf-8") as worker_log:
+            while True:
+                locations = scenario_queue.get()
+                if locations is None:
+                    break
+                report_path.unlink(missing_ok=True)
+                started = time.monotonic()
+                completed = subprocess.run(
+                    [
+                        sys.executable,
+                        "-m",
+                        "behave",
+                        *locations,
+                        "--no-capture",
+                        "-f",
+                        "json",
+                        "-o",
+                        str(report_path),
+                        "-f",
+                        "allure_behave.formatter:AllureFormatter",
+                        "-o",
+                        str(results_dir),
+                        "-f",
+                        "plain",
+                    ],
+                    cwd=PROJECT_ROOT,
+                    env=env,
+                    stdout=worker_log,
+                    stderr=subprocess.STDOUT,
+                )
+                for result in _batch_results(
+                    locations,
+                    report_path,
+                    completed.returncode,
+                    time.monotonic() - started,
+                ):
+                    results_queue.put(result)
+    except Exception as e:
+        # Remaining scenarios stay queued for the healthy workers
+        logger.error("Worker %s failed: %s", worker.worker_id, e, exc_info=True)
+    finally:
+        emulator.stop()
+        appium_server.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the selected scenarios in parallel, one emulator per worker."""
+    parser = argparse.ArgumentParser(description="Run behave scenarios in parallel")
+    parser.add_argument("paths", nargs="*", default=["tests/features"])
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--tags", action="append", default=[])
+    args = parser.parse_args(argv)
+
+    capabilities = DataProvider.get_data(
+        str(DESIRED_CAPABILITIES_PATH), DesiredCapabilitiesDto
+    )
+    paths = [ScenarioCollector.resolve_feature_path(path) for path in args.paths]
+    scenarios = ScenarioCollector.collect(paths, args.tags or ["-wip"])
+    golden = golden_from_capabilities()
+    runner = ParallelRunner(
+        workers=args.workers,
+        avd_name=capabilities.deviceName,
+        headless=capabilities.headless,
+        snapshot=golden.NAME if golden.is_valid() else None,
+    )
+    return runner.run(scenarios)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
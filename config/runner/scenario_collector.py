@@ -0,0 +1,89 @@
+from behave.parser import parse_file
+
+from config.dto import ScenarioDto
+from config.runner import List, Optional, Path, Tuple, re
+
+
+class ScenarioCollector:
+    """Expand feature files into one runnable `path:line` entry per scenario."""
+
+    @staticmethod
+    def collect(
+        paths: List[str], tags: Optional[List[str]] = None, tag_expression=None
+    ) -> List[ScenarioDto]:
+        """Collect scenarios from feature files, directories or `path:line` entries.
+
+        `tag_expression` is a behave TagExpression (e.g. `context.config.tags`)
+        and takes precedence over the v1 `tags` strings.
+        """
+        feature_files: List[Tuple[Path, Optional[int]]] = []
+        for raw_path in paths:
+            location = re.match(r"^(?P<path>.+?)(?::(?P<line>\d+))?$", raw_path)
+            if location is None:
+                raise ValueError(f"Invalid feature path: {raw_path!r}")
+            path = Path(location.group("path"))
+            line = location.group("line")
+            if path.is_dir():
+                feature_files.extend(
+                    (feature_file, None)
+                    for feature_file in sorted(path.rglob("*.feature"))
+                )
+            else:
+                feature_files.append((path, int(line) if line else None))
+
+        scenarios: List[ScenarioDto] = []
+        for feature_file, line in feature_files:
+            feature = parse_file(str(feature_file))
+            if feature is None:
+                continue
+            for scenario in feature.walk_scenarios():
+                if line is not None and scenario.line != line:
+                    continue
+                scenario_tags = [str(tag) for tag in scenario.effective_tags]
+                if tag_expression is not None:
+                    if not tag_expression.check(scenario_tags):
+                        continue
+                elif not ScenarioCollector.matches_tags(scenario_tags, tags or []):
+                    continue
+                scenarios.append(
+                    ScenarioDto(
+                        location=f"{feature_file.as_posix()}:{scenario.line}",
+                        name=scenario.name,
+                        tags=scenario_tags,
+                        steps=[
+                            f"{step.step_type} {step.name}"
+                            for step in scenario.all_steps
+                        ],
+                    )
+                )
+        return scenarios
+
+    @staticmethod
+    def resolve_feature_path(path: str) -> str:
+        if Path(path).exists():
+            return path
+        # Same shorthand as `nox -s run_test -- user_authentication`
+        name = path if path.endswith(".feature") else f"{path}.feature"
+        return str(Path("tests/features") / name)
+
+    @staticmethod
+    def matches_tags(scenario_tags: List[str], tag_expressions: List[str]) -> bool:
+        """Evaluate behave v1 tag expressions.
+
+        Each expression is an OR of comma-separated tags, expressions are
+        AND-ed together, and `~tag` or `-tag` negates a single tag.
+        """
+        tags = {tag.lstrip("@") for tag in scenario_tags}
+        for expression in tag_expressions:
+            matched = False
+            for term in expression.split(","):
+                term = term.strip()
+                if term.startswith(("~", "-")):
+                    matched = term[1:].lstrip("@") not in tags
+                else:
+                    matched = term.lstrip("@") in tags
+                if matched:
+                    break
+            if not matched:
+                return False
+        return True
@@ -0,0 +1,48 @@
+from config.dto import ScenarioDto
+from config.runner import Dict, List, Optional, re
+
+# Leading steps that only establish "logged in as <user>" state
+LOGIN_PREFIX = [
+    re.compile(r"^given the Swag Labs app is installed and launched$"),
+    re.compile(r"^given I am on the login screen$"),
+    re.compile(
+        r'^when I login with username "(?P<user>[^"]*)" '
+        r'and password "(?P<password>[^"]*)"$'
+    ),
+]
+
+
+class SessionAffinity:
+    """Identify scenarios that start from the same logged-in state.
+
+    Scenarios sharing a state key can run back-to-back in one session: the
+    state is restored through the app instead of replaying the login prefix.
+    """
+
+    RESTORABLE_STEPS = len(LOGIN_PREFIX)
+
+    @staticmethod
+    def state_key(steps: List[str]) -> Optional[str]:
+        if len(steps) <= len(LOGIN_PREFIX):
+            return None
+        matches = [pattern.match(step) for pattern, step in zip(LOGIN_PREFIX, steps)]
+        login = matches[-1]
+        if login is None or not all(matches):
+            return None
+        return f"logged_in:{login.group('user')}:{login.group('password')}"
+
+    @staticmethod
+    def batches(scenarios: List[ScenarioDto]) -> List[List[ScenarioDto]]:
+        """Group scenarios by state key, keeping first-seen order."""
+        batches: List[List[ScenarioDto]] = []
+        by_key: Dict[str, List[ScenarioDto]] = {}
+        for scenario in scenarios:
+            key = SessionAffinity.state_key(scenario.steps)
+            if key is None:
+                batches.append([scenario])
+            elif key in by_key:
+                by_key[key].append(scenario)
+            else:
+                by_key[key] = [scenario]
+                batches.append(by_key[key])
+        return batches
@@ -0,0 +1,48 @@
+from config.dto import ScenarioDto
+from config.runner import List, heapq
+from config.runner.duration_store import DurationStore
+
+
+class ShardScheduler:
+    """Longest-processing-time-first scheduling of scenarios across workers.
+
+    Scenarios without history are estimated from their step count, using the
+    average seconds per step observed in the store (or `DEFAULT_SECONDS_PER_STEP`
+    before any run was recorded).
+    """
+
+    DEFAULT_SECONDS_PER_STEP = 3.0
+
+    def __init__(self, duration_store: DurationStore):
+        self.duration_store = duration_store
+        self._seconds_per_step = (
+            duration_store.seconds_per_step() or self.DEFAULT_SECONDS_PER_STEP
+        )
+
+    def estimate(self, scenario: ScenarioDto) -> float:
+        duration = self.duration_store.get(scenario.key)
+        if duration is not None:
+            return duration
+        return len(scenario.steps) * self._seconds_per_step
+
+    def order(self, scenarios: List[ScenarioDto]) -> List[ScenarioDto]:
+        return sorted(scenarios, key=self.estimate, reverse=True)
+
+    def plan(
+        self, scenarios: List[ScenarioDto], workers: int
+    ) -> List[List[ScenarioDto]]:
+        """Greedy LPT bin-packing: next-longest scenario to the least loaded worker."""
+        shards: List[List[ScenarioDto]] = [[] for _ in range(workers)]
+        loads = [(0.0, index) for index in range(workers)]
+        heapq.heapify(loads)
+        for scenario in self.order(scenarios):
+            load, index = heapq.heappop(loads)
+            shards[index].append(scenario)
+            heapq.heappush(loads, (load + self.estimate(scenario), index))
+        return shards
+
+    def makespan(self, shards: List[List[ScenarioDto]]) -> float:
+        return max(
+            (sum(self.estimate(scenario) for scenario in shard) for shard in shards),
+            default=0.0,
+        )
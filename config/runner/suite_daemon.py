@@ -0,0 +1,186 @@
+from config.runner import (
+    AppInstallCache,
+    AppiumServer,
+    Client,
+    DataProvider,
+    DesiredCapabilitiesDto,
+    Emulator,
+    List,
+    Listener,
+    Logger,
+    Optional,
+    Path,
+    Tuple,
+    argparse,
+    golden_from_capabilities,
+    io,
+    redirect_stderr,
+    redirect_stdout,
+    sys,
+)
+from config.runner.scenario_collector import ScenarioCollector
+from config.runner.warm_session import WarmSession
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DESIRED_CAPABILITIES_PATH = (
+    PROJECT_ROOT / "config" / "config_files" / "desired_capabilities.json"
+)
+APP_FOLDER = PROJECT_ROOT / "business" / "app"
+DAEMON_ADDRESS = ("127.0.0.1", 47100)
+DAEMON_AUTHKEY = b"swag-labs-test-daemon"
+# Modules re-imported before every submission so step edits are picked up
+HOT_RELOAD_PREFIXES = ("business.", "tests.features")
+SHUTDOWN = "__shutdown__"
+
+
+class SuiteDaemon:
+    """Long-lived process that keeps Appium, the emulator and a session warm.
+
+    Clients submit behave arguments; each submission runs in-process against the
+    warm driver after step-definition and screen modules are reloaded.
+    """
+
+    def __init__(self, address=DAEMON_ADDRESS, authkey: bytes = DAEMON_AUTHKEY):
+        self.address = address
+        self.authkey = authkey
+        self.capabilities: Optional[DesiredCapabilitiesDto] = None
+        self.appium_server = AppiumServer()
+        self.emulator: Optional[Emulator] = None
+        self.logger = Logger.get_logger(__name__)
+
+    def start(self):
+        self.capabilities = DataProvider.get_data(
+            str(DESIRED_CAPABILITIES_PATH), DesiredCapabilitiesDto
+        )
+        self.capabilities.app = str((APP_FOLDER / self.capabilities.app).absolute())
+        golden = golden_from_capabilities()
+        self.emulator = golden.emulator(headless=self.capabilities.headless)
+        self.appium_server.start()
+        self.emulator.start()
+        if not self.appium_server.wait_until_ready():
+            raise RuntimeError(f"Appium server on {self.appium_server.url} not ready")
+        if not self.emulator.wait_until_booted():
+            raise RuntimeError(f"Emulator {self.emulator.serial} did not boot")
+        golden.ensure(self.emulator)
+        self._ensure_session()
+
+    def stop(self):
+        if WarmSession.driver:
+            try:
+                WarmSession.driver.quit()
+            except Exception as e:
+                self.logger.error("Failed to quit warm driver: %s", e)
+            WarmSession.driver = None
+        if self.emulator:
+            self.emulator.stop()
+        self.appium_server.stop()
+
+    def _ensure_session(self):
+        if self.capabilities is None or self.emulator is None:
+            self.logger.error("Test daemon used before start()")
+            raise RuntimeError("Test daemon is not started")
+        if WarmSession.driver:
+            try:
+                # Cheap round-trip; fails if newCommandTimeout expired while idle
+                _ = WarmSession.driver.driver.current_activity
+                return
+            except Exception:
+                self.logger.info("Warm session expired, creating a new one")
+                WarmSession.driver = None
+        WarmSession.driver = AppInstallCache(self.emulator.serial).create_driver(
+            self.capabilities, self.appium_server.url
+        )
+
+    @staticmethod
+    def _reload_modules():
+        for name in list(sys.modules):
+            if name.startswith(HOT_RELOAD_PREFIXES):
+                del sys.modules[name]
+
+    @staticmethod
+    def _reset_step_registry():
+        from behave.step_registry import registry
+
+        # Cleared in place: the `given/when/then` decorators are bound to it
+        for step_type in registry.steps:
+            registry.steps[step_type] = []
+
+    def run_behave(self, args: List[str]) -> Tuple[int, str]:
+        from behave.configuration import Configuration
+        from behave.runner import Runner
+
+        self._ensure_session()
+        self._reload_modules()
+        self._reset_step_registry()
+
+        output = io.StringIO()
+        # The logger's console handler holds sys.stdout, bypassing redirect_stdout
+        Logger.flush()
+        console = Logger.set_console_stream(output)
+        try:
+            with redirect_stdout(output), redirect_stderr(output):
+                try:
+                    failed = Runner(Configuration(command_args=args)).run()
+                    return_code = 1 if failed else 0
+                except Exception as e:
+                    print(f"Daemon run failed: {e}")
+                    return_code = 1
+        finally:
+            Logger.flush()
+            Logger.set_console_stream(console)
+        return return_code, output.getvalue()
+
+    def serve_forever(self):
+        self.start()
+        host, port = self.address
+        self.logger.info("Test daemon listening on %s:%s", host, port)
+        try:
+            with Listener(self.address, authkey=self.authkey) as listener:
+                while True:
+                    with listener.accept() as connection:
+                        args = connection.recv()
+                        if args == SHUTDOWN:
+                            connection.send((0, "Test daemon stopped\n"))
+                            break
+                        self.logger.info("Running: behave %s", " ".join(args))
+                        connection.send(self.run_behave(args))
+        finally:
+            self.stop()
+
+
+def submit(args, address=DAEMON_ADDRESS, authkey: bytes = DAEMON_AUTHKEY) -> int:
+    """Run `args` on the daemon and print its output, returning the exit code."""
+    try:
+        connection = Client(address, authkey=authkey)
+    except ConnectionRefusedError:
+        print("Test daemon is not running. Start it with: nox -s start_daemon")
+        return 1
+    with connection:
+        connection.send(args)
+        return_code, output = connection.recv()
+    print(output, end="")
+    return return_code
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Serve the daemon, submit a run to it or stop it."""
+    parser = argparse.ArgumentParser(description="Warm test daemon for behave runs")
+    parser.add_argument("command", choices=["serve", "run", "stop"])
+    parser.add_argument("behave_args", nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        SuiteDaemon().serve_forever()
+        return 0
+    if args.command == "stop":
+        return submit(SHUTDOWN)
+    behave_args = list(args.behave_args)
+    if not behave_args or behave_args[0].startswith("-"):
+        behave_args.insert(0, "tests/features/")
+    else:
+        behave_args[0] = ScenarioCollector.resolve_feature_path(behave_args[0])
+    return submit(behave_args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,12 @@
+from config.drivers.mobile_driver import MobileDriver
+from config.runner import Optional
+
+
+class WarmSession:
+    """Driver owned by the test daemon and shared with the behave runs it hosts.
+
+    `environment.before_all` reuses it instead of starting Appium, the emulator
+    and a new session; `after_all` leaves it running.
+    """
+
+    driver: Optional[MobileDriver] = None
@@ -1,18 +1,42 @@
+import atexit
+import hashlib
 import json
 import logging
+import logging.handlers as logging_handlers
+import math
+import queue
 import subprocess
 import sys
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict
 from datetime import datetime
+from multiprocessing import util as multiprocessing_util
 from pathlib import Path
-from typing import Type, TypeVar
+from typing import Dict, List, Optional, Set, Type, TypeVar, Union
 
 __all__ = [
+    "atexit",
+    "hashlib",
     "json",
     "logging",
+    "logging_handlers",
+    "math",
+    "queue",
     "subprocess",
     "sys",
+    "time",
+    "ABC",
+    "abstractmethod",
+    "asdict",
     "datetime",
+    "multiprocessing_util",
     "Path",
+    "Dict",
+    "List",
+    "Optional",
+    "Set",
     "Type",
     "TypeVar",
+    "Union",
 ]
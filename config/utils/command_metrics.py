@@ -0,0 +1,178 @@
+from config.dto import CommandRecordDto
+from config.utils import (
+    ABC,
+    Dict,
+    List,
+    Optional,
+    Path,
+    abstractmethod,
+    asdict,
+    json,
+    math,
+    time,
+)
+
+
+class MetricsSink(ABC):
+
+    @abstractmethod
+    def record(self, command: CommandRecordDto) -> None:
+        pass
+
+    def close(self) -> None:  # noqa: B027
+        """Release the sink's resources; a no-op for sinks that hold none."""
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """Aggregates latencies per operation and locator for p50/p95/p99 reports."""
+
+    def __init__(self):
+        self._durations: Dict[tuple, List[float]] = {}
+
+    def record(self, command: CommandRecordDto):
+        key = (command.operation, command.locator)
+        self._durations.setdefault(key, []).append(command.duration)
+
+    @staticmethod
+    def _percentile(values: List[float], percentile: float) -> float:
+        # Nearest-rank percentile, defined for a single sample too
+        ordered = sorted(values)
+        rank = max(1, math.ceil(percentile / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self) -> List[Dict]:
+        rows = [
+            {
+                "operation": operation,
+                "locator": locator,
+                "count": len(durations),
+                "total": sum(durations),
+                "p50": self._percentile(durations, 50),
+                "p95": self._percentile(durations, 95),
+                "p99": self._percentile(durations, 99),
+            }
+            for (operation, locator), durations in self._durations.items()
+        ]
+        return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+
+class JsonlMetricsSink(MetricsSink):
+
+    def __init__(self, file_path: Path):
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(file_path, "a", encoding="utf-8", buffering=1)
+
+    def record(self, command: CommandRecordDto):
+        self._file.write(json.dumps(asdict(command)) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class AllureMetricsSink(MetricsSink):
+    """Reports every command as a nested Allure step with its timings."""
+
+    def record(self, command: CommandRecordDto):
+        from allure_commons import plugin_manager
+        from allure_commons.utils import uuid4
+
+        uuid = uuid4()
+        title = f"{command.operation} {command.locator or ''}".strip()
+        error = None if command.success else RuntimeError(f"{title} failed")
+        plugin_manager.hook.start_step(
+            uuid=uuid,
+            title=title,
+            params={
+                "strategy": command.strategy,
+                "duration_ms": f"{command.duration * 1000:.0f}",
+                "wait_ms": f"{command.wait_time * 1000:.0f}",
+                "server_ms": f"{command.server_time * 1000:.0f}",
+                "polls": command.polls,
+            },
+        )
+        plugin_manager.hook.stop_step(
+            uuid=uuid,
+            exc_type=type(error) if error else None,
+            exc_val=error,
+            exc_tb=None,
+        )
+
+
+class CommandMetrics:
+    _sinks: List[MetricsSink] = []
+
+    @classmethod
+    def add_sink(cls, sink: MetricsSink) -> MetricsSink:
+        cls._sinks.append(sink)
+        return sink
+
+    @classmethod
+    def remove_sink(cls, sink: MetricsSink):
+        if sink in cls._sinks:
+            cls._sinks.remove(sink)
+            sink.close()
+
+    @classmethod
+    def record(cls, command: CommandRecordDto):
+        for sink in cls._sinks:
+            sink.record(command)
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return bool(cls._sinks)
+
+
+class CommandTimer:
+    """Times one driver command, splitting server round-trips from wait slack.
+
+    Wrap explicit-wait conditions with `wrap` and direct element calls with
+    `call`; whatever is not spent inside them is polling sleep.
+    """
+
+    def __init__(self, operation: str, locator: Optional[tuple] = None):
+        self.operation = operation
+        self.locator = locator
+        self.server_time = 0.0
+        self.polls = 0
+        self._started = 0.0
+
+    def __enter__(self) -> "CommandTimer":
+        """Start timing the command."""
+        self._started = time.perf_counter()
+        return self
+
+    def wrap(self, condition):
+        def timed_condition(driver):
+            self.polls += 1
+            return self.call(condition, driver)
+
+        return timed_condition
+
+    def call(self, function, *args):
+        started = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.server_time += time.perf_counter() - started
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Record the command, successful or not, without suppressing errors."""
+        if not CommandMetrics.enabled():
+            return False
+        duration = time.perf_counter() - self._started
+        strategy, value = self.locator if self.locator else (None, None)
+        CommandMetrics.record(
+            CommandRecordDto(
+                operation=self.operation,
+                strategy=strategy,
+                locator=value,
+                duration=duration,
+                wait_time=max(0.0, duration - self.server_time),
+                server_time=self.server_time,
+                polls=self.polls,
+                success=exc_type is None,
+                timestamp=time.time(),
+            )
+        )
+        return False
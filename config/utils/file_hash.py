@@ -0,0 +1,10 @@
+from config.utils import Path, Union, hashlib
+
+
+def sha256_file(path: Union[str, Path]) -> str:
+    """Return the hex SHA-256 of the file at `path`, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
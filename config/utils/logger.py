@@ -1,4 +1,21 @@
-from config.utils import Path, datetime, logging, sys
+from config.dto import LoggingConfigDto
+from config.utils import (
+    Dict,
+    Optional,
+    Path,
+    Set,
+    atexit,
+    datetime,
+    logging,
+    logging_handlers,
+    multiprocessing_util,
+    queue,
+    sys,
+    time,
+)
+from config.utils.data_provider import DataProvider
+
+LOGGING_CONFIG_PATH = Path(__file__).parent.parent / "config_files" / "logging.json"
 
 
 class ColoredFormatter(logging.Formatter):
@@ -25,45 +42,136 @@ class ColoredFormatter(logging.Formatter):
         return f"{colored_levelname} - {colored_message}"
 
 
+class _InProcessQueueHandler(logging_handlers.QueueHandler):
+    """Enqueue records untouched; the listener thread does all formatting."""
+
+    def prepare(self, record):
+        return record
+
+
 class Logger:
-    _loggers = {}
-    _log_file_path = None
+    """Named loggers sharing one queue-backed pipeline.
+
+    Callers only enqueue records; a single `QueueListener` thread formats them
+    and writes to the console and to one shared log file.
+    """
+
+    _loggers: Dict[str, logging.Logger] = {}
+    _log_file_path: Optional[Path] = None
     _initialized = False
+    # Created at import so queue handlers never see a missing queue
+    _queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _listener: Optional[logging_handlers.QueueListener] = None
+    _console_handler: Optional[logging.StreamHandler] = None
+    _config: Optional[LoggingConfigDto] = None
+    _console_only: Set[str] = set()
+
+    @classmethod
+    def _load_config(cls) -> LoggingConfigDto:
+        try:
+            return DataProvider.get_data(str(LOGGING_CONFIG_PATH), LoggingConfigDto)
+        except (FileNotFoundError, ValueError):
+            return LoggingConfigDto()
+
+    @classmethod
+    def _initialize(cls):
+        cls._config = cls._load_config()
+
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(ColoredFormatter("%(levelname)s - %(message)s"))
+        cls._console_handler = console_handler
+
+        # File handler - all messages with simple format
+        log_dir = Path("reports/logs")
+        log_dir.mkdir(parents=True, exist_ok=True)
+        cls._log_file_path = (
+            log_dir / f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        )
+        file_handler = logging.FileHandler(cls._log_file_path, encoding="utf-8")
+        file_handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s | %(levelname)-8s | %(message)s", datefmt="%H:%M:%S"
+            )
+        )
+        file_handler.addFilter(lambda record: record.name not in cls._console_only)
+
+        cls._listener = logging_handlers.QueueListener(
+            cls._queue, console_handler, file_handler, respect_handler_level=True
+        )
+        cls._listener.start()
+        atexit.register(cls.shutdown)
+        # Forked workers inherit the queue but not the listener thread
+        multiprocessing_util.register_after_fork(cls, Logger._restart_listener)
+        cls._initialized = True
+
+    @classmethod
+    def _restart_listener(cls, *_):
+        if cls._listener is None:
+            return
+        # Records still queued at fork time belong to the parent
+        while not cls._queue.empty():
+            cls._queue.get_nowait()
+        cls._listener = logging_handlers.QueueListener(
+            cls._queue, *cls._listener.handlers, respect_handler_level=True
+        )
+        cls._listener.start()
+        # multiprocessing children exit via os._exit, skipping atexit handlers
+        multiprocessing_util.Finalize(None, cls.shutdown, exitpriority=0)
+
+    @classmethod
+    def shutdown(cls):
+        """Flush queued records; called automatically at interpreter exit."""
+        if cls._listener is not None and cls._listener._thread is not None:
+            cls._listener.stop()
+
+    @classmethod
+    def flush(cls, timeout: float = 5):
+        """Block until the listener has taken every queued record."""
+        deadline = time.monotonic() + timeout
+        while not cls._queue.empty():
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(0.001)
+        # Wait for a record the listener is still writing
+        for handler in cls._listener.handlers if cls._listener else ():
+            handler.acquire()
+            handler.release()
+
+    @classmethod
+    def set_console_stream(cls, stream):
+        """Redirect console output, e.g. to silence benchmarks; returns the old one."""
+        if not cls._initialized:
+            cls._initialize()
+        return cls._console_handler.setStream(stream) if cls._console_handler else None
+
+    @classmethod
+    def level_for(cls, name: str) -> int:
+        config = cls._config or LoggingConfigDto()
+        matches = [
+            subsystem
+            for subsystem in config.subsystems
+            if name == subsystem or name.startswith(f"{subsystem}.")
+        ]
+        level = config.subsystems[max(matches, key=len)] if matches else config.level
+        return logging.getLevelName(level.upper())
 
     @classmethod
     def get_logger(cls, name: str = __name__, log_file: bool = True) -> logging.Logger:
         if name in cls._loggers:
             return cls._loggers[name]
 
+        if not cls._initialized:
+            cls._initialize()
+
         logger = logging.getLogger(name)
-        logger.setLevel(logging.INFO)
+        logger.setLevel(cls.level_for(name))
         logger.propagate = False
 
-        if logger.handlers:
-            return logger
-
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_formatter = ColoredFormatter("%(levelname)s - %(message)s")
-        console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        if not log_file:
+            cls._console_only.add(name)
 
-        # File handler - all messages with simple format
-        if log_file:
-            if cls._log_file_path is None:
-                log_dir = Path("reports/logs")
-                log_dir.mkdir(parents=True, exist_ok=True)
-                cls._log_file_path = (
-                    log_dir / f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-                )
-
-            file_handler = logging.FileHandler(cls._log_file_path)
-            file_handler.setLevel(logging.INFO)
-            file_formatter = logging.Formatter(
-                "%(asctime)s | %(levelname)-8s | %(message)s", datefmt="%H:%M:%S"
-            )
-            file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+        if not logger.handlers:
+            logger.addHandler(_InProcessQueueHandler(cls._queue))
 
         cls._loggers[name] = logger
         return logger
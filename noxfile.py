@@ -78,6 +78,22 @@ def verify_requirements(session):
         session.error("Appium driver check failed")
     print()
 
+    # Optional: lets MobileDriver.run_batch send a whole form in one call
+    print("Checking Appium execute-driver plugin...")
+    try:
+        result = session.run(
+            "appium", "plugin", "list", "--installed",
+            silent=True, external=True
+        )
+        if "execute-driver" in str(result).lower():
+            print("✅ execute-driver plugin installed")
+        else:
+            print("⚠️  execute-driver plugin not found (form batching falls back)")
+            print("Install with: appium plugin install execute-driver")
+    except Exception:
+        print("⚠️  Failed to check Appium plugins")
+    print()
+
     # Check ANDROID_HOME
     print("Checking Android SDK (ANDROID_HOME)...")
     android_home = os.environ.get("ANDROID_HOME")
@@ -96,7 +112,14 @@ def verify_requirements(session):
 
 @nox.session(python=False)
 def create_emulator(session):
-    """Create Android emulator (Pixel API 35)."""
+    """
+    Create Android emulator (Pixel API 35) and its golden quick-boot snapshot.
+
+    Usage:
+        nox -s create_emulator                        # Create AVD + golden snapshot
+        nox -s create_emulator -- --rebuild-snapshot  # Retake the golden snapshot
+        nox -s create_emulator -- --no-snapshot       # AVD only
+    """
     print("=" * 40)
     print("Creating Android Emulator (Pixel API 35)...")
     print("=" * 40)
@@ -135,9 +158,11 @@ def create_emulator(session):
 
     print("Checking if emulator 'test_pixel_35' already exists...")
     result = session.run("avdmanager", "list", "avd", silent=True, external=True)
+    created = False
     if "test_pixel_35" in str(result):
         print("⚠️  Emulator 'test_pixel_35' already exists")
     else:
+        created = True
         print("Creating emulator 'test_pixel_35'...")
         if is_windows:
             session.run(
@@ -159,11 +184,29 @@ def create_emulator(session):
         print("To start the emulator, run:")
         print("  nox -s start_emulator")
 
+    if "--no-snapshot" in session.posargs:
+        return
+    if created or "--rebuild-snapshot" in session.posargs:
+        # Cold boot once, install the app, disable animations and save "golden"
+        venv_python = ".venv\\Scripts\\python.exe" if is_windows else ".venv/bin/python"
+        print()
+        print("Creating golden snapshot (cold boot, about a minute)...")
+        session.run(
+            venv_python, "-m", "config.infrastructure.golden_snapshot",
+            "create", "--headless",
+            success_codes=[0, 1],
+        )
+
 @nox.session(python=False)
 def start_emulator(session):
-    """Start Android emulator."""
-    import time
+    """
+    Start Android emulator, quick-booting from the golden snapshot when valid.
 
+    Usage:
+        nox -s start_emulator                  # Window, golden snapshot if valid
+        nox -s start_emulator -- --headless    # No window
+        nox -s start_emulator -- --rebuild     # Cold boot and retake the snapshot
+    """
     print("=" * 40)
     print("Starting Android Emulator...")
     print("=" * 40)
@@ -184,52 +227,13 @@ def start_emulator(session):
     print()
     print("Starting emulator 'test_pixel_35'...")
 
-    headless = "--headless" in session.posargs
-    if is_windows:
-        if headless:
-            print("Starting in HEADLESS mode...")
-            session.run(
-                "powershell", "-Command",
-                "Start-Process emulator -ArgumentList '-avd','test_pixel_35','-no-window','-no-audio','-no-boot-anim' -WindowStyle Hidden",
-                external=True, silent=True
-            )
-        else:
-            print("Starting emulator...")
-            session.run(
-                "powershell", "-Command",
-                "Start-Process emulator -ArgumentList '-avd','test_pixel_35' -WindowStyle Hidden",
-                external=True, silent=True
-            )
-    else:
-        if headless:
-            print("Starting in HEADLESS mode...")
-            session.run(
-                "bash", "-c",
-                "emulator -avd test_pixel_35 -no-window -no-audio -no-boot-anim > /dev/null 2>&1 &",
-                external=True, silent=True
-            )
-        else:
-            print("Starting emulator...")
-            session.run(
-                "bash", "-c",
-                "emulator -avd test_pixel_35 > /dev/null 2>&1 &",
-                external=True, silent=True
-            )
-
-    print()
-    print("Waiting for emulator to boot...")
-    session.run("adb", "wait-for-device", external=True, silent=True)
-    time.sleep(5)
-
-    result = session.run(
-        "adb", "shell", "getprop", "sys.boot_completed",
-        silent=True, external=True
+    # Boots from the golden snapshot when it matches the APK and system image;
+    # otherwise cold boots and (re)creates it
+    venv_python = ".venv\\Scripts\\python.exe" if is_windows else ".venv/bin/python"
+    options = [arg for arg in ("--headless", "--rebuild") if arg in session.posargs]
+    session.run(
+        venv_python, "-m", "config.infrastructure.golden_snapshot", "start", *options
     )
-    if "1" in str(result):
-        print("✅ Emulator is fully booted!")
-    else:
-        print("⚠️  Emulator starting (may take a few more seconds)...")
-
     print()
     print("Running emulators:")
     session.run("adb", "devices", external=True)
@@ -297,9 +301,21 @@ def start_appium(session):
     print("Starting Appium server on http://127.0.0.1:4723...")
     Path("reports/logs").mkdir(parents=True, exist_ok=True)
 
+    # Batched form actions (MobileDriver.run_batch) need the execute-driver plugin
+    appium_cmd = "appium"
+    try:
+        plugins = session.run(
+            "appium", "plugin", "list", "--installed",
+            silent=True, external=True
+        )
+        if "execute-driver" in str(plugins):
+            appium_cmd = "appium --use-plugins=execute-driver"
+    except Exception:
+        pass
+
     if is_windows:
         # Create a batch file to run Appium with proper output redirection
-        batch_content = '@echo off\nappium > reports\\logs\\appium.log 2>&1'
+        batch_content = f'@echo off\n{appium_cmd} > reports\\logs\\appium.log 2>&1'
         batch_file = Path("reports/logs/start_appium.bat")
         batch_file.write_text(batch_content)
 
@@ -311,7 +327,7 @@ def start_appium(session):
     else:
         session.run(
             "bash", "-c",
-            "appium > reports/logs/appium.log 2>&1 & echo $! > /tmp/appium.pid",
+            f"{appium_cmd} > reports/logs/appium.log 2>&1 & echo $! > /tmp/appium.pid",
             external=True, silent=True
         )
 
@@ -435,11 +451,57 @@ def run_test(session):
         nox -s run_test -- user_authentication.feature     # Run specific feature file
         nox -s run_test -- -n "Login attempt"              # Run specific scenario by name
         nox -s run_test -- --tags=@smoke                   # Run tests with specific tags
+        nox -s run_test -- --workers 4                     # Run in parallel on 4 emulators
+        nox -s run_test -- --workers 4 --tags=@regression  # Parallel run filtered by tags
+        nox -s run_test -- --daemon --tags=@smoke          # Submit to the warm suite daemon
+        nox -s run_test -- --offline checkout              # Scripted app, no device needed
+        nox -s run_test -- --record=cassettes/smoke.cassette --tags=@smoke   # Record traffic
+        nox -s run_test -- --replay=cassettes/smoke.cassette --tags=@smoke   # Replay it
+        nox -s run_test -- --no-preflight                  # Skip locator validation
+        nox -s run_test -- --profile=fast                  # Performance profile to run with
+        nox -s run_test -- --checkpoints                   # Resume from shared-prefix snapshots
     """
     is_windows = platform.system() == "Windows"
     behave_cmd = ".venv\\Scripts\\behave.exe" if is_windows else ".venv/bin/behave"
+    venv_python = ".venv\\Scripts\\python.exe" if is_windows else ".venv/bin/python"
 
-    if session.posargs:
+    if "--offline" in session.posargs:
+        # environment.before_all serves the scripted app from a fake Appium server
+        session.env["SWAG_LABS_FAKE_APPIUM"] = "1"
+        session.posargs.remove("--offline")
+
+    if "--no-preflight" in session.posargs:
+        session.posargs.remove("--no-preflight")
+    else:
+        # Broken locators fail here in seconds, not after a timeout on the device
+        session.run(venv_python, "-m", "tests.preflight.locator_validator")
+
+    if "--checkpoints" in session.posargs:
+        # environment.before_all snapshots the emulator at shared step prefixes
+        session.env["SWAG_LABS_CHECKPOINTS"] = "1"
+        session.posargs.remove("--checkpoints")
+
+    profile = next((a for a in session.posargs if a.startswith("--profile=")), None)
+    if profile:
+        # Overrides performanceProfile in desired_capabilities.json
+        session.env["SWAG_LABS_PROFILE"] = profile.split("=", 1)[1]
+        session.posargs.remove(profile)
+
+    for mode in ("record", "replay"):
+        option = next((a for a in session.posargs if a.startswith(f"--{mode}=")), None)
+        if option:
+            # environment.before_all puts a cassette proxy in front of Appium
+            session.env[f"SWAG_LABS_{mode.upper()}"] = option.split("=", 1)[1]
+            session.posargs.remove(option)
+
+    if "--daemon" in session.posargs:
+        behave_args = [arg for arg in session.posargs if arg != "--daemon"]
+        print(f"Submitting to suite daemon: {' '.join(behave_args)}")
+        session.run(venv_python, "-m", "config.runner.suite_daemon", "run", *behave_args)
+    elif any(arg.startswith("--workers") for arg in session.posargs):
+        print(f"Running tests in parallel: {' '.join(session.posargs)}")
+        session.run(venv_python, "-m", "config.runner.parallel_runner", *session.posargs)
+    elif session.posargs:
         if session.posargs[0].startswith('-'):
             print(f"Running tests with parameters: {' '.join(session.posargs)}")
             session.run(behave_cmd, "tests/features/", *session.posargs, "-v", "--no-capture")
@@ -458,6 +520,78 @@ def run_test(session):
         session.run(behave_cmd, "tests/features/", "-v", "--no-capture")
 
 
+@nox.session(python=False)
+def start_daemon(session):
+    """
+    Start the suite daemon that keeps Appium, the emulator and the session warm.
+
+    Runs in the foreground; submit runs from another terminal with:
+        nox -s run_test -- --daemon [feature] [behave args]
+
+    Pass `-- --checkpoints` to resume submitted runs from shared-prefix snapshots.
+    """
+    is_windows = platform.system() == "Windows"
+    venv_python = ".venv\\Scripts\\python.exe" if is_windows else ".venv/bin/python"
+
+    if "--checkpoints" in session.posargs:
+        # Submitted runs execute in the daemon's process and read its environment
+        session.env["SWAG_LABS_CHECKPOINTS"] = "1"
+
+    print("=" * 40)
+    print("Starting Suite Daemon...")
+    print("=" * 40)
+    session.run(venv_python, "-m", "config.runner.suite_daemon", "serve")
+
+
+@nox.session(python=False)
+def stop_daemon(session):
+    """Stop the suite daemon and the infrastructure it owns."""
+    is_windows = platform.system() == "Windows"
+    venv_python = ".venv\\Scripts\\python.exe" if is_windows else ".venv/bin/python"
+
+    session.run(venv_python, "-m", "config.runner.suite_daemon", "stop")
+
+
+@nox.session(python=False)
+def validate_locators(session):
+    """
+    Validate screen locators against recorded page sources, no device needed.
+
+    Usage:
+        nox -s validate_locators                                      # Fake app sources
+        nox -s validate_locators -- --cassette cassettes/smoke.cassette  # Plus recordings
+    """
+    is_windows = platform.system() == "Windows"
+    venv_python = ".venv\\Scripts\\python.exe" if is_windows else ".venv/bin/python"
+
+    session.run(
+        venv_python, "-m", "tests.preflight.locator_validator", *session.posargs
+    )
+
+
+@nox.session(python=False)
+def benchmark(session):
+    """
+    Benchmark framework overhead against the fake Appium server.
+
+    Fails when a median regresses beyond the threshold of the stored baseline.
+
+    Usage:
+        nox -s benchmark                              # Compare against baseline
+        nox -s benchmark -- --update-baseline         # Record a new baseline
+        nox -s benchmark -- --only driver --rounds 50 # Subset, more rounds
+    """
+    is_windows = platform.system() == "Windows"
+    venv_python = ".venv\\Scripts\\python.exe" if is_windows else ".venv/bin/python"
+
+    print("=" * 40)
+    print("Running Benchmarks...")
+    print("=" * 40)
+    session.run(
+        venv_python, "-m", "tests.benchmarks.framework_benchmarks", *session.posargs
+    )
+
+
 @nox.session(python=False)
 def allure_serve(session):
     """Generate and serve Allure report from test results."""
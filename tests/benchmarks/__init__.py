@@ -0,0 +1,57 @@
+import argparse
+import io
+import json
+import math
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from business.screens.login_screen import LoginScreen
+from business.screens.swap_labs import SwapLabs
+from config.drivers.locator_rewriter import LocatorRewriter
+from config.drivers.locator_timeouts import LocatorTimeouts
+from config.drivers.mobile_driver_factory import MobileDriverFactory
+from config.drivers.page_snapshot import PageSnapshot, UnsupportedLocatorError
+from config.dto import BenchmarkResultDto, DesiredCapabilitiesDto
+from config.infrastructure.cassette import Cassette
+from config.infrastructure.fake_appium_server import FakeAppiumServer
+from config.utils.data_provider import DataProvider
+from config.utils.logger import Logger
+
+__all__ = [
+    "argparse",
+    "io",
+    "json",
+    "math",
+    "statistics",
+    "subprocess",
+    "sys",
+    "time",
+    "asdict",
+    "datetime",
+    "Path",
+    "Any",
+    "Callable",
+    "Dict",
+    "List",
+    "Optional",
+    "Tuple",
+    "LoginScreen",
+    "SwapLabs",
+    "LocatorRewriter",
+    "LocatorTimeouts",
+    "MobileDriverFactory",
+    "PageSnapshot",
+    "UnsupportedLocatorError",
+    "BenchmarkResultDto",
+    "DesiredCapabilitiesDto",
+    "Cassette",
+    "FakeAppiumServer",
+    "DataProvider",
+    "Logger",
+]
@@ -0,0 +1,126 @@
+from tests.benchmarks import (
+    Any,
+    BenchmarkResultDto,
+    Callable,
+    Dict,
+    List,
+    Logger,
+    Optional,
+    Path,
+    asdict,
+    json,
+    math,
+    statistics,
+    time,
+)
+
+
+class BenchmarkSuite:
+    """Time framework operations over repeated rounds.
+
+    `setup` runs before every round (warm-up rounds included) and is not timed.
+    """
+
+    def __init__(
+        self, rounds: int = 20, warmup: int = 2, only: Optional[List[str]] = None
+    ):
+        self.rounds = rounds
+        self.warmup = warmup
+        self.only = only or []
+        self.results: List[BenchmarkResultDto] = []
+        self.logger = Logger.get_logger(__name__)
+
+    def selected(self, name: str) -> bool:
+        return not self.only or any(pattern in name for pattern in self.only)
+
+    def measure(
+        self,
+        name: str,
+        operation: Callable[[], Any],
+        rounds: Optional[int] = None,
+        setup: Optional[Callable[[], Any]] = None,
+    ) -> Optional[BenchmarkResultDto]:
+        if not self.selected(name):
+            return None
+        rounds = rounds or self.rounds
+        durations: List[float] = []
+        for round_index in range(self.warmup + rounds):
+            if setup:
+                setup()
+            started = time.perf_counter()
+            operation()
+            if round_index >= self.warmup:
+                durations.append(time.perf_counter() - started)
+
+        ordered = sorted(durations)
+        result = BenchmarkResultDto(
+            name=name,
+            rounds=rounds,
+            median=statistics.median(ordered),
+            # Nearest-rank, as in InMemoryMetricsSink
+            p95=ordered[max(1, math.ceil(0.95 * len(ordered))) - 1],
+            minimum=ordered[0],
+        )
+        self.results.append(result)
+        self.logger.info(
+            "%-28s median=%.2fms p95=%.2fms min=%.2fms",
+            name,
+            result.median * 1000,
+            result.p95 * 1000,
+            result.minimum * 1000,
+        )
+        return result
+
+
+class BenchmarkBaseline:
+    """Median timings per benchmark, stored as JSON and used as a regression gate.
+
+    A benchmark regresses when its median exceeds the baseline by more than
+    `threshold` (relative) and `min_delta` seconds (absolute, to ignore noise
+    on sub-millisecond operations).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.medians: Dict[str, float] = {}
+
+    def load(self) -> "BenchmarkBaseline":
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            self.medians = {name: entry["median"] for name, entry in data.items()}
+        return self
+
+    def save(self, results: List[BenchmarkResultDto]):
+        data = {}
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        for result in results:
+            entry = asdict(result)
+            entry.pop("name")
+            data[result.name] = entry
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+    def regressions(
+        self,
+        results: List[BenchmarkResultDto],
+        threshold: float = 0.25,
+        min_delta: float = 0.0005,
+    ) -> List[str]:
+        regressions = []
+        for result in results:
+            baseline = self.medians.get(result.name)
+            if baseline is None:
+                continue
+            delta = result.median - baseline
+            if delta > baseline * threshold and delta > min_delta:
+                regressions.append(
+                    f"{result.name}: median {result.median * 1000:.2f}ms vs "
+                    f"baseline {baseline * 1000:.2f}ms "
+                    f"(+{delta / baseline:.0%}, threshold {threshold:.0%})"
+                )
+        return regressions
@@ -0,0 +1,180 @@
+from tests.benchmarks import (
+    DataProvider,
+    DesiredCapabilitiesDto,
+    FakeAppiumServer,
+    List,
+    LocatorTimeouts,
+    Logger,
+    LoginScreen,
+    MobileDriverFactory,
+    Optional,
+    Path,
+    SwapLabs,
+    argparse,
+    asdict,
+    datetime,
+    io,
+    json,
+    subprocess,
+    sys,
+)
+from tests.benchmarks.benchmark_suite import BenchmarkBaseline, BenchmarkSuite
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DESIRED_CAPABILITIES_PATH = (
+    PROJECT_ROOT / "config" / "config_files" / "desired_capabilities.json"
+)
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+RESULTS_DIR = PROJECT_ROOT / "reports" / "benchmarks"
+LOG_RECORDS = 1000
+
+
+def bench_data_provider(suite: BenchmarkSuite):
+    """Time loading the desired capabilities into their DTO."""
+    suite.measure(
+        "data_provider_get_data",
+        lambda: DataProvider.get_data(
+            str(DESIRED_CAPABILITIES_PATH), DesiredCapabilitiesDto
+        ),
+    )
+
+
+def bench_logger(suite: BenchmarkSuite):
+    """Time logging `LOG_RECORDS` records through the queue listener."""
+    logger = Logger.get_logger("benchmarks.logger")
+    console = io.StringIO()
+
+    def emit():
+        # Records still go through the listener and the log file
+        Logger.flush()
+        previous = Logger.set_console_stream(console)
+        try:
+            for index in range(LOG_RECORDS):
+                logger.info("Benchmark record %s for %s", index, "throughput")
+            Logger.flush()
+        finally:
+            Logger.set_console_stream(previous)
+        console.seek(0)
+        console.truncate()
+
+    suite.measure(f"logger_{LOG_RECORDS}_records", emit)
+
+
+def bench_environment_import(suite: BenchmarkSuite):
+    """Time a cold import of the behave environment."""
+    # Fresh interpreter per round: module caches would hide the real cost
+    command = [sys.executable, "-c", "import tests.features.environment"]
+    suite.measure(
+        "environment_import",
+        lambda: subprocess.run(command, cwd=PROJECT_ROOT, check=True),
+        rounds=min(suite.rounds, 5),
+    )
+
+
+def bench_driver(suite: BenchmarkSuite):
+    """Driver, screen and flow costs against the zero-latency fake server."""
+    if not any(suite.selected(name) for name in ("driver_", "checkout_flow")):
+        return
+    server = FakeAppiumServer(port=0, latency=0.0, jitter=0.0)
+    server.start()
+    capabilities = DataProvider.get_data(
+        str(DESIRED_CAPABILITIES_PATH), DesiredCapabilitiesDto
+    )
+    # Benchmark loops would teach device timeouts fake-server latencies
+    driver = MobileDriverFactory.create_driver(
+        capabilities, server.url, LocatorTimeouts()
+    )
+    swap_labs = SwapLabs(driver)
+    try:
+        suite.measure(
+            "driver_find_element",
+            lambda: driver.find_element(LoginScreen.USERNAME_INPUT),
+            setup=driver.reset,
+        )
+        suite.measure(
+            "driver_click",
+            lambda: driver.click(LoginScreen.USERNAME_INPUT),
+            setup=driver.reset,
+        )
+        suite.measure(
+            "driver_type_text",
+            lambda: driver.type_text(LoginScreen.USERNAME_INPUT, "standard_user"),
+            setup=driver.reset,
+        )
+        suite.measure("driver_snapshot", driver.snapshot, setup=driver.reset)
+        suite.measure(
+            "checkout_flow",
+            lambda: _checkout_flow(swap_labs),
+            rounds=max(suite.rounds // 4, 3),
+            setup=driver.reset,
+        )
+    finally:
+        driver.quit()
+        server.stop()
+
+
+def _checkout_flow(swap_labs: SwapLabs):
+    swap_labs.login_screen.login("standard_user", "secret_sauce")
+    swap_labs.products_screen.add_product_to_cart("Sauce Labs Backpack")
+    swap_labs.products_screen.add_product_to_cart("Sauce Labs Bike Light")
+    swap_labs.products_screen.go_to_cart()
+    swap_labs.cart_screen.tap_checkout()
+    swap_labs.checkout_screen.fill_checkout_information("John", "Doe", "12345")
+    overview = swap_labs.checkout_overview_screen
+    if not overview.is_order_summary_visible():
+        raise AssertionError("Order summary not visible in checkout flow")
+    overview.tap_finish()
+    if not overview.is_confirmation_popup_visible():
+        raise AssertionError("Order confirmation not visible in checkout flow")
+
+
+BENCHMARKS = [
+    bench_data_provider,
+    bench_logger,
+    bench_environment_import,
+    bench_driver,
+]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks and compare them with the baseline."""
+    parser = argparse.ArgumentParser(description="Benchmark framework overhead")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument(
+        "--only", action="append", default=[], help="Run benchmarks matching NAME"
+    )
+    args = parser.parse_args(argv)
+    logger = Logger.get_logger(__name__)
+
+    suite = BenchmarkSuite(rounds=args.rounds, only=args.only)
+    for benchmark in BENCHMARKS:
+        benchmark(suite)
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    results_path = (
+        RESULTS_DIR / f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    with open(results_path, "w", encoding="utf-8") as file:
+        json.dump([asdict(result) for result in suite.results], file, indent=2)
+    logger.info("Benchmark results written to %s", results_path)
+
+    baseline = BenchmarkBaseline(args.baseline).load()
+    if args.update_baseline or not baseline.medians:
+        baseline.save(suite.results)
+        logger.info("Baseline updated: %s", args.baseline)
+        return 0
+
+    regressions = baseline.regressions(suite.results, args.threshold)
+    for regression in regressions:
+        logger.error("Regression: %s", regression)
+    if regressions:
+        return 1
+    logger.info("No regressions beyond %.0f%%", args.threshold * 100)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+from tests.benchmarks import (
+    Any,
+    DataProvider,
+    DesiredCapabilitiesDto,
+    Dict,
+    FakeAppiumServer,
+    List,
+    LocatorRewriter,
+    LocatorTimeouts,
+    Logger,
+    MobileDriverFactory,
+    Optional,
+    PageSnapshot,
+    Path,
+    Tuple,
+    UnsupportedLocatorError,
+    argparse,
+    json,
+    statistics,
+    sys,
+    time,
+)
+from tests.benchmarks.framework_benchmarks import (
+    DESIRED_CAPABILITIES_PATH,
+    PROJECT_ROOT,
+    RESULTS_DIR,
+)
+from tests.preflight.locator_validator import recorded_sources, screen_locators
+
+FAKE_APP_DIR = PROJECT_ROOT / "config" / "config_files" / "fake_app"
+APP_FOLDER = PROJECT_ROOT / "business" / "app"
+
+
+def analyze(
+    locators: List[Tuple[str, tuple]], sources: Dict[str, PageSnapshot]
+) -> List[Dict[str, Any]]:
+    """Cost, issues and rewrite per locator.
+
+    A rewrite counts as verified when it selects the same elements as the
+    original on every recorded source.
+    """
+    rows = []
+    for name, locator in locators:
+        rewrite = LocatorRewriter.rewrite(locator)
+        seen, mismatches = [], []
+        for source_name, snapshot in sources.items():
+            try:
+                original = snapshot.find_all(locator)
+                rewritten = snapshot.find_all(rewrite)
+            except UnsupportedLocatorError:
+                continue
+            if original:
+                seen.append(source_name)
+            if [id(e) for e in original] != [id(e) for e in rewritten]:
+                mismatches.append(source_name)
+        rows.append(
+            {
+                "name": name,
+                "locator": list(locator),
+                "cost": LocatorRewriter.cost(locator),
+                "issues": LocatorRewriter.issues(locator),
+                "rewrite": list(rewrite) if rewrite != locator else None,
+                "rewrite_cost": LocatorRewriter.cost(rewrite),
+                "without_scroll": LocatorRewriter.without_scroll(locator),
+                "seen_on": seen,
+                "mismatches": mismatches,
+            }
+        )
+    return rows
+
+
+def measure(driver, locator: tuple, rounds: int) -> Optional[float]:
+    """Median seconds for one raw find_elements round-trip."""
+    durations = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        driver.driver.find_elements(*locator)
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations)
+
+
+def measure_screen(driver, rows: List[Dict[str, Any]], rounds: int, screen: str):
+    """Time every locator of `rows` that is on the current screen."""
+    snapshot = driver.snapshot()
+    for row in rows:
+        locator = tuple(row["locator"])
+        try:
+            if not snapshot.find_all(
+                LocatorRewriter.without_scroll(locator) or locator
+            ):
+                continue
+        except UnsupportedLocatorError:
+            continue
+        timings = row.setdefault("timings", {})
+        timings[screen] = {"original": measure(driver, locator, rounds)}
+        for variant in ("rewrite", "without_scroll"):
+            if row[variant]:
+                timings[screen][variant] = measure(driver, tuple(row[variant]), rounds)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Analyze screen locator costs, optionally timing them on a device."""
+    parser = argparse.ArgumentParser(description="Analyze screen locator costs")
+    parser.add_argument(
+        "--cassette",
+        type=Path,
+        action="append",
+        default=[],
+        help="Also verify rewrites on page sources recorded in a cassette",
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--appium", help="Time lookups on the live app's screen")
+    target.add_argument(
+        "--offline", action="store_true", help="Time lookups on every fake screen"
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--strict", action="store_true", help="Fail on locators with issues"
+    )
+    args = parser.parse_args(argv)
+    logger = Logger.get_logger(__name__)
+
+    rows = analyze(screen_locators(), recorded_sources([FAKE_APP_DIR], args.cassette))
+
+    if args.appium or args.offline:
+        server = None
+        capabilities = DataProvider.get_data(
+            str(DESIRED_CAPABILITIES_PATH), DesiredCapabilitiesDto
+        )
+        capabilities.app = str((APP_FOLDER / capabilities.app).absolute())
+        if args.offline:
+            server = FakeAppiumServer(port=0, latency=0.0, jitter=0.0)
+            server.start()
+        driver = MobileDriverFactory.create_driver(
+            capabilities, server.url if server else args.appium, LocatorTimeouts()
+        )
+        try:
+            if server:
+                for screen in server.script.screens:
+                    server.app.show(screen)
+                    measure_screen(driver, rows, args.rounds, screen)
+            else:
+                measure_screen(driver, rows, args.rounds, "live")
+        finally:
+            driver.quit()
+            if server:
+                server.stop()
+
+    for row in sorted(rows, key=lambda row: row["cost"], reverse=True):
+        rewrite = row["rewrite"] or row["without_scroll"]
+        logger.info(
+            "%-48s cost=%-2s%s",
+            row["name"],
+            row["cost"],
+            f" -> {rewrite[0]}: {rewrite[1]}" if rewrite else "",
+        )
+        for issue in row["issues"]:
+            logger.info("%48s   %s", "", issue)
+        for screen, timing in row.get("timings", {}).items():
+            logger.info(
+                "%48s   %s: %s",
+                "",
+                screen,
+                " ".join(f"{k}={v * 1000:.1f}ms" for k, v in timing.items()),
+            )
+        if row["mismatches"]:
+            logger.error(
+                "%s rewrite selects different elements on %s",
+                row["name"],
+                ", ".join(row["mismatches"]),
+            )
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    report_path = RESULTS_DIR / "locator_costs.json"
+    with open(report_path, "w", encoding="utf-8") as file:
+        json.dump(rows, file, indent=2)
+    logger.info("Locator cost report written to %s", report_path)
+
+    if any(row["mismatches"] for row in rows):
+        return 1
+    if args.strict and any(
+        row["issues"] and not row["rewrite"] and not row["without_scroll"]
+        for row in rows
+    ):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,66 @@
+from datetime import datetime
 from pathlib import Path
 
+from business.reset.reset_strategy import ResetStrategyFactory, SessionRestoreStrategy
+from config.drivers.locator_timeouts import LocatorTimeouts
 from config.drivers.mobile_driver_factory import MobileDriverFactory
-from config.dto import DesiredCapabilitiesDto
+from config.dto import DesiredCapabilitiesDto, WorkerDto
+from config.infrastructure.app_install_cache import AppInstallCache
+from config.infrastructure.appium_proxy import (
+    RecordingProxy,
+    ReplayServer,
+    cassette_from_env,
+)
+from config.infrastructure.appium_server import AppiumServer
+from config.infrastructure.emulator import Emulator
+from config.infrastructure.fake_appium_server import FakeAppiumServer, script_from_env
+from config.infrastructure.golden_snapshot import golden_from_capabilities
+from config.infrastructure.infrastructure_launcher import InfrastructureLauncher
+from config.runner.checkpoint_manager import CheckpointManager, checkpoints_from_env
+from config.runner.execution_plan import ExecutionPlan
+from config.runner.scenario_collector import ScenarioCollector
+from config.runner.session_affinity import SessionAffinity
+from config.runner.warm_session import WarmSession
 from config.utils import subprocess
+from config.utils.command_metrics import (
+    AllureMetricsSink,
+    CommandMetrics,
+    InMemoryMetricsSink,
+    JsonlMetricsSink,
+)
 from config.utils.data_provider import DataProvider
 from config.utils.logger import Logger
 
 __all__ = [
+    "datetime",
     "Path",
     "DesiredCapabilitiesDto",
+    "WorkerDto",
+    "WarmSession",
+    "LocatorTimeouts",
     "MobileDriverFactory",
+    "ResetStrategyFactory",
+    "SessionRestoreStrategy",
+    "SessionAffinity",
+    "CheckpointManager",
+    "checkpoints_from_env",
+    "AppInstallCache",
+    "AppiumServer",
+    "Emulator",
+    "InfrastructureLauncher",
+    "RecordingProxy",
+    "ReplayServer",
+    "cassette_from_env",
+    "FakeAppiumServer",
+    "script_from_env",
+    "golden_from_capabilities",
+    "ExecutionPlan",
+    "ScenarioCollector",
     "subprocess",
+    "AllureMetricsSink",
+    "CommandMetrics",
+    "InMemoryMetricsSink",
+    "JsonlMetricsSink",
     "DataProvider",
     "Logger",
 ]
@@ -1,11 +1,35 @@
 import allure
 from tests.features import (
+    AllureMetricsSink,
+    AppInstallCache,
+    AppiumServer,
+    CheckpointManager,
+    CommandMetrics,
     DataProvider,
     DesiredCapabilitiesDto,
+    Emulator,
+    ExecutionPlan,
+    FakeAppiumServer,
+    InfrastructureLauncher,
+    InMemoryMetricsSink,
+    JsonlMetricsSink,
+    LocatorTimeouts,
     Logger,
     MobileDriverFactory,
     Path,
-    subprocess
+    RecordingProxy,
+    ReplayServer,
+    ResetStrategyFactory,
+    ScenarioCollector,
+    SessionAffinity,
+    SessionRestoreStrategy,
+    WarmSession,
+    WorkerDto,
+    cassette_from_env,
+    checkpoints_from_env,
+    datetime,
+    golden_from_capabilities,
+    script_from_env,
 )
 
 logger = Logger.get_logger(__name__)
@@ -16,46 +40,208 @@ desired_capabilities_path = (
     / "desired_capabilities.json"
 )
 app_folder = Path(__file__).parent.parent.parent / "business" / "app"
+metrics_folder = Path(__file__).parent.parent.parent / "reports" / "metrics"
+features_folder = Path(__file__).parent
+
+
+def _start_command_metrics(context):
+    worker = WorkerDto.from_env()
+    suffix = (
+        f"worker_{worker.worker_id}"
+        if worker
+        else datetime.now().strftime("%Y%m%d_%H%M%S")
+    )
+    context.command_metrics = CommandMetrics.add_sink(InMemoryMetricsSink())
+    context.metrics_sinks = [
+        context.command_metrics,
+        CommandMetrics.add_sink(
+            JsonlMetricsSink(metrics_folder / f"commands_{suffix}.jsonl")
+        ),
+        CommandMetrics.add_sink(AllureMetricsSink()),
+    ]
+
+
+def _report_command_metrics(context, top: int = 10):
+    if not getattr(context, "command_metrics", None):
+        return
+    logger.info("SLOWEST DRIVER COMMANDS (top %s by total time)", top)
+    for row in context.command_metrics.summary()[:top]:
+        logger.info(
+            "%-20s x%-4d total=%.2fs p50=%.2fs p95=%.2fs p99=%.2fs %s",
+            row["operation"],
+            row["count"],
+            row["total"],
+            row["p50"],
+            row["p95"],
+            row["p99"],
+            row["locator"] or "",
+        )
+    for sink in context.metrics_sinks:
+        CommandMetrics.remove_sink(sink)
+
+
+def _start_checkpoints(context):
+    """Plan shared step prefixes of the selected scenarios for checkpointing."""
+    if not checkpoints_from_env():
+        return
+    paths = context.config.paths or [str(features_folder)]
+    scenarios = ScenarioCollector.collect(paths, tag_expression=context.config.tags)
+    plan = ExecutionPlan(scenarios)
+    context.checkpoints = CheckpointManager(plan, Emulator())
+    logger.info(
+        "Execution plan: %s of %s steps can resume from checkpoints",
+        plan.steps_saved(scenarios),
+        sum(len(scenario.steps) for scenario in scenarios),
+    )
+
+
+def _recording_url(context, cassette, appium_server_url: str) -> str:
+    """Route driver traffic through a recording proxy when a cassette is requested."""
+    if "record" not in cassette:
+        return appium_server_url
+    context.cassette_server = RecordingProxy(cassette["record"], appium_server_url)
+    context.cassette_server.start()
+    return context.cassette_server.url
 
 
 def before_all(context):
     logger.info("=" * 80)
     logger.info("STARTING TEST SUITE")
+    _start_command_metrics(context)
+    # Mutable so scenario-level hooks can update it without layer shadowing
+    context.session_state = {"key": None}
+    # Suite daemon already owns Appium, the emulator and the session
+    if WarmSession.driver:
+        context.driver = WarmSession.driver
+        context.warm_session = True
+        logger.info("Reusing warm driver session from suite daemon")
+        _start_checkpoints(context)
+        return
+
     try:
         capabilities = DataProvider.get_data(
             desired_capabilities_path, DesiredCapabilitiesDto
         )
         capabilities.app = str((app_folder / capabilities.app).absolute())
 
-        # Start Appium
-        subprocess.run(["nox", "-s", "start_appium"], check=True)
-        logger.info("Appium server started")
+        # Replay runs: recorded Appium traffic, no server or device needed
+        cassette = cassette_from_env()
+        if "replay" in cassette:
+            context.cassette_server = ReplayServer(cassette["replay"])
+            context.cassette_server.start()
+            # Replayed latencies say nothing about a device: learn no timeouts
+            context.driver = MobileDriverFactory.create_driver(
+                capabilities, context.cassette_server.url, LocatorTimeouts()
+            )
+            return
+
+        # Offline runs: scripted app behind a local fake Appium server
+        fake_script = script_from_env()
+        if fake_script:
+            context.fake_appium = FakeAppiumServer(fake_script, port=0)
+            context.fake_appium.start()
+            logger.info("Running offline against %s", fake_script)
+            context.driver = MobileDriverFactory.create_driver(
+                capabilities,
+                _recording_url(context, cassette, context.fake_appium.url),
+                LocatorTimeouts(),
+            )
+            return
 
-        # Start Emulator
-        emulator_cmd = ["nox", "-s", "start_emulator"]
-        if hasattr(capabilities, "headless") and capabilities.headless:
-            emulator_cmd.extend(["--", "--headless"])
-        subprocess.run(emulator_cmd, check=True)
-        logger.info("Android emulator started")
+        # Parallel workers own their Appium server and emulator
+        context.worker = WorkerDto.from_env()
+        if context.worker:
+            capabilities.udid = context.worker.udid
+            capabilities.systemPort = context.worker.system_port
+            logger.info("Running as parallel worker %s", context.worker.worker_id)
+            context.driver = AppInstallCache(context.worker.udid).create_driver(
+                capabilities, context.worker.appium_server_url
+            )
+            return
 
-        context.driver = MobileDriverFactory.create_driver(capabilities)
+        # Start Appium and the emulator side by side, then the session
+        golden = golden_from_capabilities()
+        emulator = golden.emulator(headless=capabilities.headless)
+        context.infrastructure = InfrastructureLauncher(
+            AppiumServer(plugins=["execute-driver"]),
+            emulator,
+            golden=golden,
+        )
+        # Skips installing what the emulator already has (e.g. from the snapshot)
+        context.driver = context.infrastructure.launch(
+            lambda url: AppInstallCache(emulator.serial).create_driver(
+                capabilities, _recording_url(context, cassette, url)
+            )
+        )
+        # A cassette must hold every step's commands, so nothing is skipped
+        if "record" not in cassette:
+            _start_checkpoints(context)
     except Exception as e:
-        logger.error(f"Setup failed: {e}")
+        logger.error("Setup failed: %s", e)
         raise
 
 
+def _restore_checkpoint(context) -> bool:
+    checkpoints = getattr(context, "checkpoints", None)
+    if not checkpoints:
+        return False
+    context.restored_steps = checkpoints.restore(
+        context.scenario_steps, context.driver
+    )
+    return context.restored_steps > 0
+
+
+def _restore_session(context) -> bool:
+    if not context.state_key or context.state_key != context.session_state["key"]:
+        return False
+    try:
+        SessionRestoreStrategy().apply(context.driver)
+    except Exception as e:
+        logger.info("Session restore failed, resetting instead: %s", e)
+        return False
+    context.restored_steps = SessionAffinity.RESTORABLE_STEPS
+    logger.info("Restored session state: %s", context.state_key)
+    return True
+
+
 def before_scenario(context, scenario):
     logger.info("_" * 80)
-    logger.info(f"SCENARIO: {scenario.name}")
-    context.driver.reset()
+    logger.info("SCENARIO: %s", scenario.name)
+    context.scenario_steps = [
+        f"{step.step_type} {step.name}" for step in scenario.all_steps
+    ]
+    context.state_key = SessionAffinity.state_key(context.scenario_steps)
+    context.restored_steps = 0
+    context.step_index = 0
+    # An explicit @reset: tag always gets a real reset
+    if not ResetStrategyFactory.has_reset_tag(scenario.tags, scenario.feature.tags):
+        if _restore_checkpoint(context) or _restore_session(context):
+            return
+
+    strategy = ResetStrategyFactory.from_tags(scenario.tags, scenario.feature.tags)
+    logger.info("Reset strategy: %s", strategy.name)
+    strategy.apply(context.driver)
+
+
+def before_step(context, step):
+    # Steps covered by a restored checkpoint or session become no-ops
+    # (see skip_if_restored)
+    context.step_restored = context.step_index < context.restored_steps
+    context.step_index += 1
+
+
+def after_step(context, step):
+    checkpoints = getattr(context, "checkpoints", None)
+    if checkpoints and step.status == "passed" and not context.step_restored:
+        checkpoints.save(context.scenario_steps, context.step_index)
 
 
 def after_scenario(context, scenario):
     if scenario.status == "failed":
-        logger.error(f"✗ FAILED")
+        logger.error("✗ FAILED")
         failed_step = next((s for s in scenario.steps if s.status == "failed"), None)
         if failed_step and failed_step.exception:
-            logger.error(f"Error: {failed_step.exception}")
+            logger.error("Error: %s", failed_step.exception)
 
         if hasattr(context, "driver") and context.driver:
             try:
@@ -66,34 +252,59 @@ def after_scenario(context, scenario):
                     attachment_type=allure.attachment_type.PNG,
                 )
             except Exception as e:
-                logger.error(f"Failed to capture screenshot: {e}")
+                logger.error("Failed to capture screenshot: %s", e)
     else:
-        logger.info(f"✓ PASSED")
+        logger.info("✓ PASSED")
+
+    # Only a passing scenario that is still logged in leaves reusable state
+    context.session_state["key"] = (
+        context.state_key
+        if scenario.status == "passed"
+        and context.state_key
+        and SessionRestoreStrategy.is_logged_in(context.driver)
+        else None
+    )
     logger.info("─" * 80)
 
 
 def after_all(context):
 
+    _report_command_metrics(context)
+    if getattr(context, "checkpoints", None):
+        context.checkpoints.cleanup()
+    if getattr(context, "warm_session", False):
+        logger.info("TEST SUITE COMPLETED")
+        logger.info("=" * 80)
+        return
+
     # Quit driver
     if hasattr(context, "driver") and context.driver:
         try:
             context.driver.quit()
         except Exception as e:
-            logger.error(f"✗ Failed to quit driver: {e}")
+            logger.error("✗ Failed to quit driver: %s", e)
 
-    # Stop emulator
-    try:
-        subprocess.run(["nox", "-s", "stop_emulator"], check=False)
-        logger.info("Emulator stopped")
-    except Exception as e:
-        logger.error(f"✗ Failed to stop emulator: {e}")
+    if getattr(context, "cassette_server", None):
+        context.cassette_server.stop()
 
-    # Stop Appium
-    try:
-        subprocess.run(["nox", "-s", "stop_appium"], check=False)
-        logger.info("Appium stopped")
-    except Exception as e:
-        logger.error(f"✗ Failed to stop Appium: {e}")
+    if getattr(context, "fake_appium", None):
+        context.fake_appium.stop()
+
+    if (
+        getattr(context, "worker", None)
+        or getattr(context, "fake_appium", None)
+        or isinstance(getattr(context, "cassette_server", None), ReplayServer)
+    ):
+        logger.info("TEST SUITE COMPLETED")
+        logger.info("=" * 80)
+        return
+
+    # Stop emulator and Appium
+    if getattr(context, "infrastructure", None):
+        try:
+            context.infrastructure.stop()
+        except Exception as e:
+            logger.error("✗ Failed to stop infrastructure: %s", e)
 
     logger.info("TEST SUITE COMPLETED")
     logger.info("=" * 80)
@@ -3,7 +3,7 @@ Feature: Smoke Test - Application Launch Verification
   I want to verify the application launches correctly
   So that I can ensure the test environment is ready for testing
 
-  @smoke
+  @smoke @reset:restart
   Scenario: Verify login screen is displayed on app launch
     Given the Swag Labs app is installed and launched
     Then I am on the login screen
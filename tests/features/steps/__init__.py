@@ -1,5 +1,51 @@
+from functools import wraps
+
 from assertpy import assert_that
-from behave import given, then, when
+import behave
 import allure
 
-__all__ = ["assert_that", "given", "then", "when", "allure"]
+
+def skip_if_restored(step_function):
+    """Skip a step whose effect is already part of a restored checkpoint or session."""
+
+    @wraps(step_function)
+    def wrapper(context, *args, **kwargs):
+        if getattr(context, "step_restored", False) and not getattr(
+            step_function, "runs_when_restored", False
+        ):
+            return None
+        return step_function(context, *args, **kwargs)
+
+    return wrapper
+
+
+def runs_when_restored(step_function):
+    """Keep a step running inside a restored prefix (e.g. it only sets up context)."""
+    step_function.runs_when_restored = True
+    return step_function
+
+
+def _restorable(step_decorator):
+    def register(pattern):
+        def decorator(step_function):
+            step_decorator(pattern)(skip_if_restored(step_function))
+            return step_function
+
+        return decorator
+
+    return register
+
+
+given = _restorable(behave.given)
+when = _restorable(behave.when)
+then = _restorable(behave.then)
+
+__all__ = [
+    "assert_that",
+    "given",
+    "then",
+    "when",
+    "allure",
+    "runs_when_restored",
+    "skip_if_restored",
+]
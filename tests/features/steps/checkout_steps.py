@@ -1,3 +1,4 @@
+from business.screens import Screen
 from business.screens.swap_labs import SwapLabs
 from tests.features.steps import assert_that, given, then, when, allure
 
@@ -16,8 +17,7 @@ def step_verify_cart_badge_count(context, count):
 @when('I go to the "{screen_name}" screen')
 @allure.step("Navigate to '{screen_name}' screen")
 def step_navigate_to_screen(context, screen_name):
-    _swap_labs(context).products_screen.go_to_cart()
-    _swap_labs(context).cart_screen.tap_checkout()
+    _swap_labs(context).navigate_to(Screen(screen_name))
 
 
 @when(
@@ -35,11 +35,8 @@ def step_fill_checkout_information(context, first_name, last_name, zip_code):
 @then('I should navigate to the "{screen_name}" screen')
 @allure.step("Verify navigation to '{screen_name}' screen")
 def step_verify_navigation_to_screen(context, screen_name):
-    if screen_name == "Checkout: Overview":
-        is_visible = _swap_labs(
-            context
-        ).checkout_overview_screen.is_checkout_overview_screen_visible()
-        assert_that(is_visible).is_true()
+    is_visible = _swap_labs(context).is_on_screen(Screen(screen_name))
+    assert_that(is_visible).is_true()
 
 
 @then("I should see the products in the order list")
@@ -1,5 +1,12 @@
 from business.screens.swap_labs import SwapLabs
-from tests.features.steps import assert_that, given, then, when, allure
+from tests.features.steps import (
+    assert_that,
+    given,
+    then,
+    when,
+    allure,
+    runs_when_restored,
+)
 
 
 def _swap_labs(context) -> SwapLabs:
@@ -8,6 +15,7 @@ def _swap_labs(context) -> SwapLabs:
 
 @given("the Swag Labs app is installed and launched")
 @allure.step("Launch Swag Labs app")
+@runs_when_restored
 def step_launch_swag_labs_app(context):
     context.swap_labs_app = SwapLabs(context.driver)
 
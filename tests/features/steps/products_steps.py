@@ -1,3 +1,4 @@
+from business.screens import Screen
 from business.screens.swap_labs import SwapLabs
 from tests.features.steps import assert_that, given, then, when, allure
 
@@ -8,9 +9,8 @@ def _swap_labs(context) -> SwapLabs:
 
 @then('I should be navigated to the "{screen_name}" screen')
 def step_verify_navigation_to_screen(context, screen_name):
-    if screen_name == "Products":
-        is_visible = _swap_labs(context).products_screen.is_products_screen_visible()
-        assert_that(is_visible).is_true()
+    is_visible = _swap_labs(context).is_on_screen(Screen(screen_name))
+    assert_that(is_visible).is_true()
 
 
 @then("I should see the products catalog")
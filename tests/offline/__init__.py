@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+from appium.webdriver.webelement import WebElement
+from selenium.common.exceptions import TimeoutException
+
+from business.screens.login_screen import LoginScreen
+from business.screens.products_screen import ProductsScreen
+from business.screens.swap_labs import SCREEN_GRAPH
+from config.drivers.locator_rewriter import LocatorRewriter
+from config.drivers.locator_timeouts import LocatorTimeouts
+from config.drivers.mobile_driver_factory import MobileDriverFactory
+from config.drivers.page_snapshot import PageSnapshot, UnsupportedLocatorError
+from config.dto import (
+    BatchAction,
+    BatchActionDto,
+    DesiredCapabilitiesDto,
+    ScenarioDto,
+    Screen,
+)
+from config.infrastructure.fake_appium_server import FakeAppiumServer
+from config.runner.duration_store import DurationStore
+from config.runner.parallel_runner import ParallelRunner
+from config.runner.shard_scheduler import ShardScheduler
+from config.utils.data_provider import DataProvider
+from tests.preflight.locator_validator import recorded_sources, screen_locators
+
+__all__ = [
+    "Path",
+    "pytest",
+    "AppiumBy",
+    "WebElement",
+    "TimeoutException",
+    "LoginScreen",
+    "ProductsScreen",
+    "SCREEN_GRAPH",
+    "LocatorRewriter",
+    "LocatorTimeouts",
+    "MobileDriverFactory",
+    "PageSnapshot",
+    "UnsupportedLocatorError",
+    "BatchAction",
+    "BatchActionDto",
+    "DesiredCapabilitiesDto",
+    "ScenarioDto",
+    "Screen",
+    "FakeAppiumServer",
+    "DurationStore",
+    "ParallelRunner",
+    "ShardScheduler",
+    "DataProvider",
+    "recorded_sources",
+    "screen_locators",
+]
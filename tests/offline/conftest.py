@@ -0,0 +1,32 @@
+from tests.offline import (
+    DataProvider,
+    DesiredCapabilitiesDto,
+    FakeAppiumServer,
+    LocatorTimeouts,
+    MobileDriverFactory,
+    Path,
+    pytest,
+)
+
+DESIRED_CAPABILITIES_PATH = (
+    Path(__file__).parent.parent.parent
+    / "config"
+    / "config_files"
+    / "desired_capabilities.json"
+)
+
+
+@pytest.fixture
+def driver():
+    """Android driver with a session on a fresh fake Appium server."""
+    server = FakeAppiumServer(port=0, latency=0.0, jitter=0.0)
+    server.start()
+    capabilities = DataProvider.get_data(
+        str(DESIRED_CAPABILITIES_PATH), DesiredCapabilitiesDto
+    )
+    driver = MobileDriverFactory.create_driver(
+        capabilities, server.url, LocatorTimeouts()
+    )
+    yield driver
+    driver.quit()
+    server.stop()
@@ -0,0 +1,19 @@
+from tests.offline import LoginScreen, ProductsScreen, WebElement
+
+
+def test_find_returns_web_elements(driver):
+    """Element references use the W3C key, so Selenium wraps them."""
+    element = driver.driver.find_element(*LoginScreen.USERNAME_INPUT)
+    assert isinstance(element, WebElement)
+    assert all(
+        isinstance(element, WebElement)
+        for element in driver.driver.find_elements(*LoginScreen.LOGIN_BUTTON)
+    )
+
+
+def test_click_follows_script_transition(driver):
+    """Typing and clicking drive the scripted app to the next screen."""
+    driver.type_text(LoginScreen.USERNAME_INPUT, "standard_user")
+    driver.type_text(LoginScreen.PASSWORD_INPUT, "secret_sauce")
+    driver.click(LoginScreen.LOGIN_BUTTON)
+    assert driver.is_element_visible(ProductsScreen.PRODUCTS_CONTAINER)
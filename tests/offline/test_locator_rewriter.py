@@ -0,0 +1,55 @@
+from tests.offline import (
+    LocatorRewriter,
+    PageSnapshot,
+    Path,
+    pytest,
+    recorded_sources,
+    screen_locators,
+)
+
+FAKE_APP_DIR = (
+    Path(__file__).parent.parent.parent / "config" / "config_files" / "fake_app"
+)
+SOURCES = recorded_sources([FAKE_APP_DIR])
+REWRITTEN = [
+    (name, locator)
+    for name, locator in screen_locators()
+    if LocatorRewriter.rewrite(locator) != locator
+]
+SCROLLING = [
+    (name, locator)
+    for name, locator in screen_locators()
+    if PageSnapshot.requires_scroll(locator)
+]
+
+
+def assert_same_matches(original, replacement):
+    """Both locators select the same elements on every fake app screen."""
+    matched = False
+    for name, snapshot in SOURCES.items():
+        expected = snapshot.find_all(original)
+        assert snapshot.find_all(replacement) == expected, name
+        matched = matched or bool(expected)
+    # Guard against comparing two empty results everywhere
+    assert matched
+
+
+@pytest.mark.parametrize(
+    "locator", [locator for _, locator in REWRITTEN], ids=[n for n, _ in REWRITTEN]
+)
+def test_rewrite_matches_the_original_elements(locator):
+    """A rewrite is only a cheaper lookup, never a different selection."""
+    assert_same_matches(locator, LocatorRewriter.rewrite(locator))
+
+
+@pytest.mark.parametrize(
+    "locator", [locator for _, locator in SCROLLING], ids=[n for n, _ in SCROLLING]
+)
+def test_without_scroll_matches_the_scroll_target(locator):
+    """The plain lookup finds what `scrollIntoView` would scroll to."""
+    assert_same_matches(locator, LocatorRewriter.without_scroll(locator))
+
+
+def test_screens_have_locators_to_rewrite():
+    """The fake app exercises both kinds of rewrite."""
+    assert REWRITTEN and SCROLLING
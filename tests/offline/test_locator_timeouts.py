@@ -0,0 +1,43 @@
+from tests.offline import LocatorTimeouts, LoginScreen
+
+LOCATOR = LoginScreen.USERNAME_INPUT
+
+
+def test_timeouts_without_path_learn_nothing():
+    """Fake and replayed servers keep the default timeout for every wait."""
+    timeouts = LocatorTimeouts()
+    for _ in range(LocatorTimeouts.MIN_SAMPLES):
+        timeouts.record(LOCATOR, 0.1)
+    timeouts.save()
+    assert timeouts.timeout(LOCATOR, 10) == 10
+
+
+def test_learned_timeout_is_clamped_and_persisted(tmp_path):
+    """Five fast samples give the minimum timeout, reloaded from the file."""
+    path = tmp_path / "emulator.json"
+    timeouts = LocatorTimeouts(path)
+    for _ in range(LocatorTimeouts.MIN_SAMPLES):
+        timeouts.record(LOCATOR, 0.1)
+    timeouts.save()
+    reloaded = LocatorTimeouts(path).load()
+    assert reloaded.timeout(LOCATOR, 10) == LocatorTimeouts.MIN_TIMEOUT
+
+
+def test_slow_samples_get_headroom(tmp_path):
+    """The timeout is p99 x MARGIN + PADDING, capped at MAX_TIMEOUT."""
+    timeouts = LocatorTimeouts(tmp_path / "emulator.json")
+    for _ in range(LocatorTimeouts.MIN_SAMPLES):
+        timeouts.record(LOCATOR, 8.0)
+    assert timeouts.timeout(LOCATOR, 10) == 8.0 * LocatorTimeouts.MARGIN + 1.0
+    timeouts.record(LOCATOR, 40.0)
+    assert timeouts.timeout(LOCATOR, 10) == LocatorTimeouts.MAX_TIMEOUT
+
+
+def test_devices_learn_into_separate_files():
+    """Each AVD or device gets its own file under the project's reports/."""
+    avd = LocatorTimeouts.for_device("Pixel_7_API_34")
+    device = LocatorTimeouts.for_device("192.168.1.5:5555")
+    assert avd.path is not None and device.path is not None
+    assert avd.path != device.path
+    assert avd.path.parent.parent.name == "reports"
+    assert avd.path.is_absolute()
@@ -0,0 +1,115 @@
+from tests.offline import AppiumBy, PageSnapshot, UnsupportedLocatorError, pytest
+
+PAGE_SOURCE = """<hierarchy>
+  <android.widget.ScrollView content-desc="test-PRODUCTS" scrollable="true">
+    <android.view.ViewGroup content-desc="test-Item" index="0">
+      <android.widget.TextView content-desc="test-Item title" text="Backpack"/>
+      <android.widget.TextView content-desc="test-Price" text="$29.99"/>
+    </android.view.ViewGroup>
+    <android.view.ViewGroup content-desc="test-Item" index="1">
+      <android.widget.TextView content-desc="test-Item title" text="Bike Light"/>
+      <android.widget.TextView content-desc="test-Price" text="$9.99"
+        displayed="false"/>
+    </android.view.ViewGroup>
+  </android.widget.ScrollView>
+  <android.widget.EditText resource-id="username" text="standard_user"/>
+</hierarchy>"""
+
+
+@pytest.fixture
+def snapshot():
+    """Snapshot of a two-item product list and a text field."""
+    return PageSnapshot(PAGE_SOURCE)
+
+
+def texts(elements):
+    """Text of each matched element, in document order."""
+    return [element.get("text") for element in elements]
+
+
+@pytest.mark.parametrize(
+    "selector, expected",
+    [
+        ('new UiSelector().text("$9.99")', ["$9.99"]),
+        ('new UiSelector().textContains("Bike")', ["Bike Light"]),
+        ('new UiSelector().textStartsWith("$2")', ["$29.99"]),
+        (r'new UiSelector().textMatches("\\$\\d+\\.99")', ["$29.99", "$9.99"]),
+        ('new UiSelector().description("test-Price").instance(1)', ["$9.99"]),
+        ('new UiSelector().resourceId("username")', ["standard_user"]),
+        ('new UiSelector().className("android.widget.EditText")', ["standard_user"]),
+    ],
+)
+def test_ui_selector_attribute_matchers(snapshot, selector, expected):
+    """Each supported matcher selects the same elements as on a device."""
+    assert (
+        texts(snapshot.find_all((AppiumBy.ANDROID_UIAUTOMATOR, selector))) == expected
+    )
+
+
+def test_state_matcher_defaults_to_false(snapshot):
+    """Only the ScrollView declares `scrollable`; the rest count as false."""
+    scrollable = snapshot.find_all(
+        (AppiumBy.ANDROID_UIAUTOMATOR, "new UiSelector().scrollable(true)")
+    )
+    assert [element.tag for element in scrollable] == ["android.widget.ScrollView"]
+
+
+def test_child_selector_searches_below_each_parent(snapshot):
+    """`childSelector` matches descendants of the parent matches, never the parents."""
+    prices = snapshot.find_all(
+        (
+            AppiumBy.ANDROID_UIAUTOMATOR,
+            'new UiSelector().description("test-Item")'
+            '.childSelector(new UiSelector().description("test-Price"))',
+        )
+    )
+    assert texts(prices) == ["$29.99", "$9.99"]
+
+
+def test_scroll_into_view_resolves_its_target(snapshot):
+    """A UiScrollable is matched against its `scrollIntoView` target."""
+    locator = (
+        AppiumBy.ANDROID_UIAUTOMATOR,
+        "new UiScrollable(new UiSelector().scrollable(true))"
+        '.scrollIntoView(new UiSelector().text("Bike Light"))',
+    )
+    assert PageSnapshot.requires_scroll(locator)
+    assert texts(snapshot.find_all(locator)) == ["Bike Light"]
+
+
+def test_xpath_is_evaluated_locally(snapshot):
+    """Descendant XPath with attribute predicates runs on the parsed tree."""
+    locator = (
+        AppiumBy.XPATH,
+        '//android.view.ViewGroup[@index="1"]//*[@content-desc="test-Item title"]',
+    )
+    assert texts(snapshot.find_all(locator)) == ["Bike Light"]
+
+
+def test_missing_displayed_attribute_counts_as_visible(snapshot):
+    """Only an explicit `displayed="false"` hides an element."""
+    assert snapshot.is_visible((AppiumBy.ID, "username"))
+    hidden_price = (
+        AppiumBy.ANDROID_UIAUTOMATOR,
+        'new UiSelector().description("test-Price").instance(1)',
+    )
+    assert not snapshot.is_visible(hidden_price)
+    assert not snapshot.is_visible((AppiumBy.ACCESSIBILITY_ID, "test-Cart"))
+
+
+@pytest.mark.parametrize(
+    "locator",
+    [
+        (AppiumBy.ANDROID_VIEWTAG, "price"),
+        (AppiumBy.XPATH, "/hierarchy/android.widget.EditText"),
+        (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().packageName("app")'),
+        (
+            AppiumBy.ANDROID_UIAUTOMATOR,
+            "new UiScrollable(new UiSelector().scrollable(true)).flingForward()",
+        ),
+    ],
+)
+def test_unsupported_locator_raises(snapshot, locator):
+    """Anything outside the local subset is rejected instead of guessed."""
+    with pytest.raises(UnsupportedLocatorError):
+        snapshot.find_all(locator)
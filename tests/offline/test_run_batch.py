@@ -0,0 +1,37 @@
+from tests.offline import (
+    BatchAction,
+    BatchActionDto,
+    LoginScreen,
+    ProductsScreen,
+    TimeoutException,
+    pytest,
+)
+
+LOGIN = [
+    BatchActionDto(BatchAction.TYPE, LoginScreen.USERNAME_INPUT, "standard_user"),
+    BatchActionDto(BatchAction.TYPE, LoginScreen.PASSWORD_INPUT, "secret_sauce"),
+    BatchActionDto(BatchAction.TAP, LoginScreen.LOGIN_BUTTON),
+]
+
+
+def test_batch_falls_back_to_commands_without_driver_scripts(driver):
+    """The fake server has no execute-driver plugin: commands run instead."""
+    results = driver.run_batch(LOGIN)
+    assert [result.success for result in results] == [True, True, True]
+    assert driver.is_element_visible(ProductsScreen.PRODUCTS_CONTAINER)
+    assert driver._driver_scripts is False
+
+
+def test_script_error_is_raised_without_replaying_actions(driver, monkeypatch):
+    """A script that may have acted already is never re-run as commands."""
+    sequential = []
+
+    def script_timeout(**kwargs):
+        raise TimeoutException("script timeout")
+
+    monkeypatch.setattr(driver.driver, "execute_driver", script_timeout)
+    monkeypatch.setattr(driver, "_run_sequentially", sequential.append)
+    with pytest.raises(TimeoutException):
+        driver.run_batch(LOGIN)
+    assert sequential == []
+    assert driver._driver_scripts is True
@@ -0,0 +1,20 @@
+from tests.offline import SCREEN_GRAPH, Screen
+
+
+def test_path_is_shortest_chain_of_transitions():
+    """Each transition starts where the previous one ended."""
+    path = SCREEN_GRAPH.path(Screen.CHECKOUT_INFORMATION, Screen.LOGIN)
+    assert [(t.source, t.target) for t in path] == [
+        (Screen.CHECKOUT_INFORMATION, Screen.MENU),
+        (Screen.MENU, Screen.LOGIN),
+    ]
+
+
+def test_path_to_the_current_screen_is_empty():
+    """No taps are needed to stay on a screen."""
+    assert SCREEN_GRAPH.path(Screen.CART, Screen.CART) == []
+
+
+def test_unreachable_screen_has_no_path():
+    """Logging in is not a graph transition, so nothing leaves the login screen."""
+    assert SCREEN_GRAPH.path(Screen.LOGIN, Screen.PRODUCTS) is None
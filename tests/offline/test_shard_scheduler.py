@@ -0,0 +1,88 @@
+from tests.offline import (
+    DurationStore,
+    ParallelRunner,
+    ScenarioDto,
+    ShardScheduler,
+    pytest,
+)
+
+LOGIN_STEPS = [
+    "given the Swag Labs app is installed and launched",
+    "given I am on the login screen",
+    'when I login with username "standard_user" and password "secret_sauce"',
+]
+
+
+def scenario(name, steps=1, logged_in=False):
+    """Scenario with `steps` steps, optionally after a login."""
+    prefix = LOGIN_STEPS if logged_in else []
+    return ScenarioDto(
+        location=f"features/{name.replace(' ', '_')}.feature:3",
+        name=name,
+        steps=prefix + [f"then step {index}" for index in range(steps)],
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Durations of two scenarios: 20s over 4 steps and 10s over 6 steps."""
+    store = DurationStore(tmp_path / "scenario_durations.json")
+    store.record(scenario("slow").key, 20.0, steps=4)
+    store.record(scenario("fast").key, 10.0, steps=6)
+    return store
+
+
+def test_new_scenario_estimate_uses_observed_seconds_per_step(store):
+    """30s over 10 recorded steps gives 3s per step for unseen scenarios."""
+    scheduler = ShardScheduler(store)
+    assert scheduler.estimate(scenario("slow")) == 20.0
+    assert scheduler.estimate(scenario("new", steps=5)) == pytest.approx(15.0)
+
+
+def test_empty_store_uses_default_seconds_per_step(tmp_path):
+    """Before any recorded run every step costs `DEFAULT_SECONDS_PER_STEP`."""
+    scheduler = ShardScheduler(DurationStore(tmp_path / "scenario_durations.json"))
+    expected = 4 * ShardScheduler.DEFAULT_SECONDS_PER_STEP
+    assert scheduler.estimate(scenario("new", steps=4)) == expected
+
+
+def test_order_is_longest_first(store):
+    """Recorded and estimated scenarios are sorted together by duration."""
+    scheduler = ShardScheduler(store)
+    scenarios = [scenario("fast"), scenario("new", steps=5), scenario("slow")]
+    assert [s.name for s in scheduler.order(scenarios)] == ["slow", "new", "fast"]
+
+
+def test_plan_gives_the_next_longest_to_the_least_loaded_worker(store):
+    """LPT packing: 20 | 15 + 10 beats the arrival order 20 + 10 | 15."""
+    scheduler = ShardScheduler(store)
+    scenarios = [scenario("slow"), scenario("fast"), scenario("new", steps=5)]
+    shards = scheduler.plan(scenarios, workers=2)
+    assert [[s.name for s in shard] for shard in shards] == [
+        ["slow"],
+        ["new", "fast"],
+    ]
+    assert scheduler.makespan(shards) == 25.0
+
+
+def test_batches_are_queued_longest_first(store):
+    """Logged-in scenarios share a batch, split per worker, longest batch first.
+
+    Each login scenario is estimated at 5 steps x 3s, so the first half of
+    the login group (30s) goes ahead of the slowest single scenario (20s).
+    """
+    runner = ParallelRunner(workers=2, avd_name="test_avd", duration_store=store)
+    scenarios = [
+        scenario("slow"),
+        scenario("login a", steps=2, logged_in=True),
+        scenario("login b", steps=2, logged_in=True),
+        scenario("login c", steps=2, logged_in=True),
+        scenario("fast"),
+    ]
+    batches = runner._batches(runner.scheduler.order(scenarios))
+    assert [[s.name for s in batch] for batch in batches] == [
+        ["login a", "login b"],
+        ["slow"],
+        ["login c"],
+        ["fast"],
+    ]
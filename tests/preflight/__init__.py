@@ -0,0 +1,35 @@
+import argparse
+import fnmatch
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from business.screens.swap_labs import SCREEN_TYPES
+from config.drivers.locator_rewriter import LocatorRewriter
+from config.drivers.page_snapshot import PageSnapshot, UnsupportedLocatorError
+from config.dto import LocatorValidationDto
+from config.infrastructure.cassette import Cassette
+from config.utils.data_provider import DataProvider
+from config.utils.logger import Logger
+
+__all__ = [
+    "argparse",
+    "fnmatch",
+    "sys",
+    "time",
+    "Path",
+    "Any",
+    "Dict",
+    "List",
+    "Optional",
+    "Tuple",
+    "SCREEN_TYPES",
+    "LocatorRewriter",
+    "PageSnapshot",
+    "UnsupportedLocatorError",
+    "LocatorValidationDto",
+    "Cassette",
+    "DataProvider",
+    "Logger",
+]
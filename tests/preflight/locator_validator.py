@@ -0,0 +1,147 @@
+from tests.preflight import (
+    SCREEN_TYPES,
+    Any,
+    Cassette,
+    DataProvider,
+    Dict,
+    List,
+    LocatorRewriter,
+    LocatorValidationDto,
+    Logger,
+    Optional,
+    PageSnapshot,
+    Path,
+    Tuple,
+    UnsupportedLocatorError,
+    argparse,
+    fnmatch,
+    sys,
+    time,
+)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+CONFIG_PATH = PROJECT_ROOT / "config" / "config_files" / "locator_validation.json"
+
+
+def screen_locators() -> List[Tuple[str, tuple]]:
+    """Every `(strategy, value)` class attribute of the app's screen classes."""
+    strategies = set(LocatorRewriter.COSTS)
+    locators = []
+    for screen in SCREEN_TYPES:
+        for name, value in vars(screen).items():
+            if isinstance(value, tuple) and len(value) == 2 and value[0] in strategies:
+                locators.append((f"{screen.__name__}.{name}", value))
+    return locators
+
+
+def recorded_sources(
+    directories: List[Path], cassettes: Optional[List[Path]] = None
+) -> Dict[str, PageSnapshot]:
+    """Page sources by name.
+
+    XML files in `directories` are named `<file stem>`, and every page source
+    recorded in `cassettes` is named `<cassette>#<index>`.
+    """
+    sources = {}
+    for directory in directories:
+        for path in sorted(Path(directory).glob("*.xml")):
+            sources[path.stem] = PageSnapshot(path.read_text(encoding="utf-8"))
+    for cassette_path in cassettes or []:
+        cassette = Cassette.load(cassette_path)
+        for index, interaction in enumerate(cassette.interactions):
+            if interaction.path.endswith("/source") and interaction.status == 200:
+                sources[f"{cassette_path.name}#{index}"] = PageSnapshot(
+                    interaction.response["value"]
+                )
+    return sources
+
+
+class LocatorValidator:
+    """Checks screen locators against recorded page sources, without a device.
+
+    A locator passes when it matches an element in at least one source mapped
+    to its screen (by file name pattern in `locator_validation.json`).
+    Locators listed as `unrecorded` have no source to check against and are
+    skipped; strategies the snapshot cannot evaluate are reported as unchecked.
+    """
+
+    def __init__(self, config: LocatorValidationDto, sources: Dict[str, PageSnapshot]):
+        self.config = config
+        self.sources = sources
+
+    def screen_sources(self, screen: str) -> Dict[str, PageSnapshot]:
+        patterns = self.config.screens.get(screen, [])
+        # Cassette sources ("<cassette>#<index>") are not tied to one screen
+        return {
+            name: snapshot
+            for name, snapshot in self.sources.items()
+            if "#" in name or any(fnmatch.fnmatchcase(name, p) for p in patterns)
+        }
+
+    def validate(self, locators: List[Tuple[str, tuple]]) -> List[Dict[str, Any]]:
+        results = []
+        for name, locator in locators:
+            screen = name.split(".", 1)[0]
+            result = {"name": name, "locator": locator, "matched": []}
+            results.append(result)
+            if name in self.config.unrecorded:
+                result["status"] = "skipped"
+                continue
+            sources = self.screen_sources(screen)
+            if not sources:
+                result["status"] = "no sources"
+                continue
+            try:
+                result["matched"] = [
+                    source_name
+                    for source_name, snapshot in sources.items()
+                    if snapshot.find_all(locator)
+                ]
+            except UnsupportedLocatorError as e:
+                result["status"] = f"unchecked ({e})"
+                continue
+            result["status"] = "ok" if result["matched"] else "broken"
+        return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Validate screen locators, returning 1 when any of them is broken."""
+    parser = argparse.ArgumentParser(
+        description="Validate screen locators against recorded page sources"
+    )
+    parser.add_argument("--config", type=Path, default=CONFIG_PATH)
+    parser.add_argument(
+        "--cassette",
+        type=Path,
+        action="append",
+        default=[],
+        help="Also accept matches in page sources recorded in a cassette",
+    )
+    args = parser.parse_args(argv)
+    logger = Logger.get_logger(__name__)
+    started = time.perf_counter()
+
+    config = DataProvider.get_data(str(args.config), LocatorValidationDto)
+    sources = recorded_sources(
+        [PROJECT_ROOT / directory for directory in config.library], args.cassette
+    )
+    results = LocatorValidator(config, sources).validate(screen_locators())
+
+    broken = [result for result in results if result["status"] == "broken"]
+    for result in results:
+        if result["status"] == "ok":
+            continue
+        log = logger.error if result in broken else logger.warning
+        log("%-48s %s %s", result["name"], result["status"], result["locator"])
+    logger.info(
+        "Validated %s locators against %s page sources in %.2fs: %s broken",
+        len(results),
+        len(sources),
+        time.perf_counter() - started,
+        len(broken),
+    )
+    return 1 if broken else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())